@@ -0,0 +1,246 @@
+'''
+Analytics of the runs of gold_league_genetic.py over many log files
+
+Each run file (telemetry in the ndjson or binary format, or the former JSON log) is read once and converted to numpy arrays:
+the best score of each generation is stored in a matrix turns x generations padded with NaN. The arrays of each run are
+cached in a .npz file so that plotting again does not parse the logs. The statistics (improvement, convergence, min/max)
+are computed with vectorized operations and aggregated over the runs analyzed by a process pool.
+
+Usage: python analytics.py runs/*.ndjson [--processes 4] [--cache .analytics] [--output summary.npz]
+'''
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import multiprocessing
+
+import numpy
+
+from csb_engine import TELEMETRY_MAGIC, TELEMETRY_HEADER_DTYPE, TELEMETRY_TURN_DTYPE, TELEMETRY_GENERATION_DTYPE
+
+CACHE_DIRECTORY = '.analytics'
+CACHE_VERSION = 1  # to increment when the arrays of a run change
+PERCENTILES = [10, 50, 90]
+JSON_LOG_START = b'{"game":'  # start of the former JSON log of the bot
+
+
+def read_telemetry(path):
+    '''
+    Read the telemetry written by gold_league_genetic.py on stderr, in the ndjson or the binary format
+    @return: the configuration and a generator of the turns as (dictionary of the turn record, array of the generation records)
+    '''
+    with open(path, 'rb') as telemetry_file:
+        is_binary = telemetry_file.read(len(TELEMETRY_MAGIC)) == TELEMETRY_MAGIC
+
+    if is_binary:
+        telemetry_file = open(path, 'rb')
+        header = numpy.frombuffer(telemetry_file.read(TELEMETRY_HEADER_DTYPE.itemsize), dtype=TELEMETRY_HEADER_DTYPE)[0]
+        configuration = {name: header[name].item() for name in TELEMETRY_HEADER_DTYPE.names if name != 'magic'}
+        return configuration, read_binary_turns(telemetry_file)
+    else:
+        telemetry_file = open(path)
+        configuration = json.loads(telemetry_file.readline())['configuration']
+        return configuration, read_ndjson_turns(telemetry_file)
+
+
+def read_binary_turns(telemetry_file):
+    with telemetry_file:
+        while True:
+            buffer = telemetry_file.read(TELEMETRY_TURN_DTYPE.itemsize)
+            if len(buffer) < TELEMETRY_TURN_DTYPE.itemsize:
+                return
+
+            record = numpy.frombuffer(buffer, dtype=TELEMETRY_TURN_DTYPE)[0]
+            turn = {name: record[name].item() for name in TELEMETRY_TURN_DTYPE.names}
+            generations = numpy.frombuffer(telemetry_file.read(turn['nb_records'] * TELEMETRY_GENERATION_DTYPE.itemsize), dtype=TELEMETRY_GENERATION_DTYPE)
+            yield turn, generations
+
+
+def read_ndjson_turns(telemetry_file):
+    with telemetry_file:
+        for line in telemetry_file:
+            turn = json.loads(line)
+            records = turn.pop('records')
+            generations = numpy.zeros(turn['nb_records'], dtype=TELEMETRY_GENERATION_DTYPE)
+            for name in TELEMETRY_GENERATION_DTYPE.names:
+                generations[name] = records[name]
+            yield turn, generations
+
+
+def read_json_turns(path):
+    '''
+    Read the former JSON log of the bot (the whole file is loaded)
+    @return: the configuration and a generator of the turns as (dictionary of the turn, array of the generation records)
+    '''
+    with open(path) as json_file:
+        game = json.load(json_file)['game']
+
+    def read_turns():
+        for key in sorted(game['data'].keys(), key=float):
+            data = game['data'][key]
+            generations = numpy.zeros(len(data['scores']), dtype=TELEMETRY_GENERATION_DTYPE)
+            generations['turn'] = data['turn']
+            generations['generation'] = numpy.arange(len(data['scores']))
+            generations['best_score'] = data['scores']
+            yield {'turn': data['turn'], 'best_score': data['best_score'], 'nb_records': len(data['scores'])}, generations
+
+    return game['configuration'], read_turns()
+
+
+def read_run(path):
+    '''
+    Read a run file in any of the formats
+    @return: the configuration and a generator of the turns as (dictionary of the turn record, array of the generation records)
+    '''
+    with open(path, 'rb') as run_file:
+        is_json_log = run_file.read(len(JSON_LOG_START)) == JSON_LOG_START
+
+    return read_json_turns(path) if is_json_log else read_telemetry(path)
+
+
+def convert_run(path):
+    '''
+    Convert the turns of a run file to arrays
+    @return: dictionary of arrays: turns, best_scores and nb_generations by turn, scores by turn and generation (NaN padded)
+    nb_generations counts the records of the turn, the first one being the initial population
+    '''
+    configuration, turns = read_run(path)
+
+    turn_ids = []
+    best_scores = []
+    scores = []
+    for turn, generations in turns:
+        turn_ids.append(turn['turn'])
+        best_scores.append(turn['best_score'])
+        scores.append(generations['best_score'])
+
+    nb_generations = numpy.array([len(generation_scores) for generation_scores in scores], dtype=int)
+    matrix = numpy.full((len(scores), nb_generations.max() if len(scores) else 0), numpy.nan)
+    if len(scores):
+        matrix[numpy.arange(matrix.shape[1]) < nb_generations[:, None]] = numpy.concatenate(scores)
+
+    return {'turns': numpy.array(turn_ids, dtype=int), 'best_scores': numpy.array(best_scores, dtype=float),
+            'nb_generations': nb_generations, 'scores': matrix}
+
+
+def get_cache_path(path, cache_directory):
+    '''
+    Return the path of the cache of a run file, the name depending on its path, size and modification time
+    '''
+    status = os.stat(path)
+    key = '%s:%d:%d:%d' % (os.path.abspath(path), status.st_size, status.st_mtime_ns, CACHE_VERSION)
+    return os.path.join(cache_directory, hashlib.sha1(key.encode()).hexdigest() + '.npz')
+
+
+def load_run(path, cache_directory=CACHE_DIRECTORY):
+    '''
+    Return the arrays of a run file, read from the cache if the file has not changed since it has been converted
+    '''
+    if cache_directory is None:
+        return convert_run(path)
+
+    cache_path = get_cache_path(path, cache_directory)
+    if os.path.exists(cache_path):
+        with numpy.load(cache_path) as cache:
+            return dict(cache)
+
+    run = convert_run(path)
+    os.makedirs(cache_directory, exist_ok=True)
+    numpy.savez(cache_path, **run)
+    return run
+
+
+def get_statistics(run):
+    '''
+    Return the statistics by turn of a run
+    improvement: % between the first score and the best score of the turn
+    convergence: first generation reaching the best score of the turn (-1 if never reached)
+    min_scores, max_scores: minimum and maximum of the scores of the generations of the turn
+    '''
+    scores = run['scores']
+    best_scores = run['best_scores']
+    first_scores = scores[:, 0] if scores.shape[1] else numpy.full(len(best_scores), numpy.nan)
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        improvements = (best_scores - first_scores) / numpy.abs(best_scores) * 100.0
+
+    is_reached = scores >= best_scores[:, None]
+    convergence = numpy.where(is_reached.any(axis=1), is_reached.argmax(axis=1), -1)
+
+    is_empty = run['nb_generations'] == 0
+    filled_scores = numpy.where(numpy.isnan(scores), -numpy.inf, scores)
+    max_scores = numpy.where(is_empty, numpy.nan, filled_scores.max(axis=1, initial=-numpy.inf))
+    filled_scores = numpy.where(numpy.isnan(scores), numpy.inf, scores)
+    min_scores = numpy.where(is_empty, numpy.nan, filled_scores.min(axis=1, initial=numpy.inf))
+
+    return {'turns': run['turns'], 'nb_generations': run['nb_generations'], 'improvements': improvements,
+            'convergence': convergence, 'min_scores': min_scores, 'max_scores': max_scores}
+
+
+def analyze_run(task):
+    '''
+    Load a run and return its statistics (executed in a worker process)
+    @param task: (path of the run file, cache directory or None)
+    '''
+    path, cache_directory = task
+    return path, get_statistics(load_run(path, cache_directory))
+
+
+def aggregate(statistics):
+    '''
+    Aggregate the statistics of the runs by turn (mean over the runs) and over all the turns of all the runs
+    @param statistics: list of the statistics of the runs
+    @return: dictionary of arrays
+    '''
+    nb_turns = max((len(run['turns']) for run in statistics), default=0)
+    summary = {'nb_runs': numpy.array(len(statistics))}
+
+    for name in ['nb_generations', 'improvements', 'convergence', 'min_scores', 'max_scores']:
+        # runs x turns, NaN padded for the shorter runs
+        matrix = numpy.full((len(statistics), nb_turns), numpy.nan)
+        for i, run in enumerate(statistics):
+            matrix[i, :len(run[name])] = run[name]
+        if name == 'convergence':
+            matrix[matrix < 0] = numpy.nan
+
+        with numpy.errstate(invalid='ignore'):
+            summary[name + '_by_turn'] = numpy.nanmean(matrix, axis=0) if len(statistics) else numpy.full(nb_turns, numpy.nan)
+        values = matrix[~numpy.isnan(matrix)]
+        summary[name + '_mean'] = numpy.array(values.mean() if len(values) else numpy.nan)
+        summary[name + '_percentiles'] = numpy.percentile(values, PERCENTILES) if len(values) else numpy.full(len(PERCENTILES), numpy.nan)
+
+    return summary
+
+
+def analyze_runs(paths, processes=multiprocessing.cpu_count(), cache_directory=CACHE_DIRECTORY):
+    '''
+    Analyze the run files with a process pool
+    @return: statistics of each run by path and their aggregation
+    '''
+    tasks = [(path, cache_directory) for path in paths]
+    with multiprocessing.Pool(processes) as pool:
+        statistics = dict(pool.imap_unordered(analyze_run, tasks, chunksize=max(1, len(tasks) // (4 * processes))))
+
+    return statistics, aggregate([statistics[path] for path in paths])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Aggregate the statistics of runs of gold_league_genetic.py')
+    parser.add_argument('runs', nargs='+', help='telemetry or JSON log files of the runs')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='number of files analyzed at once')
+    parser.add_argument('--cache', default=CACHE_DIRECTORY, help='directory of the cached arrays of the runs')
+    parser.add_argument('--no-cache', action='store_true', help='parse the files without reading or writing the cache')
+    parser.add_argument('--output', help='npz file to write the aggregated statistics')
+    args = parser.parse_args()
+
+    statistics, summary = analyze_runs(args.runs, args.processes, None if args.no_cache else args.cache)
+
+    for name in ['nb_generations', 'improvements', 'convergence', 'min_scores', 'max_scores']:
+        print('%-16s mean %12.2f  ' % (name, summary[name + '_mean']) +
+              '  '.join('p%d %12.2f' % (percentile, value) for percentile, value in zip(PERCENTILES, summary[name + '_percentiles'])),
+              file=sys.stderr)
+
+    if args.output:
+        numpy.savez(args.output, **summary)
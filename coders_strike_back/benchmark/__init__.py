@@ -0,0 +1,6 @@
+'''
+Benchmark suite of the simulation and the genetic algorithm of csb_engine.py
+
+Run from the coders_strike_back directory:
+python -m benchmark [--output results.json] [--baseline baseline.json]
+'''
@@ -0,0 +1,113 @@
+'''
+Run the benchmark suite on the recorded races and compare the results with a baseline
+
+python -m benchmark --output baseline.json
+python -m benchmark --baseline baseline.json [--tolerance 0.15]
+python -m benchmark --record (record again the races of MAPS in races.json)
+python -m benchmark --selection (compare the selection on the results with the selection on the Pareto fronts)
+'''
+
+import os
+import sys
+import json
+import argparse
+import platform
+import statistics
+
+from benchmark import suite
+
+RACES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'races.json')
+
+# Checkpoint layouts used to record the races: name, laps, checkpoints
+MAPS = [('map1', 3, [[13890, 1958], [8009, 3263], [2653, 7002], [10035, 5969]]),
+        ('map2', 3, [[7637, 5988], [3133, 7544], [9544, 4408], [14535, 7770], [6312, 4294], [7782, 851]]),
+        ('map3', 3, [[6012, 5376], [11308, 2847], [7482, 6917]]),
+        ('map4', 3, [[7249, 2754], [4968, 7439], [13108, 2290], [12924, 7260], [5665, 2573], [4149, 4679]])]
+RECORDED_TURNS = [1, 25, 60]
+
+
+def record():
+    races = []
+    for name, laps, checkpoints in MAPS:
+        races += suite.record_race(name, laps, checkpoints, RECORDED_TURNS)
+    suite.save_races(RACES_PATH, races)
+
+
+def run(races, seed):
+    '''
+    Return the report of the benchmark: metrics by race and their mean
+    '''
+    results = {}
+    for race in races:
+        results[race['name']] = suite.run_race(race, seed)
+        print(race['name'], results[race['name']], file=sys.stderr)
+
+    mean = {name: statistics.mean([result[name] for result in results.values()]) for name, function, is_higher_better in suite.METRICS}
+    return {'python': platform.python_version(), 'seed': seed, 'races': results, 'mean': mean}
+
+
+def compare_selections(races, seed):
+    '''
+    Return the comparison of the selections by race
+    '''
+    results = {}
+    for race in races:
+        results[race['name']] = suite.compare_selections(race, seed)
+        print(race['name'], results[race['name']], file=sys.stderr)
+
+    return {'python': platform.python_version(), 'seed': seed, 'races': results}
+
+
+def compare(report, baseline, tolerance):
+    '''
+    Print the relative change of the mean metrics against the baseline
+    @return: True if no metric is worse than the baseline by more than the tolerance
+    '''
+    is_ok = True
+    for name, function, is_higher_better in suite.METRICS:
+        if name not in baseline['mean']:  # metric added after the baseline
+            continue
+
+        value = report['mean'][name]
+        reference = baseline['mean'][name]
+        if reference == 0:  # no relative change
+            print('%-28s %12.2f %12.2f %9s' % (name, reference, value, 'n/a'), file=sys.stderr)
+            continue
+
+        change = (value - reference) / reference
+        is_regression = (change < -tolerance) if is_higher_better else (change > tolerance)
+        is_ok = is_ok and not is_regression
+        print('%-28s %12.2f %12.2f %+8.1f%%%s' % (name, reference, value, change * 100.0, '  REGRESSION' if is_regression else ''), file=sys.stderr)
+
+    return is_ok
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark of the simulation and the genetic algorithm of csb_engine.py')
+    parser.add_argument('--races', default=RACES_PATH, help='json file of the recorded races')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the random generator')
+    parser.add_argument('--output', help='json file to write the report (standard output otherwise)')
+    parser.add_argument('--baseline', help='json report to compare the results with')
+    parser.add_argument('--tolerance', type=float, default=0.15, help='relative change of a metric considered as a regression')
+    parser.add_argument('--record', action='store_true', help='record the races of MAPS before running the benchmark')
+    parser.add_argument('--selection', action='store_true', help='compare the selection on the results with the multi objectives selection')
+    args = parser.parse_args()
+
+    if args.record:
+        record()
+
+    if args.selection:
+        report = compare_selections(suite.load_races(args.races), args.seed)
+    else:
+        report = run(suite.load_races(args.races), args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=1)
+    else:
+        print(json.dumps(report, indent=1))
+
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            if not compare(report, json.load(baseline_file), args.tolerance):
+                sys.exit(1)
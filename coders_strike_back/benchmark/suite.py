@@ -0,0 +1,294 @@
+'''
+Recorded race states and timings of the hot paths of csb_engine.py
+'''
+
+import json
+import time
+import statistics
+
+import numpy
+
+import csb_engine as engine
+
+NB_CALLS = 200  # number of timed calls of the simulation functions
+NB_LOOPS = 1000  # calls by timed loop for the functions too fast to be timed call by call
+NB_GENERATIONS = 50  # number of timed generations
+NB_TURNS = 5  # number of timed turns to count the generations by turn
+
+# Fields of the pods saved in the recorded races
+POD_FIELDS = ['x', 'y', 'vx', 'vy', 'angle', 'next_checkpoint_id', 'lap', 'checked', 'timeout', 'is_shield_activated',
+              'turn_activated_shield', 'boost_available']
+
+
+def load_races(path):
+    '''
+    Return the races recorded in the json file
+    '''
+    with open(path) as races_file:
+        return json.load(races_file)
+
+
+def save_races(path, races):
+    with open(path, 'w') as races_file:
+        json.dump(races, races_file, indent=1)
+
+
+def get_pods():
+    return [engine.cho, engine.gall, engine.boss1, engine.boss2]
+
+
+def set_race(race):
+    '''
+    Set the race of the engine to the recorded state and prepare the simulation of the turn
+    '''
+    engine.initialize_race(race['laps'], race['checkpoints'])
+    engine.race_turn = race['race_turn']
+
+    for pod, fields in zip(get_pods(), race['pods']):
+        for field in POD_FIELDS:
+            setattr(pod, field, fields[field])
+        pod.check_next_checkpoint_id = pod.next_checkpoint_id
+        pod.race_turn = race['race_turn']
+
+    engine.update_roles()
+    engine.prepare_simulation()
+
+
+def record_race(name, laps, checkpoints, turns):
+    '''
+    Record the states of a race where our pods follow generate_move_IA and the bosses apply_boss
+    @param turns: turns of the race to record
+    @return: list of the recorded races
+    '''
+    engine.initialize_race(laps, checkpoints)
+    pods = get_pods()
+
+    # Start line of the game: the pods are aligned on checkpoint 0 perpendicularly to the direction of checkpoint 1
+    start = engine.track.checkpoints[0]
+    direction = engine.track.checkpoints[1]
+    distance = start.get_distance(direction)
+    normal_x = (start.y - direction.y) / distance
+    normal_y = (direction.x - start.x) / distance
+    for pod, offset in zip(pods, [-500.0, 500.0, -1500.0, 1500.0]):
+        pod.x = round(start.x + normal_x * offset)
+        pod.y = round(start.y + normal_y * offset)
+        pod.bounce_with_checkpoint(start)
+        pod.angle = pod.get_angle(direction)
+
+    races = []
+    for race_turn in range(max(turns) + 1):
+        for pod in pods:
+            pod.race_turn = race_turn
+
+        if race_turn in turns:
+            races.append({'name': name + '_' + str(race_turn), 'laps': laps, 'checkpoints': checkpoints, 'race_turn': race_turn,
+                          'pods': [{field: getattr(pod, field) for field in POD_FIELDS} for pod in pods]})
+
+        for pod in [engine.cho, engine.gall]:
+            move = pod.generate_move_IA()
+            pod.apply(move.angle, move.thrust)
+        engine.boss1.apply_boss()
+        engine.boss2.apply_boss()
+        engine.play(pods, [True, True, True, True])
+
+    return races
+
+
+def time_calls(prepare, call, nb_calls):
+    '''
+    Return the median time of the calls in microseconds, prepare being called before each call without being timed
+    '''
+    times = []
+    for i in range(nb_calls):
+        prepare()
+        start_time = time.perf_counter_ns()
+        call()
+        times.append(time.perf_counter_ns() - start_time)
+
+    return statistics.median(times) / 1000.0
+
+
+def time_loops(call, nb_loops=NB_LOOPS):
+    '''
+    Return the median time of a call in microseconds, the calls being timed by loops of nb_loops calls
+    '''
+    times = []
+    for i in range(NB_CALLS // 10):
+        start_time = time.perf_counter_ns()
+        for j in range(nb_loops):
+            call()
+        times.append(time.perf_counter_ns() - start_time)
+
+    return statistics.median(times) / nb_loops / 1000.0
+
+
+def time_pod_clone():
+    return time_loops(engine.cho.clone)
+
+
+def time_pod_state():
+    '''
+    Time the backup and restore of a pod by its state tuple (as the move generation of the IA)
+    '''
+    pod = engine.cho
+    return time_loops(lambda: pod.set_state(pod.get_state()))
+
+
+def time_save_load_pod_states():
+    return time_loops(lambda: engine.load_pod_states(*engine.save_pod_states()))
+
+
+def time_play():
+    '''
+    Time one turn of play() for the 4 pods after the first moves of the best solution of a new population
+    '''
+    solution = get_population()[0]
+    angle1, thrust1 = solution.moves[0, 0, engine.GENE_ANGLE], solution.moves[0, 0, engine.GENE_THRUST]
+    angle2, thrust2 = solution.moves[1, 0, engine.GENE_ANGLE], solution.moves[1, 0, engine.GENE_THRUST]
+    states = engine.save_pod_states()
+    pods = get_pods()
+
+    def prepare():
+        engine.load_pod_states(*states)
+        engine.cho.apply(angle1, thrust1)
+        engine.gall.apply(angle2, thrust2)
+        engine.boss1.apply_boss()
+        engine.boss2.apply_boss()
+
+    time_play = time_calls(prepare, lambda: engine.play(pods, [True, True, True, True]), NB_CALLS)
+    engine.load_pod_states(*states)
+    return time_play
+
+
+def time_get_collision_time():
+    return time_calls(lambda: None, lambda: engine.cho.get_collision_time(engine.boss1, engine.SQUARED_DOUBLE_RADIUS_POD), NB_CALLS)
+
+
+def get_population():
+    ga = engine.GeneticAlgorithm()
+    ga.generate_population(True)
+    return ga.solutions
+
+
+def time_solution_score():
+    '''
+    Time the scalar scoring of a solution without reusing the simulated prefixes of the previous solutions
+    '''
+    solutions = get_population()
+    calls = iter(solutions * (NB_CALLS // len(solutions) + 1))
+    return time_calls(engine.prefix_cache.clear, lambda: next(calls).score(), NB_CALLS)
+
+
+def time_build_generation_proba():
+    ga = engine.GeneticAlgorithm()
+    ga.generate_population(True)
+    ga.maximum = ga.get_best_solution().result
+    return time_calls(lambda: None, ga.build_generation_proba, NB_GENERATIONS)
+
+
+def evolve(ga, budget):
+    '''
+    Run the generations until the deadline of the turn as in the main loop of the bot
+    '''
+    nb_solutions = budget.get_nb_solutions()
+    while nb_solutions > 0:
+        budget.start_generation()
+        ga.build_generation_proba(nb_solutions)
+        budget.end_generation(nb_solutions, ga.nb_scored)
+        nb_solutions = budget.get_nb_solutions()
+
+
+def count_generations_by_turn():
+    '''
+    Return the median number of generations completed in a turn by the loop of the bot
+    '''
+    budget = engine.TimeBudget()
+    nb_generations = []
+    for turn in range(NB_TURNS):
+        budget.start_turn()
+        ga = engine.GeneticAlgorithm()
+        ga.generate_population(True)
+        ga.maximum = ga.get_best_solution().result
+
+        evolve(ga, budget)
+        nb_generations.append(budget.nb_generations)
+
+    return statistics.median(nb_generations)
+
+
+def run_selection(is_multi_objective):
+    '''
+    Run the genetic algorithm during a turn with the selection on the results or on the Pareto fronts
+    @return: number of generations, best result and objectives of the final population
+    '''
+    engine.MULTI_OBJECTIVE = is_multi_objective
+    try:
+        budget = engine.TimeBudget()
+        budget.start_turn()
+        ga = engine.GeneticAlgorithm()
+        ga.generate_population(True)
+        ga.maximum = ga.get_best_solution().result
+
+        evolve(ga, budget)
+        index = budget.nb_generations
+
+        # The objectives of the runner are only set in multi objectives
+        engine.MULTI_OBJECTIVE = True
+        ga.score_solutions(ga.solutions)
+        objectives = numpy.array([solution.get_objectives() for solution in ga.solutions])
+        return index, ga.get_best_solution().result, objectives
+    finally:
+        engine.MULTI_OBJECTIVE = False
+
+
+def get_coverage(objectives_a, objectives_b):
+    '''
+    Return the C-metric of Zitzler: the ratio of the solutions of b dominated by at least one solution of a
+    '''
+    is_greater_equal = (objectives_a[:, None, :] >= objectives_b[None, :, :]).all(axis=2)
+    is_greater = (objectives_a[:, None, :] > objectives_b[None, :, :]).any(axis=2)
+    return float((is_greater_equal & is_greater).any(axis=0).mean())
+
+
+def compare_selections(race, seed):
+    '''
+    Compare the selection on the results with the selection on the Pareto fronts (NSGA-II) on the race
+    @return: dictionary of the metrics of each selection
+    '''
+    results = {}
+    populations = {}
+    for name, is_multi_objective in [('result', False), ('pareto', True)]:
+        set_race(race)
+        engine.set_random_seed(seed)
+        nb_generations, best_result, objectives = run_selection(is_multi_objective)
+        populations[name] = objectives
+        results[name] = {'generations': nb_generations, 'best_result': best_result,
+                         'non_dominated': int((engine.get_non_dominated_ranks(objectives) == 0).sum())}
+
+    results['result']['coverage'] = get_coverage(populations['result'], populations['pareto'])
+    results['pareto']['coverage'] = get_coverage(populations['pareto'], populations['result'])
+    return results
+
+
+# Metrics of the suite: name, function, True if a higher value is better
+METRICS = [('pod_clone_us', time_pod_clone, False),
+           ('pod_state_us', time_pod_state, False),
+           ('save_load_pod_states_us', time_save_load_pod_states, False),
+           ('play_us', time_play, False),
+           ('get_collision_time_us', time_get_collision_time, False),
+           ('solution_score_us', time_solution_score, False),
+           ('build_generation_proba_us', time_build_generation_proba, False),
+           ('generations_by_turn', count_generations_by_turn, True)]
+
+
+def run_race(race, seed):
+    '''
+    Return the metrics of the race
+    '''
+    results = {}
+    for name, function, is_higher_better in METRICS:
+        set_race(race)
+        engine.set_random_seed(seed)
+        results[name] = function()
+
+    return results
@@ -0,0 +1,81 @@
+'''
+Build the single files submitted to the game from the entry point scripts and csb_engine.py
+
+The game server runs one file: the entry point script is appended to the engine module, its imports of csb_engine removed.
+The startup time of each built file (import of its dependencies, compilation and definitions, without the game loop)
+is measured in a new interpreter and the build fails if it is longer than MAX_STARTUP_TIME.
+
+Usage: python build.py [gold_league_genetic.py ...] [--output dist]
+'''
+
+import os
+import re
+import sys
+import argparse
+import subprocess
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+ENGINE_PATH = os.path.join(DIRECTORY, 'csb_engine.py')
+ENTRY_POINTS = [os.path.join(DIRECTORY, 'gold_league_genetic.py')]  # scripts importing csb_engine
+MAX_STARTUP_TIME = 400.0  # ms, the first turn of the game is answered in less than 1000 ms
+
+ENGINE_IMPORT = re.compile(r'^(from csb_engine import .*|import csb_engine.*)\n', re.MULTILINE)
+
+# Run in a new interpreter: compile and execute the built file as a module, the game loop is not started
+STARTUP_SCRIPT = '''
+import sys
+import time
+start_time = time.perf_counter()
+with open(sys.argv[1]) as bot_file:
+    code = compile(bot_file.read(), sys.argv[1], 'exec')
+exec(code, {'__name__': 'bot'})
+print((time.perf_counter() - start_time) * 1000.0)
+'''
+
+
+def build(entry_point_path, engine_path=ENGINE_PATH):
+    '''
+    Return the source of the single file bot: the engine followed by the entry point without its imports of the engine
+    '''
+    with open(engine_path) as engine_file:
+        engine = engine_file.read()
+    with open(entry_point_path) as entry_point_file:
+        entry_point = entry_point_file.read()
+
+    if not ENGINE_IMPORT.search(entry_point):
+        raise ValueError(entry_point_path + ' does not import csb_engine')
+
+    return (engine.rstrip('\n') + '\n\n\n# ' + os.path.basename(entry_point_path) + ' (built by build.py)\n'
+            + ENGINE_IMPORT.sub('', entry_point))
+
+
+def get_startup_time(path):
+    '''
+    Return the time in ms to start the bot of the file in a new interpreter
+    '''
+    output = subprocess.run([sys.executable, '-c', STARTUP_SCRIPT, path], stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                            check=True, universal_newlines=True).stdout
+    return float(output)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the single file bots submitted to the game')
+    parser.add_argument('entry_points', nargs='*', default=ENTRY_POINTS, help='entry point scripts importing csb_engine')
+    parser.add_argument('--output', default=os.path.join(DIRECTORY, 'dist'), help='directory of the built files')
+    parser.add_argument('--max-startup', type=float, default=MAX_STARTUP_TIME, help='maximum startup time of a built file in ms')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    is_ok = True
+    for entry_point in args.entry_points:
+        path = os.path.join(args.output, os.path.basename(entry_point))
+        with open(path, 'w') as bot_file:
+            bot_file.write(build(entry_point))
+
+        startup_time = get_startup_time(path)
+        is_ok = is_ok and startup_time <= args.max_startup
+        print('%s: %d bytes, startup %.1f ms%s' % (path, os.path.getsize(path), startup_time,
+                                                  '' if startup_time <= args.max_startup else '  TOO SLOW'), file=sys.stderr)
+
+    if not is_ok:
+        sys.exit(1)
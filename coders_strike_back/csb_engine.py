@@ -0,0 +1,2398 @@
+'''
+Simulation and genetic algorithm of Coders Strike Back shared by the bots and the offline tools
+
+The module has no side effect at import: the race is set by initialize_race and each turn is played by play_turn.
+The bots submitted to the game are single files built by build.py, the entry point script being appended to this module.
+'''
+
+import gc
+import sys
+
+import time
+import json
+from math import sqrt
+from math import log
+from math import cos
+from math import acos
+from math import sin
+from math import asin
+from math import ceil
+from math import floor
+from math import ceil
+from math import radians
+from math import degrees
+from math import pi
+from math import atan2
+from math import inf
+from math import exp
+from math import copysign
+from operator import attrgetter
+from collections import deque
+from collections import OrderedDict
+from heapq import heappush
+from heapq import heappop
+
+import numpy
+
+# Auto-generated code below aims at helping you parse
+# the standard input according to the problem statement.
+
+
+# GAME CONSTANTS
+FRICTION = 0.85  # (game constraint) friction factor applied on pods
+PRECISION = 6  # floating precision
+TIMEOUT = 100  # number of turns for a pod to reach its next checkpoint
+TIME_FULL_TURN = 1.0  # a full turn has a time of 1
+NB_TURN_SIMULATION = 6
+MAX_WAITING_TURN = 7
+
+RADIUS_POD = 400.0
+RADIUS_CHECKPOINT = 600.0
+DOUBLE_RADIUS_CHECKPOINT = 1200.0
+SQUARED_RADIUS_CHECKPOINT = 360000.0
+SQUARED_DOUBLE_RADIUS_CHECKPOINT = 1440000.0
+MAX_DISTANCE_BY_TURN = 1300.0
+SQUARED_MAX_DISTANCE_BY_TURN = 1690000.0
+SQUARED_DOUBLE_RADIUS_POD = 640000.0
+NO_COLLISION = inf  # collision time of units that do not collide
+DISTANCE_MINIMUM_2_CKPTS_IN_ONE_TURN = 2500.0
+RADIUS_WAYPOINT = 20.0  # Waypoint used as entry point in checkpoint  => TODO: check if keep it or not
+SQUARED_RADIUS_WAYPOINT = 400.0
+TIME_BEFORE_DETECTION_CHECKPOINT = 5.0  # turns before collision
+NB_TURN_ROLLBACK = 5  # number of turns after an anticipated collisions to check if the checkpoint has been indeed validated (must be >= TIME_BEFORE_DETECTION_CHECKPOINT)
+
+SAFETY_DISTANCE = RADIUS_POD + RADIUS_POD + 10  # distance of an ennemy to activate the shield
+SAFETY_DISTANCE_SQUARED = 656100
+SHIELD = 'SHIELD'
+SHIELD_COOLDOWN = 3
+
+MAX_THRUST = 100.0
+MIN_THRUST = 0.0
+BOOST = 'BOOST'
+MAX_ANGLE_SPEED = 150.0
+MIN_ANGLE_SPEED = 20.0
+MIN_DISTANCE_BOOST = 5000.0
+SQUARED_MIN_DISTANCE_BOOST = 25000000.0
+
+# TRIGONOMETRY
+DEGREES_TO_RADIANS = pi / 180.0
+RADIANS_TO_DEGREES = 180.0 / pi
+FAST_TRIGONOMETRY = False  # read the cosine and sine of the pod angles in lookup tables instead of computing them (see set_fast_trigonometry)
+TRIGONOMETRY_RESOLUTION = 0.01  # degrees between two angles of the lookup tables
+
+# GENETIC ALGORITHM
+NB_MOVES = 6
+PREFIX_CACHE_SIZE = 2000  # maximum number of simulated genome prefixes kept during a turn, 0 to disable the cache
+BOSS_CACHE_TOLERANCE = 1.0  # maximum drift of a boss from the previous prediction (position, speed and angle) to reuse it
+
+# TIME CONTROL
+TURN_TIME_LIMIT = 150.0  # ms, (game constraint) time to answer a turn after the first one
+TIME_MARGIN = 10.0  # ms kept before the time limit for the jitter of the process and the pipes
+NB_COST_SAMPLES = 50  # number of last generations (and outputs) used to estimate their duration
+COST_PERCENTILE = 95  # percentile of the durations of the last generations that must fit before the deadline
+MIN_NB_SOLUTIONS = 2  # minimum number of solutions evolved by a reduced generation
+MIN_NB_COST_SAMPLES = 5  # number of generations needed to estimate the duration of a reduced generation
+
+# TELEMETRY
+# Records of the turns written on stderr once per turn after the output, either as newline-delimited JSON
+# (a line for the configuration then a line by turn with the records of its generations as columns)
+# or as binary (the header record, then for each turn the turn record followed by its generation records)
+TELEMETRY_FORMAT = 'ndjson'  # 'ndjson', 'binary' or None to disable the telemetry
+TELEMETRY_CAPACITY = 256  # number of generation records preallocated for a turn, the buffer grows if needed
+TELEMETRY_MAGIC = b'CSBT'
+TELEMETRY_HEADER_DTYPE = numpy.dtype([('magic', 'S4'), ('nb_ckpt', '<i4'), ('nb_moves', '<i4'), ('nb_population', '<i4'),
+                                      ('nb_tournament', '<i4')])
+TELEMETRY_TURN_DTYPE = numpy.dtype([('turn', '<i4'), ('checked_pod1', '<i4'), ('checked_pod2', '<i4'), ('nb_records', '<i4'),
+                                    ('nb_reduced_generations', '<i4'), ('best_score', '<f8'), ('setup', '<f8'), ('generations', '<f8'),
+                                    ('output', '<f8'), ('total', '<f8'), ('generation_cost', '<f8'),
+                                    ('generation_cost_mean', '<f8')])
+TELEMETRY_GENERATION_DTYPE = numpy.dtype([('turn', '<i4'), ('generation', '<i4'), ('nb_solutions', '<i4'), ('apocalypse', '<i4'),
+                                          ('best_score', '<f8'), ('average', '<f8'), ('maximum', '<f8'), ('elapsed', '<f8')])
+
+# POD STATE
+# Pod.get_state saves the fields modified by a simulation in a tuple:
+# (x, y, vx, vy, angle, next_checkpoint_id, lap, checked, timeout, is_shield_activated, race_turn, boost_available, turn_activated_shield)
+STATE_X = 0
+STATE_Y = 1
+STATE_VX = 2
+STATE_VY = 3
+STATE_ANGLE = 4
+STATE_NEXT_CHECKPOINT_ID = 5
+STATE_LAP = 6
+STATE_CHECKED = 7
+STATE_TIMEOUT = 8
+STATE_IS_SHIELD_ACTIVATED = 9
+STATE_RACE_TURN = 10
+STATE_BOOST_AVAILABLE = 11
+STATE_TURN_ACTIVATED_SHIELD = 12
+
+# GENOME
+# The genes of a solution are stored in one row of floats: the NB_MOVES moves of cho then the NB_MOVES moves of gall,
+# each move being [angle, thrust, shield, boost]
+GENE_ANGLE = 0
+GENE_THRUST = 1
+GENE_SHIELD = 2
+GENE_BOOST = 3
+NB_GENES = 4
+GENOME_SIZE = 2 * NB_MOVES * NB_GENES
+
+# POPULATION CONTROL
+NB_POPULATION = 10  # equals to NB_CHILDREN + NB_BEST_PARENTS + NB_MUTATIONS_PARENTS
+NB_CHILDREN = 6  # number of crossings (children)
+
+# MUTATION CONTROL
+COEFFICIENT_MAX_MUTATION_FROM_REF = 0.4
+COEFFICIENT_MIN_MUTATION_FROM_REF = 0.01
+BOOST_CHANCE = 5
+SHIELD_CHANCE = 5
+RANDOM_SEED = None  # seed of the random generator of the genetic operators, None for a different seed at each run
+
+# SPECIFIC TO TOURNAMENT SELECTION
+NB_TOURNAMENT = 4  # number of parents in the pool for crossing
+SIZE_TOURNAMENT = 2  # number of contestants at each tournament
+
+# SPECIFIC TO ADAPTATIVE GENETIC ALGORITHM
+K1 = 1.0  # ponderation for crossing probability, 1.0 from publication
+K3 = 1.0  # ponderation for crossing probability, 1.0 from publication
+K2 = 0.5  # ponderation for mutation probability, 0.5 from publication
+K4 = 0.5  # ponderation for mutation probability, 0.5 from publication
+MIN_PROBA_MUTATION = 0.01  # minimum proba of mutation even on best solution 0.005 from publication
+MIN_PROBA_CROSS = 0.1  # own expriment
+NB_MOVES_TO_MUTATE = 6
+APOCALYPSE_NOW = 10  # Violent mutation to try to find a new maximum if evolution is stuck
+APOCALYPSE_MUTATION = 0.15
+MAX_NB_CHILDREN = 3
+
+# SPECIFIC TO MULTI OBJECTIVES SELECTION (NSGA-II)
+MULTI_OBJECTIVE = False  # keep the solutions on the best Pareto fronts of Solution.get_objectives instead of the best results
+
+
+class Point():
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+    def get_distance2(self, b):
+        '''
+        Return the square of the euclidian distance between the current point and the b point
+        '''
+        return (self.x - b.x) * (self.x - b.x) + (self.y - b.y) * (self.y - b.y)
+
+    def get_distance(self, b):
+        '''
+        Return the euclidian distance between the current point and the b point
+        '''
+        return sqrt(self.get_distance2(b))
+
+    def get_closest(self, a, b):
+        '''
+        Return the closest point on the line passing through the a and b points of the current point
+        '''
+        # TODO : understand the mathematical magic behind these equations
+
+        ax = a.x
+        bx = b.x
+        ay = a.y
+        by = b.y
+        selfx = self.x
+        selfy = self.y
+
+        da = by - ay
+        db = ax - bx
+        c1 = da * ax + db * ay
+        c2 = -db * selfx + da * selfy
+        det = da * da + db * db
+
+        if det == 0:
+            # Point is already on the line (ab)
+            closest_point_x = selfx
+            closest_point_y = selfy
+        else:
+            # Compute orthogonal projection of current point on the line (ab)
+            closest_point_x = (da * c1 - db * c2) / det
+            closest_point_y = (da * c2 + db * c1) / det
+
+        return Point(closest_point_x, closest_point_y)
+
+
+class Unit(Point):
+    __slots__ = ('id', 'radius', 'vx', 'vy')
+
+    def __init__(self, id, radius):
+        Point.__init__(self, 0, 0)
+        self.id = id
+        self.radius = radius
+        self.vx = 0.0
+        self.vy = 0.0
+
+    def set_coordinates(self, x, y, vx, vy):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+
+    def get_collision_time(self, other, length_radii_squared, is_occuring=False):
+        '''
+        Return the time of the collision between the current unit and the unit in parameter
+        The relative motion is solved on floats without building intermediate points
+        :param other: Unit on which we detect the collision
+        :param length_radii_squared: squared distance between the centers of the units at contact
+        :param is_occuring: True to return only the collisions that will be happening at the current turn
+        :return: the collision time if there is contact otherwise NO_COLLISION
+        '''
+
+        # Set other unit as the new reference (other is stationary and is positionned at (0, 0)
+        x = self.x - other.x
+        y = self.y - other.y
+
+        # Use square distance to avoid using root function
+        distance_to_other = x * x + y * y
+
+        if distance_to_other > SQUARED_MAX_DISTANCE_BY_TURN:
+            return NO_COLLISION
+
+        if distance_to_other <= length_radii_squared:
+            # Units are already in contact so there is an immediate collision
+            return 0.0
+
+        # Optimisation : units with the same vector speed will never collide
+        vx = self.vx - other.vx
+        vy = self.vy - other.vy
+        if vx == 0.0 and vy == 0.0:
+            return NO_COLLISION
+
+        # Get the closest point to other unit on the line described by the pod speed vector
+        da = (y + vy) - y
+        db = x - (x + vx)
+        det = da * da + db * db
+        if det == 0:
+            closest_x = 0.0
+            closest_y = 0.0
+        else:
+            c1 = da * x + db * y
+            closest_x = (da * c1) / det
+            closest_y = (db * c1) / det
+
+        # Distance(squared) between the other unit and the closest point to the other unit on the line described by our speed vector
+        distance_unit_closest_projection = closest_x * closest_x + closest_y * closest_y
+
+        # If the distance between other unit and this line is more than the sum of the radii, there is no collision
+        if distance_unit_closest_projection > length_radii_squared:
+            return NO_COLLISION
+
+        # Distance(squared) between the pod and the projection
+        distance_pod_closest_projection = (x - closest_x) * (x - closest_x) + (y - closest_y) * (y - closest_y)
+
+        # The pod speed on the line (norm)
+        speed_distance = vx * vx + vy * vy
+
+        # Project the pod on the line to find the point of impact
+        # (the impact point is backed off by the squared speed as the original solver did, to keep the same bounces)
+        distance_intersection_units = sqrt(length_radii_squared - distance_unit_closest_projection)
+        closest_x -= distance_intersection_units * (vx / speed_distance)
+        closest_y -= distance_intersection_units * (vy / speed_distance)
+
+        # If the projection point is further away means the pod direction is opposite of the other unit
+        # => no collision will happen
+        new_distance_pod_closest_projection = (closest_x - x) * (closest_x - x) + (closest_y - y) * (closest_y - y)
+        if new_distance_pod_closest_projection > distance_pod_closest_projection:
+            return NO_COLLISION
+
+        # If the impact point is further than what the pod can travel in one turn
+        # Collision will be managed in another turn
+        if new_distance_pod_closest_projection > speed_distance and is_occuring:
+            return NO_COLLISION
+
+        # Get the time needed to reach the impact point during this turn
+        return sqrt(new_distance_pod_closest_projection / speed_distance)
+
+    def bounce(self, other):
+        '''
+        Manage the bounce effect due to the impact of the shield of the current unit and the unit in parameters
+        :param other: Unit colliding with the current unit
+        :return: none
+        '''
+        return None
+
+
+class Checkpoint(Unit):
+    __slots__ = ()
+
+    def __init__(self, id, x, y, radius):
+        Unit.__init__(self, id, radius)
+        self.x = x
+        self.y = y
+
+    def bounce(self, other):
+        '''
+        Manage the bounce effect due to the impact of the shield of the current unit and the unit in parameters
+        :param other: Unit colliding with the current unit
+        :return: none
+        '''
+        return None
+
+    def clone(self):
+        return Checkpoint(self.id, self.x, self.y, self.radius)
+
+
+class Pod(Unit):
+    __slots__ = ('angle', 'next_checkpoint_id', 'lap', 'checked', 'timeout', 'partner', 'is_shield_activated', 'check_next_checkpoint_id',
+                 'switch_checkpoint', 'turn_activated_shield', 'waiting_turn', 'boost_available', 'race_turn', 'is_hunter', 'waiting_point')
+
+    def __init__(self, id, radius):
+        Unit.__init__(self, id, radius)
+        self.angle = 0
+        self.next_checkpoint_id = 0
+        self.lap = 1
+        self.checked = 0  # number of checkpoints checked
+        self.timeout = TIMEOUT
+        # self.partner = None
+        self.is_shield_activated = False
+        self.check_next_checkpoint_id = 0
+        self.switch_checkpoint = 0
+        self.turn_activated_shield = -4  # to avoid an activation at the start of the game
+        self.waiting_turn = 0
+        self.boost_available = True
+        self.race_turn = 0
+        self.is_hunter = False
+        self.waiting_point = track.entry_points[2]
+
+    def set_partner(self, partner):
+        self.partner = partner
+
+    def set_parameters(self, input, turn):
+        self.x, self.y, self.vx, self.vy, self.angle, check_next_checkpoint_id = [int(i) for i in input().split()]
+
+        # self.is_shield_activated = is_shield_activated
+        self.is_shield_activated = ((self.turn_activated_shield + 3) >= self.race_turn)
+        self.race_turn = turn
+
+        ## no more updated like in deterministic approach
+        if self.check_next_checkpoint_id != check_next_checkpoint_id:
+            self.check_next_checkpoint_id = check_next_checkpoint_id
+            self.bounce_with_checkpoint(self.get_next_checkpoint())
+
+    def set_boss_parameters(self, input, turn):
+        self.x, self.y, self.vx, self.vy, self.angle, check_next_checkpoint_id = [int(i) for i in input().split()]
+
+        # self.is_shield_activated = is_shield_activated
+        self.is_shield_activated = ((self.turn_activated_shield + 3) >= self.race_turn)
+        self.race_turn = turn
+
+        # Update Boss information on its checkpoints from previous turn information
+        if self.check_next_checkpoint_id != check_next_checkpoint_id:
+            self.check_next_checkpoint_id = check_next_checkpoint_id
+            self.bounce_with_checkpoint(self.get_next_checkpoint())
+
+    def check_consistency(self):
+        diff_turn = self.race_turn - self.switch_checkpoint
+
+        if self.check_next_checkpoint_id != self.next_checkpoint_id and diff_turn == NB_TURN_ROLLBACK:
+            self.switch_checkpoint = self.race_turn
+            self.next_checkpoint_id = self.check_next_checkpoint_id
+            if self.next_checkpoint_id == 0:
+                self.lap -= 1
+
+    def get_angle(self, p):
+        '''
+        Get the angle between the vector (pod, p) and the x game axis vector (1, 0)
+        (game constraint) 0° pod faces East, 90° pod faces South, ...
+        :param p: Point to compute the angle with the pod
+        :return: an angle
+        '''
+
+        # atan2 gives the angle in [-180, 180] without normalizing the vector pod - p
+        angle = atan2(p.y - self.y, p.x - self.x) * RADIANS_TO_DEGREES
+
+        # If the point is below switch the angle sign to be correct
+        if angle < 0.0:
+            angle += 360.0
+
+        return angle
+
+    def get_delta_angle_orientation(self, p):
+        '''
+        Define the oriented delta angle for the rotation that the pod must perform to move from its current angle to the new angle with the point p
+        :param p: Point targeted by the pod
+        :return: oriented angle to move from the current angle to the angle with the point p
+        '''
+
+        angle_pod_p = self.get_angle(p)
+
+        # To know whether the pod turns clockwise or not, check the left and right direction and keep the smallest
+        if self.angle <= angle_pod_p:
+            right_side_angle = angle_pod_p - self.angle
+        else:
+            right_side_angle = 360.0 - self.angle + angle_pod_p
+
+        if self.angle >= angle_pod_p:
+            left_side_angle = self.angle - angle_pod_p
+        else:
+            left_side_angle = self.angle + 360.0 - angle_pod_p
+
+        if right_side_angle < left_side_angle:
+            return right_side_angle
+        else:
+            # Return a negative angle to rotate on the left
+            return left_side_angle * -1.0
+
+    def rotate_angle(self, delta_angle):
+        if delta_angle > 18.0:
+            # rotate on the right side
+            delta_angle = 18.0
+        elif delta_angle < -18:
+            # rotate on the left side
+            delta_angle = -18.0
+
+        self.angle += delta_angle
+
+        # Replace the angle between [0 360] degrees
+        # mod operator is slower than if comparison
+        self.angle = formalize_angle(self.angle)
+
+    def accelerate(self, thrust):
+        '''
+        Determine the new velocity vector of the pod along its direction
+        :param thrust: thrust of the pod
+        :return: none
+        '''
+
+        # if thrust equals 0 it means no acceleration, so speed stays the same
+        # if thrust == 0:
+        #    return None
+
+        if FAST_TRIGONOMETRY:
+            index = int(self.angle * TRIGONOMETRY_TABLE_FACTOR + 0.5)
+            self.vx += COS_TABLE[index] * thrust
+            self.vy += SIN_TABLE[index] * thrust
+        else:
+            angle_radians = self.angle * DEGREES_TO_RADIANS
+            self.vx += cos(angle_radians) * thrust
+            self.vy += sin(angle_radians) * thrust
+
+    def move(self, time):
+        '''
+        Move the pod function of its velocity vector function of the time
+        :param time: time between [0.0, 1.0]
+        :return: none
+        '''
+        self.x += self.vx * time
+        self.y += self.vy * time
+
+    def finalize(self):
+        '''
+        Apply the remaining forces to the pod at the end of the turn
+        - Friction
+        - Round values
+        - Timeout to reach the next checkpoint
+        :return:
+        '''
+
+        self.x = floor(self.x)
+        self.y = floor(self.y)
+        self.vx = round(self.vx * FRICTION, PRECISION)
+        self.vy = round(self.vy * FRICTION, PRECISION)
+
+        # Timeout goes down by 1 each turn. It is reset to 100 when the pod passes its next checkpoint
+        self.timeout -= 1
+
+    def bounce(self, other):
+        '''
+        Manage the bounce effect due to the impact of the shield of the current unit and the unit in parameters
+        :param other: Unit colliding with the current unit
+        :return: none
+        '''
+
+        if isinstance(other, Checkpoint):
+            self.bounce_with_checkpoint(other)
+        else:
+            # If a pod has its shield active its mass is 10 otherwise it's 1
+            if self.is_shield_activated:
+                mass_pod1 = 10
+            else:
+                mass_pod1 = 1
+
+            if other.is_shield_activated:
+                mass_other = 10
+            else:
+                mass_other = 1
+
+            mass_coefficient = (mass_pod1 + mass_other) / (mass_pod1 * mass_other)
+            distance_x = self.x - other.x
+            distance_y = self.y - other.y
+
+            distance_square = distance_x * distance_x + distance_y * distance_y
+            if distance_square == 0:
+                distance_square = 1
+
+            speed_vector_x = self.vx - other.vx
+            speed_vector_y = self.vy - other.vy
+
+            # fx and fy are the components of the impact vector. product is just there for optimisation purposes
+            product = (distance_x * speed_vector_x) + (distance_y * speed_vector_y)
+            fx = (distance_x * product) / (distance_square * mass_coefficient)
+            fy = (distance_y * product) / (distance_square * mass_coefficient)
+
+            # Apply the impact vector once
+            self.vx -= fx / mass_pod1
+            self.vy -= fy / mass_pod1
+            other.vx += fx / mass_other
+            other.vy += fy / mass_other
+
+            # If the norm of the impact vector is less than 120, we normalize it to 120
+            impulse = sqrt(fx * fx + fy * fy)
+
+            if impulse == 0:
+                impulse = 1
+
+            if impulse < 120.0:
+                fx = (fx * 120.0) / impulse
+                fy = (fy * 120.0) / impulse
+
+            # We apply the impact vector a second time
+            self.vx -= fx / mass_pod1
+            self.vy -= fy / mass_pod1
+            other.vx += fx / mass_other
+            other.vy += fy / mass_other
+
+    def bounce_with_checkpoint(self, checkpoint):
+        '''
+        Manage collosion with a checkpoint
+        '''
+
+        if int(checkpoint.id) == int(self.next_checkpoint_id):
+            self.next_checkpoint_id += 1
+            self.checked += 1
+            self.switch_checkpoint = self.race_turn
+
+            if self.next_checkpoint_id == checkpointCount and self.lap < laps:
+                self.next_checkpoint_id = 0
+                self.lap += 1
+            elif self.next_checkpoint_id == checkpointCount and self.lap == laps:
+                self.next_checkpoint_id = -1
+
+            self.timeout = TIMEOUT
+
+    def score(self):
+        '''
+        Get the score for the pod
+        :return: score
+        '''
+        # passing checkpoints is the top priority
+        return self.checked * 50000 - self.get_distance(self.get_next_entry_point())
+
+    def score_hunter(self):
+        '''
+        Get the score for the pod
+        :return: score
+        '''
+        return -self.get_distance(self.waiting_point)
+
+    def apply(self, angle, thrust):
+        '''
+        Apply the move onto the player
+        turn the pod and apply the thrust
+        :param angle: rotation of the pod
+        :param thrust: thrust of the pod
+        :return: non
+        '''
+        self.rotate_angle(angle)
+        self.accelerate(thrust)
+
+    def get_next_checkpoint(self):
+        return track.checkpoints[self.next_checkpoint_id]
+
+    def get_next_entry_point(self):
+        return track.entry_points[self.next_checkpoint_id]
+
+    def get_checkpoint_id_coming_after(self):
+        '''
+        Return the id of the checkpoint coming after the next one
+        :return: checkpoint id, -1 if the next checkpoint is the finish line
+        '''
+        if self.next_checkpoint_id == checkpointCount - 1 and self.lap == laps:
+            return -1
+
+        return track.next_ids[self.next_checkpoint_id]
+
+    def get_checkpoint_id_coming_before(self):
+        return track.previous_ids[self.next_checkpoint_id]
+
+    def load(self, saved_pod):
+        self.x = saved_pod.x
+        self.y = saved_pod.y
+        self.vx = saved_pod.vx
+        self.vy = saved_pod.vy
+        self.angle = saved_pod.angle
+        self.next_checkpoint_id = saved_pod.next_checkpoint_id
+        self.lap = saved_pod.lap
+        self.checked = saved_pod.checked
+        self.timeout = saved_pod.timeout
+        # self.partner = saved_pod.partner
+        self.is_shield_activated = saved_pod.is_shield_activated
+        self.race_turn = saved_pod.race_turn
+        self.boost_available = saved_pod.boost_available
+        self.turn_activated_shield = saved_pod.turn_activated_shield
+
+    def get_state(self):
+        '''
+        Return the fields of the pod modified by a simulation (see STATE_* for the layout of the tuple)
+        '''
+        return (self.x, self.y, self.vx, self.vy, self.angle, self.next_checkpoint_id, self.lap, self.checked, self.timeout,
+                self.is_shield_activated, self.race_turn, self.boost_available, self.turn_activated_shield)
+
+    def set_state(self, state):
+        '''
+        Restore the fields of the pod saved by get_state
+        '''
+        self.x, self.y, self.vx, self.vy, self.angle, self.next_checkpoint_id, self.lap, self.checked, self.timeout, \
+            self.is_shield_activated, self.race_turn, self.boost_available, self.turn_activated_shield = state
+
+    def apply_boss(self, with_move=False):
+        '''
+        Compute the next state of the bosses in the race
+        @param with_move: True to move the boss pod during one full turn
+        False to only set the boss to be moved afterwards (in play function for AG)
+        '''
+
+        checkpoint = self.get_next_checkpoint()
+        collision_time = self.get_collision_time(checkpoint, checkpoint.radius * checkpoint.radius)
+        if checkpoint.id == self.next_checkpoint_id and collision_time < 1.0:
+            self.bounce_with_checkpoint(checkpoint)
+
+        checkpoint_entry = checkpoint
+        angle_checkpoint = self.get_delta_angle_orientation(checkpoint_entry)
+        squared_distance_to_checkpoint = self.get_distance2(checkpoint_entry)
+
+        # Compute thrust :
+        if not self.shield_ready():
+            thrust = 0  # active shield means no thrust
+        elif (self.get_distance2(cho) <= SAFETY_DISTANCE_SQUARED or self.get_distance2(gall) <= SAFETY_DISTANCE_SQUARED) and self.shield_ready():
+            self.activate_shield()
+            thrust = 0
+            # TODO : BOOST management for bosses
+        else:
+            if abs(angle_checkpoint) > MAX_ANGLE_SPEED:
+                thrust = MIN_THRUST
+            elif abs(angle_checkpoint) < MIN_ANGLE_SPEED:
+                thrust = MAX_THRUST
+            else:
+                thrust = MAX_THRUST * ((MAX_ANGLE_SPEED - abs(angle_checkpoint)) / MAX_ANGLE_SPEED)
+
+            if squared_distance_to_checkpoint > SQUARED_RADIUS_CHECKPOINT and squared_distance_to_checkpoint <= SQUARED_DOUBLE_RADIUS_CHECKPOINT:
+                coefficient = 0.7
+            elif squared_distance_to_checkpoint <= SQUARED_RADIUS_CHECKPOINT:
+                coefficient = 0
+            else:
+                coefficient = 1
+
+            thrust = thrust * coefficient
+
+        # Scale angle :
+        if angle_checkpoint > 18.0:
+            angle_checkpoint = 18.0
+        elif angle_checkpoint < -18.0:
+            angle_checkpoint = -18.0
+
+        self.angle += angle_checkpoint
+        self.angle = formalize_angle(self.angle)
+        self.accelerate(thrust)
+
+        if with_move:
+            self.move(TIME_FULL_TURN)  # time = 1.0 is a complete turn
+            self.finalize()
+
+    def generate_move_IA(self):
+        '''
+        Apply the move on the pod and print result to game engine
+        :param move: Move
+        :return: none
+        '''
+
+        move = Move(0.0, 0.0)
+
+        thrust = MAX_THRUST
+
+        checkpoint = self.get_next_entry_point()
+        collision_time = self.get_collision_time(checkpoint, checkpoint.radius * checkpoint.radius)
+        if checkpoint.id == self.next_checkpoint_id and collision_time < 1.0:
+            self.bounce_with_checkpoint(checkpoint)
+
+        checkpoint_entry = checkpoint
+
+        angle_checkpoint = self.get_delta_angle_orientation(checkpoint_entry)
+        distance_to_checkpoint = self.get_distance2(checkpoint_entry)
+
+        # Compute thrust :
+        if not self.shield_ready():
+            thrust = 0.0  # active shield means no thrust
+        elif (self.get_distance2(boss1) <= SAFETY_DISTANCE_SQUARED or self.get_distance2(boss2) <= SAFETY_DISTANCE_SQUARED) and self.shield_ready():
+            move.shield = True
+            thrust = 0.0
+        # self.activate_shield()
+        #   thrust = SHIELD
+        else:
+            if distance_to_checkpoint > SQUARED_MIN_DISTANCE_BOOST and abs(angle_checkpoint) < MIN_ANGLE_SPEED and self.boost_available:
+                thrust = 100.0
+                move.boost = True
+            else:
+
+                if abs(angle_checkpoint) > MAX_ANGLE_SPEED:
+                    thrust = MIN_THRUST
+                elif abs(angle_checkpoint) < MIN_ANGLE_SPEED:
+                    thrust = MAX_THRUST
+                else:
+                    thrust = thrust * ((MAX_ANGLE_SPEED - abs(angle_checkpoint)) / MAX_ANGLE_SPEED)
+
+                if distance_to_checkpoint < 4.0 * SQUARED_RADIUS_WAYPOINT:
+                    coefficient = 0.8
+                elif distance_to_checkpoint <= 1.0 * SQUARED_RADIUS_WAYPOINT:
+                    coefficient = 0
+                else:
+                    coefficient = 1
+
+                thrust = thrust * coefficient
+
+        # Scale angle :
+        if angle_checkpoint > 18:
+            angle_checkpoint = 18
+        elif angle_checkpoint < -18:
+            angle_checkpoint = -18
+
+        move.angle = angle_checkpoint
+        move.thrust = thrust
+
+        return move
+
+    def generate_move_IA_hunter(self, boss_runner):
+        '''
+        Apply the move on the pod and print result to game engine
+        :param move: Move
+        :return: none
+        '''
+
+        move = Move(0.0, 0.0)
+
+        thrust = MAX_THRUST
+
+        checkpoint = self.get_next_checkpoint()
+        collision_time = self.get_collision_time(checkpoint, checkpoint.radius * checkpoint.radius)
+        if checkpoint.id == self.next_checkpoint_id and collision_time < 1.0:
+            self.bounce_with_checkpoint(checkpoint)
+
+        checkpoint_entry = self.waiting_point
+
+        angle_checkpoint = self.get_delta_angle_orientation(checkpoint_entry)
+        distance_to_checkpoint = self.get_distance2(checkpoint_entry)
+
+        # Compute thrust :
+        if not self.shield_ready():
+            thrust = 0.0  # active shield means no thrust
+        elif (self.get_distance2(boss1) <= SAFETY_DISTANCE_SQUARED or self.get_distance2(
+                boss2) <= SAFETY_DISTANCE_SQUARED) and self.shield_ready():
+            move.shield = True
+            thrust = 0.0
+        # self.activate_shield()
+        #   thrust = SHIELD
+        else:
+            if distance_to_checkpoint > SQUARED_MIN_DISTANCE_BOOST and abs(
+                    angle_checkpoint) < MIN_ANGLE_SPEED and self.boost_available:
+                thrust = 100.0
+                move.boost = True
+            else:
+
+                if abs(angle_checkpoint) > MAX_ANGLE_SPEED:
+                    thrust = MIN_THRUST
+                elif abs(angle_checkpoint) < MIN_ANGLE_SPEED:
+                    thrust = MAX_THRUST
+                else:
+                    thrust = thrust * ((MAX_ANGLE_SPEED - abs(angle_checkpoint)) / MAX_ANGLE_SPEED)
+
+                if distance_to_checkpoint < 4.0 * SQUARED_RADIUS_WAYPOINT:
+                    coefficient = 0.0
+                else:
+                    coefficient = 1
+
+                thrust = thrust * coefficient
+
+        # Scale angle :
+        if angle_checkpoint > 18:
+            angle_checkpoint = 18
+        elif angle_checkpoint < -18:
+            angle_checkpoint = -18
+
+        move.angle = angle_checkpoint
+        move.thrust = thrust
+
+        return move
+
+    def output(self, move):
+
+        self.rotate_angle(move.angle)
+
+        # Look for a point corresponding to the angle we wantSAME CONDITIONS  SUBMIT
+        # Multiply by 10000.0 to limit rounding errors
+        radians = self.angle * pi / 180.0
+        px = self.x + cos(radians) * 6000.0
+        py = self.y + sin(radians) * 6000.0
+
+        if move.shield:
+            self.activate_shield()
+            print(round(px), round(py), SHIELD)
+        elif move.boost:
+            self.boost_available = False
+            print(round(px), round(py), BOOST)
+        else:
+            thrust = ceil(move.thrust)
+            if thrust > 100:
+                thrust = 100
+            elif thrust < 0:
+                thrust = 0
+
+            print(round(px), round(py), thrust)
+
+    def activate_shield(self):
+        self.is_shield_activated = True
+        self.turn_activated_shield = self.race_turn
+
+    def shield_ready(self):
+        return (self.race_turn - self.turn_activated_shield >= SHIELD_COOLDOWN)
+
+    def clone(self):
+        '''
+        Return a copy of the pod
+        :return: Pod
+        '''
+        clone = Pod.__new__(Pod)
+        clone.id = self.id
+        clone.radius = self.radius
+        clone.set_state(self.get_state())
+        # clone.partner = self.partner
+        clone.check_next_checkpoint_id = self.check_next_checkpoint_id
+        clone.switch_checkpoint = self.switch_checkpoint
+        clone.waiting_turn = self.waiting_turn
+        clone.is_hunter = self.is_hunter
+        clone.waiting_point = self.waiting_point
+
+        return clone
+
+
+class Move:
+    def __init__(self, angle, thrust):
+        self.angle = angle  # between [-18 , 18]
+        self.thrust = thrust  # between [0, 100]
+        self.shield = (thrust == SHIELD)
+        self.boost = (thrust == BOOST)
+
+    def clone(self):
+        move = Move(self.angle, self.thrust)
+        move.shield = self.shield
+        move.boost = self.boost
+        return move
+
+    def get_genes(self):
+        '''
+        Return the genes of the move as stored in a solution: [angle, thrust, shield, boost]
+        '''
+        return [self.angle, self.thrust, float(self.shield), float(self.boost)]
+
+    @staticmethod
+    def from_genes(genes):
+        move = Move(genes[GENE_ANGLE], genes[GENE_THRUST])
+        move.shield = bool(genes[GENE_SHIELD])
+        move.boost = bool(genes[GENE_BOOST])
+        return move
+
+    @staticmethod
+    def mutate(moves, amplitudes, mask=True):
+        '''
+        Mutate in place the genes of the moves, the random numbers of all the moves being drawn at once
+        @param moves: genes of the moves shaped (..., pods, moves, genes), the pods being cho and gall
+        @param amplitudes: amplitude of the mutation of each move, broadcastable to (..., pods, moves)
+        @param mask: True for the moves to mutate, broadcastable to (..., pods, moves)
+        '''
+        shape = moves.shape[:-1]
+        uniforms = rng.random((2,) + shape)
+        chances = rng.integers(0, 101, (2,) + shape)
+        shield_ready, boost_available = get_pod_abilities()
+
+        angles = moves[..., GENE_ANGLE]
+        ramin = numpy.maximum(angles - 36.0 * amplitudes, -18.0)
+        ramax = numpy.minimum(angles + 36.0 * amplitudes, 18.0)
+
+        thrusts = moves[..., GENE_THRUST]
+        pmin = numpy.clip(thrusts - 100 * amplitudes, MIN_THRUST, 100)
+        pmax = numpy.clip(thrusts + 200 * amplitudes, MIN_THRUST, 100)
+
+        shields = shield_ready & (chances[0] < SHIELD_CHANCE)
+        boosts = boost_available & ~shields & (chances[1] < BOOST_CHANCE)
+
+        mutated_moves = numpy.empty_like(moves)
+        mutated_moves[..., GENE_ANGLE] = ramin + (ramax - ramin) * uniforms[0]
+        mutated_moves[..., GENE_THRUST] = pmin + (pmax - pmin) * uniforms[1]
+        mutated_moves[..., GENE_SHIELD] = shields
+        mutated_moves[..., GENE_BOOST] = boosts
+
+        moves[...] = numpy.where(numpy.expand_dims(mask, -1), mutated_moves, moves)
+
+    @staticmethod
+    def cross(p1_moves, p2_moves):
+        '''
+        Return the genes of the moves crossing the genes of the moves of the two parents, all the moves being crossed at once
+        @param p1_moves, p2_moves: genes of the moves of the parents shaped (..., pods, moves, genes)
+        '''
+        chances = rng.integers(0, 101, (3,) + p1_moves.shape[:-1])
+        shield_ready, boost_available = get_pod_abilities()
+
+        weights = numpy.where(chances[0] < 50, 0.7, 0.3)
+        shields = (p1_moves[..., GENE_SHIELD] != 0.0) & (p2_moves[..., GENE_SHIELD] != 0.0) & (chances[1] < SHIELD_CHANCE) & shield_ready
+        boosts = (p1_moves[..., GENE_BOOST] != 0.0) & (p2_moves[..., GENE_BOOST] != 0.0) & (chances[2] < BOOST_CHANCE) & boost_available & ~shields
+
+        moves = numpy.empty_like(p1_moves)
+        moves[..., GENE_ANGLE] = weights * p1_moves[..., GENE_ANGLE] + (1.0 - weights) * p2_moves[..., GENE_ANGLE]
+        moves[..., GENE_THRUST] = weights * p1_moves[..., GENE_THRUST] + (1.0 - weights) * p2_moves[..., GENE_THRUST]
+        moves[..., GENE_SHIELD] = shields
+        moves[..., GENE_BOOST] = boosts
+
+        return moves
+
+
+class Solution:
+    def __init__(self, population=None, row=0):
+        '''
+        @param population: matrix holding the genes of the solutions, one row per solution (a new one is created if None)
+        @param row: row of the population holding the genes of this solution
+        '''
+        if population is None:
+            population = numpy.zeros((1, GENOME_SIZE))
+
+        self.set_row(population, row)
+        self.move_shield_1 = -1
+        self.move_shield_2 = -1
+        self.cho = None
+        self.gall = None
+        self.boss1 = None
+        self.boss2 = None
+        self.result = -inf
+        self.result1 = -inf
+        self.result2 = -inf
+
+        self.checked1 = 0
+        self.next_checkpoint_id1 = 0
+        self.checked2 = 0
+        self.next_checkpoint_id2 = 0
+
+        # Multi Objectives approach
+        self.nb_ckpt = 0  # Number of validated checkpoints
+        self.distance_next_ckpt = 0.0  # Distance to next ckpt in 6 moves => To minimize
+        self.average_thrust = 0.0  # Average thrust during 6 moves => To maximize
+        self.distance_future_ckpt = 0.0  # Distance to ckpt +2 in 6 moves => To minimize
+        self.rank = 0  # index of the Pareto front of the solution in the population
+        self.crowding_distance = 0.0  # distance to the solutions around on its Pareto front
+
+    def set_row(self, population, row):
+        '''
+        Attach the solution to a row of the population matrix
+        '''
+        self.row = row
+        self.genes = population[row]
+        self.moves = self.genes.reshape(2, NB_MOVES, NB_GENES)  # view on the genes by pod and by move
+
+    def get_move(self, index_pod, index):
+        '''
+        Return the Move of the pod (0 for cho, 1 for gall) at the given index
+        '''
+        return Move.from_genes(self.moves[index_pod, index].tolist())
+
+    def generate_deterministic_solution(self, is_first_generation):
+        '''
+        Create a new solution using a deterministic approach
+        @is_first_generation: True generate all moves, False delete first move and generate last one
+        @return None
+        '''
+
+        if is_first_generation:
+            self.moves[0] = [move.get_genes() for move in self._generate_IA_moves(cho)]
+            self.moves[1] = [move.get_genes() for move in self._generate_IA_moves(gall)]
+        else:
+            self.moves[:, :-1] = self.moves[:, 1:]
+            self.moves[0, -1] = self._generate_IA_next_move(cho, 0).get_genes()
+            self.moves[1, -1] = self._generate_IA_next_move(gall, 1).get_genes()
+
+    def _generate_IA_moves(self, pod):
+        backup = pod.get_state()
+
+        list_moves = deque()
+        if pod.is_hunter:
+            list_moves.append(pod.generate_move_IA_hunter(boss_runner))
+        else:
+            list_moves.append(pod.generate_move_IA())
+
+        if pod.is_hunter:
+            for j in range(NB_MOVES - 1):
+                pod.apply(list_moves[j].angle, list_moves[j].thrust)
+                play([pod])
+                list_moves.append(pod.generate_move_IA_hunter(boss_runner))
+        else:
+            for j in range(NB_MOVES - 1):
+                pod.apply(list_moves[j].angle, list_moves[j].thrust)
+                play([pod])
+                list_moves.append(pod.generate_move_IA())
+
+        pod.set_state(backup)
+        return list_moves
+
+    def _generate_IA_next_move(self, pod, index_pod):
+        '''
+        Generate the last move of the pod after playing its NB_MOVES - 1 first moves
+        '''
+        backup = pod.get_state()
+
+        for angle, thrust, shield, boost in self.moves[index_pod, :NB_MOVES - 1].tolist():
+            pod.apply(angle, thrust)
+            play([pod])
+
+        if pod.is_hunter:
+            move = pod.generate_move_IA_hunter(boss_runner)
+        else:
+            move = pod.generate_move_IA()
+
+        pod.set_state(backup)
+        return move
+
+    def clone(self, population=None, row=0):
+        '''
+        Return a copy of the solution, its genes being copied in the given row of the population matrix
+        '''
+        clone = Solution(population, row)
+
+        clone.move_shield_1 = self.move_shield_1
+        clone.move_shield_2 = self.move_shield_2
+
+        clone.genes[:] = self.genes
+
+        clone.result = self.result
+        clone.result1 = self.result1
+        clone.result2 = self.result2
+
+        clone.checked1 = self.checked1
+        clone.next_checkpoint_id1 = self.next_checkpoint_id1
+        clone.checked2 = self.checked2
+        clone.next_checkpoint_id2 = self.next_checkpoint_id2
+
+        clone.nb_ckpt = self.nb_ckpt
+        clone.distance_next_ckpt = self.distance_next_ckpt
+        clone.average_thrust = self.average_thrust
+        clone.distance_future_ckpt = self.distance_future_ckpt
+        clone.rank = self.rank
+        clone.crowding_distance = self.crowding_distance
+
+        return clone
+
+    def get_objectives(self):
+        '''
+        Return the objectives to maximize: the result (that holds the score of the hunter) and the objectives of the runner
+        '''
+        return self.result, self.nb_ckpt, -self.distance_next_ckpt, self.average_thrust, -self.distance_future_ckpt
+
+    def set_objectives(self):
+        '''
+        Set the objectives of the runner once the moves have been played
+        '''
+        if cho.is_hunter:
+            runner, index_runner, save_runner = gall, 1, save_gall
+        else:
+            runner, index_runner, save_runner = cho, 0, save_cho
+
+        self.nb_ckpt = runner.checked - save_runner[STATE_CHECKED]
+        self.distance_next_ckpt = runner.get_distance(runner.get_next_checkpoint())
+        self.distance_future_ckpt = runner.get_distance(track.checkpoints[track.next_ids[runner.next_checkpoint_id]])
+        self.average_thrust = float(self.moves[index_runner, :, GENE_THRUST].mean())
+
+    def is_shield_activated(self, index, move_shield, moves, pod):
+        '''
+        True if the shield is activated at the current move
+        '''
+        if index == 0:
+            is_shield_activated = pod.is_shield_activated or moves[index][GENE_SHIELD]
+        elif index != 0:
+            is_shield_activated = pod.is_shield_activated and (pod.turn_activated_shield + 3 >= pod.race_turn + index)
+            is_shield_activated = is_shield_activated or ((move_shield + 3) >= index) or (moves[index][GENE_SHIELD])
+
+        return is_shield_activated
+
+    def validate(self, moves):
+        '''
+        Apply the rules of the game on the shields and boosts
+        @param moves: genes of the solution as lists by pod and by move, modified in place
+        '''
+
+        counter_boost1 = 0
+        counter_boost2 = 0
+
+        self.move_shield_1 = -inf
+        self.move_shield_2 = -inf
+
+        # The boost is only allowed close to the next entry point, the pods do not move during the validation
+        is_boost_distance_1 = cho.get_distance2(cho.get_next_entry_point()) <= SQUARED_MIN_DISTANCE_BOOST
+        is_boost_distance_2 = gall.get_distance2(gall.get_next_entry_point()) <= SQUARED_MIN_DISTANCE_BOOST
+
+        for i in range(NB_MOVES):
+
+            move1 = moves[0][i]
+            move2 = moves[1][i]
+
+            if move1[GENE_SHIELD] and self.move_shield_1 != -1:
+                self.move_shield_1 = i
+
+            if move2[GENE_SHIELD] and self.move_shield_2 != -1:
+                self.move_shield_2 = i
+
+            is_shield_activated_1 = self.is_shield_activated(i, self.move_shield_1, moves[0], cho)
+            is_shield_activated_2 = self.is_shield_activated(i, self.move_shield_2, moves[1], gall)
+
+            # TODO : add angle check for boost
+            if move1[GENE_BOOST] and cho.boost_available and not is_shield_activated_1 and not counter_boost1 > 0 and is_boost_distance_1:
+                move1[GENE_THRUST] = 650.0
+                counter_boost1 += 1
+            else:
+                move1[GENE_BOOST] = 0.0
+
+            if move2[GENE_BOOST] and gall.boost_available and not is_shield_activated_2 and not counter_boost2 > 0 and is_boost_distance_2:
+                move2[GENE_THRUST] = 650.0
+                counter_boost2 += 1
+            else:
+                move2[GENE_BOOST] = 0.0
+
+            if is_shield_activated_1:
+                move1[GENE_THRUST] = 0.0
+            else:
+                move1[GENE_SHIELD] = 0.0
+
+            if is_shield_activated_2:
+                move2[GENE_THRUST] = 0.0
+            else:
+                move2[GENE_SHIELD] = 0.0
+
+    def evaluation(self):
+
+        if cho.timeout == 0:  # or gall.timeout == 0:
+            # timeout
+            return -100000
+
+        score = 0.0
+        if cho.is_hunter:
+            score += cho.score_hunter() + boss_runner.get_distance(cho.waiting_point)  # - abs((boss_runner.get_angle(cho.waiting_point) - boss_runner.get_angle(cho)))
+        else:
+            score += cho.score()
+
+        if gall.is_hunter:
+
+            boss_next_checkpoint = boss_runner.get_next_checkpoint()
+            angle_boss_gall = boss_runner.get_delta_angle_orientation(gall)
+            angle_gall_boss = gall.get_delta_angle_orientation(boss_runner)
+
+            # distance_boss = boss_runner.get_distance2(boss_next_checkpoint)
+            # distance_boss = boss_runner.get_distance2(gall)
+            distance_boss = boss_runner.get_distance(gall)
+            angle_boss_pod = gall.get_delta_angle_orientation(boss_runner)
+            if distance_boss > 1500.0 and abs(angle_gall_boss) <= 20.0:  # 1500*1500 - and gall.score_hunter() < 2000.0:
+                coeff_kill_boss = 0.0
+                coeff_waiting_point = 1.0
+            else:
+                coeff_kill_boss = 1.0  # 1-(distance_boss/2000.0)
+                coeff_waiting_point = 0.0  # 1.0 - coeff_kill_boss
+
+            if coeff_waiting_point:
+                score_waiting_point = coeff_waiting_point * gall.score_hunter()
+                # score_between_boss_checkpoint = coeff_waiting_point * -(abs(boss_runner.get_delta_angle_orientation(gall.waiting_point)) - abs(angle_boss_gall))
+                score += score_waiting_point  # + score_between_boss_checkpoint
+            else:
+                score_block_boss_runner = coeff_kill_boss * -distance_boss  # boss_runner.get_distance(gall.waiting_point)
+                score_between_boss_checkpoint = coeff_kill_boss * -(abs(boss_runner.get_delta_angle_orientation(boss_next_checkpoint)) - abs(angle_boss_gall))
+                score_look_for_runner = coeff_kill_boss * -abs(angle_gall_boss)
+                score_between_boss_checkpoint = coeff_kill_boss * -(abs(boss_runner.get_delta_angle_orientation(boss_next_checkpoint)) - abs(angle_boss_gall))
+                score += score_block_boss_runner + score_look_for_runner
+
+        else:
+            score += gall.score()
+
+        return score
+
+    def score(self):
+        moves1, moves2 = self.moves.tolist()
+        keys = [(moves1[i][GENE_ANGLE], moves1[i][GENE_THRUST], moves2[i][GENE_ANGLE], moves2[i][GENE_THRUST]) for i in range(NB_MOVES)]
+
+        # Resume the simulation from the longest prefix of moves already played during this turn
+        node = prefix_cache.get_longest_prefix(keys)
+        if node.depth > 0:
+            cho_state, gall_state, boss1_state, boss2_state, boss1_collided, boss2_collided, check_ckpts = node.state
+            cho.set_state(cho_state)
+            gall.set_state(gall_state)
+            boss1.set_state(boss1_state)
+            boss2.set_state(boss2_state)
+            check_ckpts = list(check_ckpts)
+        else:
+            boss1_collided = False
+            boss2_collided = False
+            check_ckpts = [True, True, True, True]
+
+        # Play out the turns
+        for i in range(node.depth, NB_MOVES):
+            # Apply all the moves to the pods before playing
+            cho.apply(moves1[i][GENE_ANGLE], moves1[i][GENE_THRUST])
+            gall.apply(moves2[i][GENE_ANGLE], moves2[i][GENE_THRUST])
+
+            if boss1_collided:
+                boss1.apply_boss()
+            else:
+                boss1.set_state(caches_boss1[i])
+
+            if boss2_collided:
+                boss2.apply_boss()
+            else:
+                boss2.set_state(caches_boss2[i])
+
+            b1, b2 = play([cho, gall, boss1, boss2], check_ckpts)
+
+            # flag if two checkpoints are really close to avoid ignoring checkpoints for next moves
+            check_ckpts[0] = (save_cho[STATE_CHECKED] == cho.checked)  # and cho_not_two_checkpoints
+            check_ckpts[1] = (save_gall[STATE_CHECKED] == gall.checked)  # and gall_not_two_checkpoints
+            check_ckpts[2] = (save_boss1[STATE_CHECKED] == boss1.checked)  # and boss1_not_two_checkpoints
+            check_ckpts[3] = (save_boss2[STATE_CHECKED] == boss2.checked)  # and boss2_not_two_checkpoints
+
+            boss1_collided = boss1_collided or b1
+            boss2_collided = boss2_collided or b2
+
+            cho.race_turn += 1
+            gall.race_turn += 1
+            boss1.race_turn += 1
+            boss2.race_turn += 1
+
+            node = prefix_cache.add(node, keys[i], (cho.get_state(), gall.get_state(), boss1.get_state(), boss2.get_state(),
+                                                    boss1_collided, boss2_collided, tuple(check_ckpts)))
+
+        prefix_cache.touch(node)
+
+        # Compute the score
+        self.result = self.evaluation()
+        if MULTI_OBJECTIVE:
+            self.set_objectives()
+
+        load_pod_states(save_cho, save_gall, save_boss1, save_boss2)
+
+        return self.result
+
+
+class PrefixNode:
+    def __init__(self, parent, key, state):
+        self.parent = parent
+        self.key = key  # genes of the move played to reach this node
+        self.depth = 0 if parent is None else parent.depth + 1  # number of moves played
+        self.state = state  # state of the simulation after playing the moves of the prefix
+        self.children = {}
+
+
+class PrefixCache:
+    '''
+    Trie of the genome prefixes simulated during the current turn
+    Each level of the trie is one move, a node holds the state of the simulation after playing its prefix
+    so the score of a solution can resume from the longest prefix already simulated
+    The number of nodes is bounded, the least recently used nodes are evicted first
+    A node is always used more recently than its descendants so the evicted nodes are leaves
+    '''
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.root = PrefixNode(None, None, None)
+        self.nodes = OrderedDict()  # nodes of the trie from the least to the most recently used
+        self.nb_hits = 0  # number of moves not simulated thanks to the cache
+        self.nb_misses = 0  # number of moves simulated
+
+    def clear(self):
+        '''
+        Forget all the prefixes, must be called at each new turn of the game
+        The links from the parents to their children are cut so that the nodes are freed without the garbage collector
+        '''
+        self.root.children.clear()
+        for node in self.nodes:
+            node.children.clear()
+
+        self.root = PrefixNode(None, None, None)
+        self.nodes.clear()
+
+    def get_longest_prefix(self, keys):
+        '''
+        Return the deepest node of the trie matching the beginning of the keys
+        '''
+        node = self.root
+        while node.depth < len(keys) and keys[node.depth] in node.children:
+            node = node.children[keys[node.depth]]
+
+        self.touch(node)
+        self.nb_hits += node.depth
+        self.nb_misses += len(keys) - node.depth
+        return node
+
+    def add(self, parent, key, state):
+        '''
+        Add the state reached after playing the move key from the parent node
+        Return the new node
+        '''
+        if self.max_size == 0:
+            return parent
+
+        node = PrefixNode(parent, key, state)
+        parent.children[key] = node
+        self.nodes[node] = None
+        self.touch(parent)  # the evicted node is always a leaf
+
+        if len(self.nodes) > self.max_size:
+            evicted, _ = self.nodes.popitem(last=False)
+            if evicted.parent.children.get(evicted.key) is evicted:
+                del evicted.parent.children[evicted.key]
+
+        return node
+
+    def touch(self, node):
+        '''
+        Mark the node and its ancestors as the most recently used (ancestors being more recent than their children)
+        '''
+        while node.parent is not None:
+            if node in self.nodes:
+                self.nodes.move_to_end(node)
+            node = node.parent
+
+
+class GeneticAlgorithm():
+    def __init__(self):
+        self.solutions = []  # current generation of solutions
+        self.parents = []  # selected parents for crossing
+
+        # Genes of the solutions, one row per solution: the population, the clone of the best solution and the children
+        self.population = numpy.zeros((2 * NB_POPULATION + 1, GENOME_SIZE))
+        self.nb_rows = 0  # number of rows used in the population matrix
+        self.children = []  # used only for the preselection approach
+
+        self.average = 0.0
+        self.maximum = 0.0
+        self.apocalypse = 0
+        self.nb_scored = 0  # number of solutions scored by the last generation
+
+    def tournament(self):
+        '''
+        Select the parents for crossing with the tournament algorithm
+        @return: highest score of selected parents
+        '''
+        self.parents.clear()
+        # self.parents.append(self.solutions[0]) # Add best solution to be sure it is once
+        self.parents.append(0)
+
+        maximum_result = -10000
+
+        # The contestants of all the tournaments are drawn at once, the first one of each row being the first winner
+        for contestants in rng.integers(0, NB_POPULATION, (NB_TOURNAMENT, SIZE_TOURNAMENT + 1)).tolist():
+            index_winner = contestants[0]
+            winner = self.solutions[index_winner]
+            for index_opponent in contestants[1:]:
+
+                if self.is_better(self.solutions[index_opponent], winner):
+                    index_winner = index_opponent
+                    winner = self.solutions[index_opponent]
+
+            if winner.result > maximum_result:
+                maximum_result = winner.result
+
+            self.parents.append(index_winner)
+            # self.parents.append(winner.clone())
+
+        return maximum_result
+
+    @staticmethod
+    def is_better(solution, other):
+        '''
+        Compare the results of the solutions or, in multi objectives, their Pareto fronts then their crowding distances
+        '''
+        if MULTI_OBJECTIVE:
+            return solution.rank < other.rank or (solution.rank == other.rank and solution.crowding_distance > other.crowding_distance)
+        else:
+            return solution.result > other.result
+
+    def rank_solutions(self):
+        '''
+        Set the Pareto front and the crowding distance of the solutions (NSGA-II)
+        '''
+        objectives = numpy.array([solution.get_objectives() for solution in self.solutions])
+        ranks = get_non_dominated_ranks(objectives)
+        crowding_distances = get_crowding_distances(objectives, ranks)
+
+        for solution, rank, crowding_distance in zip(self.solutions, ranks.tolist(), crowding_distances.tolist()):
+            solution.rank = rank
+            solution.crowding_distance = crowding_distance
+
+    def select_solutions(self):
+        '''
+        Keep the NB_POPULATION best solutions sorted by result
+        In multi objectives, the solutions are kept by Pareto front then by crowding distance
+        '''
+        if MULTI_OBJECTIVE:
+            self.rank_solutions()
+            self.solutions.sort(key=lambda solution: (solution.rank, -solution.crowding_distance))
+            self.solutions = self.solutions[0:NB_POPULATION]
+
+        self.solutions.sort(key=attrgetter('result'), reverse=True)
+        self.solutions = self.solutions[0:NB_POPULATION]
+
+    def get_moves(self, solutions):
+        '''
+        Return a copy of the genes of the solutions shaped (solutions, pods, moves, genes)
+        '''
+        return self.population[[solution.row for solution in solutions]].reshape(len(solutions), 2, NB_MOVES, NB_GENES)
+
+    def set_moves(self, solutions, moves):
+        '''
+        Apply the rules of the game to the genes of each solution and store them
+        '''
+        # The validation reads and writes the genes one by one, which is faster on lists than on numpy scalars
+        moves = moves.tolist()
+        for solution, solution_moves in zip(solutions, moves):
+            solution.validate(solution_moves)
+
+        if solutions:
+            self.population[[solution.row for solution in solutions]] = numpy.reshape(moves, (len(solutions), GENOME_SIZE))
+
+    def mutate_solutions(self, solutions, amplitudes, is_apocalypse=False):
+        '''
+        Mutate the solutions together
+        @param amplitudes: array of the amplitude of the mutation of each solution
+        '''
+        moves = self.get_moves(solutions)
+        Move.mutate(moves, amplitudes[:, None, None], get_mutation_mask(is_apocalypse))
+        self.set_moves(solutions, moves)
+
+    def cross_solutions(self, nb_children):
+        '''
+        Return the children crossing the genes of parents drawn among the selected parents
+        '''
+        parents = numpy.array(self.parents)[rng.integers(0, NB_TOURNAMENT + 1, (2, nb_children))].tolist()
+
+        children = [Solution(self.population, self.get_free_row()) for i in range(nb_children)]
+        moves = Move.cross(self.get_moves([self.solutions[i] for i in parents[0]]), self.get_moves([self.solutions[i] for i in parents[1]]))
+        self.set_moves(children, moves)
+
+        return children
+
+    def get_free_row(self):
+        '''
+        Return the index of the next free row of the population matrix
+        '''
+        self.nb_rows += 1
+        return self.nb_rows - 1
+
+    def compact_population(self):
+        '''
+        Move the genes of the current solutions to the first rows of the population matrix to free the next ones
+        '''
+        self.population[:len(self.solutions)] = self.population[[solution.row for solution in self.solutions]]
+        for i, solution in enumerate(self.solutions):
+            solution.set_row(self.population, i)
+
+        self.nb_rows = len(self.solutions)
+
+    def build_generation_proba(self, nb_solutions=NB_POPULATION):
+        '''
+        Build the next generation mutating and crossing the solutions
+        @param nb_solutions: number of the best solutions that can be mutated or give a child (reduced generation if lower than NB_POPULATION)
+        '''
+
+        maximum_parent = self.tournament()
+        crossing_probability = self.compute_probability_crossing(maximum_parent)
+
+        self.solutions.append(self.solutions[0].clone(self.population, self.get_free_row()))
+
+        # The random numbers of the generation are drawn at once and the mutations and crossings are applied
+        # to the genes of all the solutions together, the new solutions being scored together at the end
+        # All the mutations happen before the crossings: a child is crossed from parents already mutated in this generation
+        mutation_draws, crossing_draws = rng.random((2, nb_solutions))
+        is_apocalypse = self.apocalypse >= APOCALYPSE_NOW
+        if is_apocalypse:
+            mutation_probabilities = numpy.full(nb_solutions, APOCALYPSE_MUTATION)
+            is_mutated = numpy.ones(nb_solutions, dtype=bool)
+        else:
+            mutation_probabilities = numpy.array([self.compute_probability_mutation(solution.result) for solution in self.solutions[:nb_solutions]])
+            is_mutated = mutation_draws <= mutation_probabilities
+
+        mutants = [solution for solution, mutated in zip(self.solutions, is_mutated.tolist()) if mutated]
+        self.mutate_solutions(mutants, mutation_probabilities[is_mutated], is_apocalypse)
+
+        children = self.cross_solutions(int((crossing_draws <= crossing_probability).sum()))
+        self.solutions += children
+
+        self.nb_scored = len(mutants) + len(children)
+        new_average = sum(self.score_solutions(mutants + children))
+
+        self.select_solutions()
+        self.compact_population()
+
+        self.average = new_average / NB_POPULATION
+
+        if self.solutions[0].result > self.maximum:
+            self.maximum = self.solutions[0].result
+            self.apocalypse = 0
+        else:
+            self.apocalypse += 1
+
+    def score_solutions(self, solutions):
+        '''
+        Score the solutions one by one
+        @return: list of the results
+        '''
+
+        return [solution.score() for solution in solutions]
+
+    def update_avg_max(self, result):
+
+        self.average += result / NB_POPULATION
+        if result > self.maximum:
+            self.maximum = result
+
+    def compute_probability_crossing(self, maximum_parent):
+
+        if self.maximum <= self.average:  # all the solutions have the same result
+            return MIN_PROBA_CROSS
+        elif maximum_parent >= self.average:
+            return max(K1 * ((self.maximum - maximum_parent) / (self.maximum - self.average)), MIN_PROBA_CROSS)
+        else:
+            return K3
+
+    def compute_probability_mutation(self, result):
+
+        if self.maximum <= self.average:  # all the solutions have the same result
+            return MIN_PROBA_MUTATION
+        elif result >= self.average:
+            return max(K2 * ((self.maximum - result) / (self.maximum - self.average)), MIN_PROBA_MUTATION)
+        else:
+            return K4
+
+    def get_best_solution(self):
+        return self.solutions[0]
+
+    def generate_population(self, is_first_generation):
+        '''
+        Generate the population of solutions
+        The populations is sorted with the best solution first
+        @param is_first_generation: True if the generation is the really first one
+        @return: None
+        '''
+
+        self.maximum = -10000
+        self.average = 0.0
+
+        if is_first_generation:
+            self.solutions = []
+            self.nb_rows = 0
+
+            reference_solution = Solution(self.population, self.get_free_row())
+            reference_solution.generate_deterministic_solution(True)
+            self.solutions.append(reference_solution)
+
+            solutions = [Solution(self.population, self.get_free_row()) for i in range(NB_POPULATION - 1)]
+            self.set_moves(solutions, get_moves_from_reference(self.get_moves(solutions), reference_solution, True))
+            self.solutions += solutions
+
+            solutions_to_score = self.solutions
+        else:
+            self.solutions[0].generate_deterministic_solution(False)
+
+            solutions = self.solutions[2:NB_POPULATION]
+            self.set_moves(solutions, get_moves_from_reference(self.get_moves(solutions), self.solutions[0], False))
+
+            solutions_to_score = [self.solutions[0]] + self.solutions[2:NB_POPULATION]
+
+        for result in self.score_solutions(solutions_to_score):
+            self.update_avg_max(result)
+
+        self.select_solutions()
+        self.compact_population()
+
+
+class TimeBudget:
+    '''
+    Deadline of a turn measured with perf_counter_ns
+    Keep a moving estimate of the duration of a generation (COST_PERCENTILE of the last generations) and of the output
+    to decide how many solutions the next generation can evolve before the deadline
+    The duration of a reduced generation is estimated from a linear model of the duration by number of scored solutions,
+    the selection and the sort of the population having a cost that does not shrink with the number of evolved solutions
+    '''
+
+    def __init__(self, nb_samples=NB_COST_SAMPLES):
+        self.nb_scored = deque(maxlen=nb_samples)  # number of solutions scored by the last full generations
+        self.generation_costs = deque(maxlen=nb_samples)  # ns, durations of the last full generations
+        self.output_costs = deque(maxlen=nb_samples)  # ns, durations of the last outputs
+        self.generation_cost = 0.0  # ns, estimate of the duration of a full generation
+        self.output_cost = 0  # ns, estimate of the duration of the output
+        self.cost_model = None  # (fixed cost, cost by scored solution, margin) in ns, None if it must be fitted again
+
+        self.start_time = 0
+        self.deadline = 0
+        self.generation_start_time = 0
+        self.output_start_time = 0
+
+        # Statistics of the turn
+        self.setup_time = 0  # ns, time before the first generation
+        self.generations_time = 0  # ns, time spent in the generations
+        self.output_time = 0  # ns, time spent to write the output
+        self.nb_generations = 0
+        self.nb_reduced_generations = 0
+
+    def start_turn(self, time_limit=TURN_TIME_LIMIT, start_time=None):
+        '''
+        Start the clock of the turn
+        @param time_limit: ms to answer the turn
+        @param start_time: perf_counter_ns when the input of the turn has been received (now if None)
+        '''
+        self.start_time = time.perf_counter_ns() if start_time is None else start_time
+        self.deadline = self.start_time + int((time_limit - TIME_MARGIN) * 1000000)
+
+        self.setup_time = 0
+        self.generations_time = 0
+        self.output_time = 0
+        self.nb_generations = 0
+        self.nb_reduced_generations = 0
+
+    def get_elapsed_time(self):
+        '''
+        Return the time elapsed since the start of the turn in ms
+        '''
+        return (time.perf_counter_ns() - self.start_time) / 1000000.0
+
+    def get_remaining_time(self):
+        '''
+        Return the time left for the generations in ns, the estimated duration of the output being kept
+        '''
+        return self.deadline - self.output_cost - time.perf_counter_ns()
+
+    def get_generation_cost(self, nb_solutions):
+        '''
+        Return the estimated duration in ns of a generation evolving nb_solutions solutions
+        '''
+        if nb_solutions >= NB_POPULATION or len(self.generation_costs) < MIN_NB_COST_SAMPLES:
+            return self.generation_cost
+
+        if self.cost_model is None:
+            # Least squares fit of the duration by number of scored solutions
+            n = len(self.generation_costs)
+            mean_scored = sum(self.nb_scored) / n
+            mean_cost = sum(self.generation_costs) / n
+            variance = sum((nb_scored - mean_scored) * (nb_scored - mean_scored) for nb_scored in self.nb_scored)
+            covariance = sum((nb_scored - mean_scored) * (cost - mean_cost) for nb_scored, cost in zip(self.nb_scored, self.generation_costs))
+            slope = covariance / variance if variance > 0 else 0.0
+            intercept = mean_cost - slope * mean_scored
+
+            margin = get_percentile([cost - intercept - slope * nb_scored for nb_scored, cost in zip(self.nb_scored, self.generation_costs)], COST_PERCENTILE)
+            self.cost_model = (max(intercept, 0.0), max(slope, 0.0), max(margin, 0.0))
+
+        # A generation evolving n solutions scores at most n mutations and n children
+        fixed_cost, scored_cost, margin = self.cost_model
+        return min(fixed_cost + scored_cost * 2 * nb_solutions + margin, self.generation_cost)
+
+    def get_nb_solutions(self):
+        '''
+        Return the number of solutions the next generation can evolve before the deadline:
+        NB_POPULATION if a full generation fits, less for a reduced generation, 0 to stop
+        '''
+        remaining_time = self.get_remaining_time()
+        if not self.generation_costs:
+            # No estimate yet: the duration of the setup of the turn is taken as the duration of a generation
+            return NB_POPULATION if remaining_time >= time.perf_counter_ns() - self.start_time else 0
+
+        for nb_solutions in range(NB_POPULATION, MIN_NB_SOLUTIONS - 1, -1):
+            if remaining_time >= self.get_generation_cost(nb_solutions):
+                return nb_solutions
+
+        return 0
+
+    def start_generation(self):
+        self.generation_start_time = time.perf_counter_ns()
+        if self.nb_generations == 0:
+            self.setup_time = self.generation_start_time - self.start_time
+
+    def end_generation(self, nb_solutions=NB_POPULATION, nb_scored=0):
+        '''
+        Add the duration of the generation to the estimate if it has evolved the whole population
+        @param nb_scored: number of solutions scored by the generation
+        '''
+        cost = time.perf_counter_ns() - self.generation_start_time
+        self.generations_time += cost
+        self.nb_generations += 1
+
+        if nb_solutions < NB_POPULATION:
+            self.nb_reduced_generations += 1
+        else:
+            self.nb_scored.append(nb_scored)
+            self.generation_costs.append(cost)
+            self.generation_cost = get_percentile(self.generation_costs, COST_PERCENTILE)
+            self.cost_model = None
+
+    def start_output(self):
+        self.output_start_time = time.perf_counter_ns()
+
+    def end_output(self):
+        self.output_time = time.perf_counter_ns() - self.output_start_time
+        self.output_costs.append(self.output_time)
+        self.output_cost = max(self.output_costs)
+
+    def get_turn_time(self):
+        '''
+        Return the time from the start of the turn to the end of the output in ns
+        '''
+        return self.output_start_time + self.output_time - self.start_time
+
+
+class Telemetry:
+    '''
+    Preallocated buffer of the records of the generations of a turn (TELEMETRY_GENERATION_DTYPE),
+    written on the stream once per turn outside of the timed section
+    '''
+
+    def __init__(self, stream, telemetry_format=TELEMETRY_FORMAT, capacity=TELEMETRY_CAPACITY):
+        '''
+        @param stream: text stream, the binary records are written on its buffer
+        '''
+        self.stream = stream
+        self.format = telemetry_format
+        self.generations = numpy.zeros(capacity, dtype=TELEMETRY_GENERATION_DTYPE)
+        self.nb_records = 0
+
+    def write_header(self):
+        if self.format == 'ndjson':
+            configuration = {'nb_ckpt': checkpointCount, 'nb_moves': NB_MOVES, 'nb_population': NB_POPULATION, 'nb_tournament': NB_TOURNAMENT}
+            self.stream.write(json.dumps({'configuration': configuration}) + '\n')
+        elif self.format == 'binary':
+            header = numpy.array([(TELEMETRY_MAGIC, checkpointCount, NB_MOVES, NB_POPULATION, NB_TOURNAMENT)], dtype=TELEMETRY_HEADER_DTYPE)
+            self.stream.buffer.write(header.tobytes())
+        self.stream.flush()
+
+    def record(self, turn, generation, nb_solutions, ga, elapsed):
+        '''
+        Add the record of a generation of the genetic algorithm
+        @param elapsed: time elapsed since the start of the turn in ms
+        '''
+        if self.nb_records == len(self.generations):
+            self.generations = numpy.concatenate([self.generations, numpy.zeros_like(self.generations)])
+
+        self.generations[self.nb_records] = (turn, generation, nb_solutions, ga.apocalypse, ga.get_best_solution().result, ga.average, ga.maximum, elapsed)
+        self.nb_records += 1
+
+    def flush(self, turn, best_score, budget):
+        '''
+        Write the record of the turn and the records of its generations then empty the buffer
+        '''
+        turn_record = numpy.array([(turn, cho.checked, gall.checked, self.nb_records, budget.nb_reduced_generations, best_score,
+                                    budget.setup_time / 1000000.0, budget.generations_time / 1000000.0, budget.output_time / 1000000.0,
+                                    budget.get_turn_time() / 1000000.0,
+                                    budget.generation_cost / 1000000.0,
+                                    sum(budget.generation_costs) / len(budget.generation_costs) / 1000000.0 if budget.generation_costs else 0.0)],
+                                  dtype=TELEMETRY_TURN_DTYPE)
+        generations = self.generations[:self.nb_records]
+
+        if self.format == 'ndjson':
+            line = {name: turn_record[name][0].item() for name in TELEMETRY_TURN_DTYPE.names}
+            line['records'] = {name: generations[name].tolist() for name in TELEMETRY_GENERATION_DTYPE.names}
+            self.stream.write(json.dumps(line) + '\n')
+        elif self.format == 'binary':
+            self.stream.buffer.write(turn_record.tobytes() + generations.tobytes())
+        self.stream.flush()
+
+        self.nb_records = 0
+
+
+# UTILS
+def get_percentile(values, percentile):
+    '''
+    Return the percentile of the values (nearest rank), faster than numpy.percentile on a few values
+    '''
+    values = sorted(values)
+    return values[min(int(ceil(percentile / 100.0 * len(values))), len(values)) - 1]
+
+
+def get_non_dominated_ranks(objectives):
+    '''
+    Fast non-dominated sort of NSGA-II
+    @param objectives: array of the objectives to maximize, one row per solution
+    @return: array of the index of the Pareto front of each solution (0 for the non-dominated solutions)
+    '''
+    # dominates[i, j] is True if the solution i dominates the solution j
+    dominates = (objectives[:, None, :] >= objectives[None, :, :]).all(axis=2) & (objectives[:, None, :] > objectives[None, :, :]).any(axis=2)
+    nb_dominating = dominates.sum(axis=0)
+
+    ranks = numpy.zeros(len(objectives), dtype=int)
+    rank = 0
+    front = numpy.flatnonzero(nb_dominating == 0)
+    while len(front) > 0:
+        ranks[front] = rank
+        nb_dominating -= dominates[front].sum(axis=0)
+        nb_dominating[front] = -1
+        front = numpy.flatnonzero(nb_dominating == 0)
+        rank += 1
+
+    return ranks
+
+
+def get_crowding_distances(objectives, ranks):
+    '''
+    Crowding distance of NSGA-II computed on the unique objectives of each front (Fortin and Parizeau, 2013):
+    duplicated solutions share the same distance instead of hiding the solutions around them
+    @return: array of the crowding distance of each solution
+    '''
+    distances = numpy.zeros(len(objectives))
+
+    for rank in range(ranks.max() + 1):
+        front = numpy.flatnonzero(ranks == rank)
+        points, inverse = numpy.unique(objectives[front], axis=0, return_inverse=True)
+        front_distances = numpy.zeros(len(points))
+
+        for m in range(points.shape[1]):
+            order = numpy.argsort(points[:, m])
+            values = points[order, m]
+            front_distances[order[0]] = inf
+            front_distances[order[-1]] = inf
+            if values[-1] > values[0]:
+                front_distances[order[1:-1]] += (values[2:] - values[:-2]) / (values[-1] - values[0])
+
+        distances[front] = front_distances[inverse.reshape(-1)]
+
+    return distances
+
+
+def build_trigonometry_tables(resolution):
+    '''
+    Return the cosine and sine tables of the angles between 0 and 360 degrees by step of resolution degrees
+    '''
+    nb_angles = int(round(360.0 / resolution)) + 1
+    angles_radians = numpy.arange(nb_angles) * resolution * DEGREES_TO_RADIANS
+    return numpy.cos(angles_radians).tolist(), numpy.sin(angles_radians).tolist()
+
+
+def get_trigonometry_error(resolution=TRIGONOMETRY_RESOLUTION):
+    '''
+    Return the maximum error of the lookup tables compared to the exact cosine and sine of the angles between 0 and 360 degrees
+    '''
+    cos_table, sin_table = build_trigonometry_tables(resolution)
+    angles = numpy.linspace(0.0, 360.0, 360001, endpoint=False)
+    index = (angles / resolution + 0.5).astype(int)
+    error_cos = numpy.abs(numpy.array(cos_table)[index] - numpy.cos(angles * DEGREES_TO_RADIANS)).max()
+    error_sin = numpy.abs(numpy.array(sin_table)[index] - numpy.sin(angles * DEGREES_TO_RADIANS)).max()
+    return max(error_cos, error_sin)
+
+
+def set_fast_trigonometry(is_fast):
+    '''
+    Switch the lookup tables of the cosine and sine on or off, the tables are built the first time they are switched on
+    '''
+    global FAST_TRIGONOMETRY, COS_TABLE, SIN_TABLE
+
+    FAST_TRIGONOMETRY = is_fast
+    if is_fast and COS_TABLE is None:
+        COS_TABLE, SIN_TABLE = build_trigonometry_tables(TRIGONOMETRY_RESOLUTION)
+
+
+TRIGONOMETRY_TABLE_FACTOR = 1.0 / TRIGONOMETRY_RESOLUTION
+COS_TABLE = SIN_TABLE = None
+set_fast_trigonometry(FAST_TRIGONOMETRY)
+
+
+def set_random_seed(seed):
+    '''
+    Reset the random generator of the genetic operators to make the runs reproducible
+    @param seed: int, sequence of ints or None
+    '''
+    global rng
+    rng = numpy.random.default_rng(seed)
+
+
+rng = numpy.random.default_rng(RANDOM_SEED)
+
+
+def get_pod_abilities():
+    '''
+    Return the shield and boost availability of cho and gall shaped (pods, 1) to broadcast over the moves
+    '''
+    return numpy.array([[cho.shield_ready()], [gall.shield_ready()]]), numpy.array([[cho.boost_available], [gall.boost_available]])
+
+
+def get_mutation_mask(is_apocalypse):
+    '''
+    Return True for the moves to mutate: the last NB_MOVES_TO_MUTATE moves after the first turns, all the moves otherwise
+    '''
+    if race_turn > 2 and not is_apocalypse:
+        return numpy.arange(NB_MOVES) >= NB_MOVES - NB_MOVES_TO_MUTATE
+    else:
+        return True
+
+
+def get_moves_from_reference(moves, reference_solution, is_first_generation):
+    '''
+    Return the genes of new solutions mutating the moves of the reference solution
+    @param moves: genes of the solutions shaped (solutions, pods, moves, genes), only used if not is_first_generation
+    @param is_first_generation: True mutate all the moves of the reference, False shift the moves of the solutions
+    and add the mutated last move of the reference
+    '''
+    amplitudes = rng.uniform(COEFFICIENT_MIN_MUTATION_FROM_REF, COEFFICIENT_MAX_MUTATION_FROM_REF, moves.shape[:-1])
+
+    if is_first_generation:
+        new_moves = numpy.broadcast_to(reference_solution.moves, moves.shape).copy()
+        Move.mutate(new_moves, amplitudes)
+    else:
+        new_moves = numpy.concatenate([moves[:, :, 1:], numpy.broadcast_to(reference_solution.moves[:, -1:], moves[:, :, -1:].shape)], axis=2)
+        Move.mutate(new_moves, amplitudes, numpy.arange(NB_MOVES) == NB_MOVES - 1)
+
+    return new_moves
+
+
+def formalize_angle(angle):
+    # Replace the angle between [0 360] degrees
+    # mod operator is slower than if comparison
+    if angle >= 360.0:
+        return angle - 360.0
+    elif angle < 0.0:
+        return angle + 360.0
+    else:
+        return angle
+
+
+def save_pod_states():
+    return cho.get_state(), gall.get_state(), boss1.get_state(), boss2.get_state()
+
+
+def load_pod_states(save_cho, save_gall, save_boss1, save_boss2):
+    cho.set_state(save_cho)
+    gall.set_state(save_gall)
+    boss1.set_state(save_boss1)
+    boss2.set_state(save_boss2)
+
+
+def generate_boss_cache():
+    '''
+    Predict the states of the bosses for the next NB_MOVES turns
+    The prediction of the previous turn is shifted by one turn when the bosses followed it
+    '''
+    global boss_cache_turn
+
+    is_following = (boss_cache_turn == race_turn - 1)
+    update_boss_cache(caches_boss1, boss1, is_following)
+    update_boss_cache(caches_boss2, boss2, is_following)
+    boss_cache_turn = race_turn
+
+
+def update_boss_cache(caches, boss, is_following):
+    '''
+    Update the predicted states (see Pod.get_state) of the boss for the next NB_MOVES turns
+    @param is_following: True if the caches hold the prediction computed at the previous turn
+    '''
+    predicted_boss = boss.clone()
+
+    if is_following and len(caches) == NB_MOVES and is_boss_prediction_valid(caches, boss):
+        shift_boss_cache(caches, boss)
+        predicted_boss.set_state(caches[-1])
+    else:
+        caches.clear()
+
+    while len(caches) < NB_MOVES:
+        predicted_boss.apply_boss(True)
+        caches.append(predicted_boss.get_state())
+
+
+def is_boss_prediction_valid(caches, boss):
+    '''
+    Return True if the boss is where the previous prediction expected it
+    and if the next predicted moves do not depend on our pods (shield activation)
+    '''
+    x, y, vx, vy, angle, next_checkpoint_id, lap, checked, timeout, is_shield_activated, race_turn, boost_available, turn_activated_shield = caches[0]
+
+    if next_checkpoint_id != boss.next_checkpoint_id or lap != boss.lap or checked != boss.checked:
+        return False
+
+    delta_angle = abs(angle - boss.angle) % 360.0
+    if abs(x - boss.x) > BOSS_CACHE_TOLERANCE or abs(y - boss.y) > BOSS_CACHE_TOLERANCE \
+            or abs(vx - boss.vx) > BOSS_CACHE_TOLERANCE or abs(vy - boss.vy) > BOSS_CACHE_TOLERANCE \
+            or min(delta_angle, 360.0 - delta_angle) > BOSS_CACHE_TOLERANCE:
+        return False
+
+    # The shield must be ready at the previous and the current turn so that the thrust of the bosses is the same
+    if boss.race_turn - 1 - boss.turn_activated_shield < SHIELD_COOLDOWN:
+        return False
+
+    # The states kept are the starting states of the next predicted moves
+    for x, y, vx, vy, angle, next_checkpoint_id, lap, checked, timeout, is_shield_activated, race_turn, boost_available, \
+            turn_activated_shield in caches[:-1]:
+        if is_shield_activated != boss.is_shield_activated or turn_activated_shield != boss.turn_activated_shield:
+            return False
+
+        for pod in [cho, gall]:
+            if (x - pod.x) * (x - pod.x) + (y - pod.y) * (y - pod.y) <= SAFETY_DISTANCE_SQUARED:
+                return False
+
+    return True
+
+
+def shift_boss_cache(caches, boss):
+    '''
+    Drop the predicted state of the current turn and set the race turn and the timeout of the remaining states
+    as if they were predicted from the observed boss
+    '''
+    predicted_state = caches.pop(0)
+    predicted_checked = predicted_state[STATE_CHECKED]
+    delta_timeout = boss.timeout - predicted_state[STATE_TIMEOUT]
+
+    for i, (x, y, vx, vy, angle, next_checkpoint_id, lap, checked, timeout, is_shield_activated, race_turn, boost_available,
+            turn_activated_shield) in enumerate(caches):
+        if checked == predicted_checked:
+            timeout += delta_timeout
+
+        caches[i] = (x, y, vx, vy, angle, next_checkpoint_id, lap, checked, timeout, is_shield_activated, boss.race_turn, boost_available,
+                     turn_activated_shield)
+
+
+def play(list_pods, check_ckpts=[False]):
+    '''
+    @param list_pods pods to play this turn
+    @param check_ckpts avoid checking checkpoints if it has been already checked this generation (can not have 2 checkpoints so close)
+    Return if a collision with boss1 or boss2 happened
+
+    The collisions are managed as events: the collision time of each pair of units is predicted once and kept
+    in a heap ordered by time. After a bounce, only the pairs involving the bounced pods are predicted again,
+    the events predicted with their previous trajectory are ignored when they are popped
+    '''
+
+    is_boss1_collided = False
+    is_boss2_collided = False
+
+    time = 0.0
+    nb_pods = len(list_pods)
+    versions = [0] * nb_pods  # incremented each time the trajectory of a pod is modified by a bounce
+    events = []
+
+    for i in range(nb_pods):
+        for j in range(i + 1, nb_pods):
+            push_collision(events, list_pods, versions, i, j, time)
+
+        if check_ckpts[i]:
+            push_collision(events, list_pods, versions, i, -1, time)
+
+    while len(events) > 0:
+        collision_time, order, i, j, version_i, version_j = heappop(events)
+
+        # Events predicted with an outdated trajectory or checkpoint are ignored
+        if versions[i] != version_i:
+            continue
+        if j == -1 and list_pods[i].next_checkpoint_id != version_j:
+            continue
+        if j != -1 and versions[j] != version_j:
+            continue
+
+        # Move the pods normally until collision time
+        for k in range(nb_pods):
+            list_pods[k].move(collision_time - time)
+        time = collision_time
+
+        pod = list_pods[i]
+        if j == -1:
+            # Solve the collision, only the next checkpoint of the pod has changed
+            pod.bounce_with_checkpoint(pod.get_next_checkpoint())
+            push_collision(events, list_pods, versions, i, -1, time)
+
+            is_boss1_collided = is_boss1_collided or pod.id == 'boss1'
+            is_boss2_collided = is_boss2_collided or pod.id == 'boss2'
+        else:
+            # Solve the collision and predict again the collisions of the two bounced pods
+            other_pod = list_pods[j]
+            pod.bounce(other_pod)
+            versions[i] += 1
+            versions[j] += 1
+
+            push_collision(events, list_pods, versions, i, j, time)
+            for k in range(nb_pods):
+                if k != i and k != j:
+                    push_collision(events, list_pods, versions, min(i, k), max(i, k), time)
+                    push_collision(events, list_pods, versions, min(j, k), max(j, k), time)
+
+            if check_ckpts[i]:
+                push_collision(events, list_pods, versions, i, -1, time)
+            if check_ckpts[j]:
+                push_collision(events, list_pods, versions, j, -1, time)
+
+            is_boss1_collided = is_boss1_collided or (pod.id == 'boss1' or other_pod.id == 'boss1')
+            is_boss2_collided = is_boss2_collided or (pod.id == 'boss2' or other_pod.id == 'boss2')
+
+    # No more collision so the pods are following their path until the end of the turn
+    for i in range(nb_pods):
+        list_pods[i].move(1.0 - time)
+        list_pods[i].finalize()
+
+    return is_boss1_collided, is_boss2_collided
+
+
+def push_collision(events, list_pods, versions, i, j, time):
+    '''
+    Predict the collision between the pods i and j (i < j) or between the pod i and its next checkpoint (j = -1)
+    The collision is pushed in the events if it is occuring before the end of the turn
+    Events at the same time are ordered as the pairs are scanned in play
+    '''
+
+    pod = list_pods[i]
+    nb_pods = len(list_pods)
+
+    if j == -1:
+        if pod.next_checkpoint_id == -1:
+            return  # race is over for this pod
+
+        checkpoint = pod.get_next_checkpoint()
+        collision_time = pod.get_collision_time(checkpoint, checkpoint.radius * checkpoint.radius, True)
+        version_j = pod.next_checkpoint_id
+        order = i * (nb_pods + 1) + nb_pods
+    else:
+        other_pod = list_pods[j]
+
+        # Collision is not possible if pods are going in opposite directions
+        if (pod.x < other_pod.x and pod.vx < 0.0 and other_pod.vx > 0.0) \
+                or (other_pod.x < pod.x and other_pod.vx < 0.0 and pod.vx > 0.0) \
+                or (pod.y < other_pod.y and pod.vy < 0.0 and other_pod.vy > 0.0) \
+                or (other_pod.y < pod.y and other_pod.vy < 0.0 and pod.vy > 0.0):
+            return
+
+        # Pods in contact that are moving away from each other (just bounced) will not collide again
+        distance_x = pod.x - other_pod.x
+        distance_y = pod.y - other_pod.y
+        if distance_x * distance_x + distance_y * distance_y <= SQUARED_DOUBLE_RADIUS_POD \
+                and distance_x * (pod.vx - other_pod.vx) + distance_y * (pod.vy - other_pod.vy) >= 0.0:
+            return
+
+        collision_time = pod.get_collision_time(other_pod, SQUARED_DOUBLE_RADIUS_POD, True)
+        version_j = versions[j]
+        order = i * (nb_pods + 1) + j
+
+    if time + collision_time < 1.0:
+        heappush(events, (time + collision_time, order, i, j, versions[i], version_j))
+
+
+def get_next_entry_point(previous_ckpt, current_ckpt, next_ckpt):
+    '''
+    Return the entry point of the next checkpoint based on parallels between the current and future checkpoint
+    https://www.codingame.com/blog/coders-strike-back-pb4608s-ai-rank-3rd/
+    '''
+
+    # Search director coefficient of the line between past and future checkpoints
+    a = (next_ckpt.y - previous_ckpt.y) / (next_ckpt.x - previous_ckpt.x)
+
+    # Compute b for the line going through actual checkpoint y = ax+b
+    b = current_ckpt.y - a * current_ckpt.x
+
+    # Determines the two intersections with the checkpoint radius
+    A = 1.0 + a * a
+    B = current_ckpt.x * ((-2.0 * a * a) - 2.0)
+    C = (current_ckpt.x * current_ckpt.x) * (1.0 + a * a) - SQUARED_RADIUS_CHECKPOINT
+    delta = B * B - 4 * A * C
+
+    x1 = (-1.0 * B + sqrt(delta)) / (2 * A)
+    x2 = (-1.0 * B - sqrt(delta)) / (2 * A)
+
+    intersection_1 = Checkpoint(current_ckpt.id, floor(x1), floor(a * x1 + b), RADIUS_WAYPOINT)
+    intersection_2 = Checkpoint(current_ckpt.id, floor(x2), floor(a * x2 + b), RADIUS_WAYPOINT)
+
+    if intersection_1.x < intersection_2.x:
+        top_left = intersection_1
+        bottom_left = intersection_1
+        top_right = intersection_2
+        bottom_right = intersection_2
+    elif intersection_1.x > intersection_2.x:
+        top_left = intersection_2
+        bottom_left = intersection_2
+        top_right = intersection_1
+        bottom_right = intersection_1
+    else:
+        if intersection_1.y < intersection_2.y:
+            top_left = intersection_1
+            top_right = intersection_1
+            bottom_left = intersection_2
+            bottom_right = intersection_2
+        else:
+            top_left = intersection_2
+            top_right = intersection_2
+            bottom_left = intersection_1
+            bottom_right = intersection_1
+
+    # Choose correct intersections function of previous checkpoint
+    if previous_ckpt.x < current_ckpt.x:
+        if previous_ckpt.y < current_ckpt.y:
+            return top_left
+        else:
+            return bottom_left
+    else:
+        if previous_ckpt.y < current_ckpt.y:
+            return top_right
+        else:
+            return bottom_right
+
+
+class Track:
+    '''
+    Geometry of the checkpoints computed once from the initialization input
+    The queries relative to the checkpoints are indexes into these tables
+    '''
+
+    def __init__(self, checkpoints):
+        '''
+        @param checkpoints: list of the (x, y) coordinates of the checkpoints
+        '''
+        nb_checkpoints = len(checkpoints)
+        self.checkpoints = [Checkpoint(i, x, y, RADIUS_CHECKPOINT) for i, (x, y) in enumerate(checkpoints)]
+        self.next_ids = [(i + 1) % nb_checkpoints for i in range(nb_checkpoints)]
+        self.previous_ids = [(i - 1) % nb_checkpoints for i in range(nb_checkpoints)]
+
+        self.x = numpy.array([checkpoint.x for checkpoint in self.checkpoints], dtype=float)
+        self.y = numpy.array([checkpoint.y for checkpoint in self.checkpoints], dtype=float)
+
+        # Pairwise distances, [i, j] from the checkpoint i to the checkpoint j
+        delta_x = self.x[None, :] - self.x[:, None]
+        delta_y = self.y[None, :] - self.y[:, None]
+        self.squared_distances = delta_x * delta_x + delta_y * delta_y
+        self.distances = numpy.sqrt(self.squared_distances)
+
+        # Heading in degrees from each checkpoint to the next one (0 faces East, 90 faces South)
+        ids = numpy.arange(nb_checkpoints)
+        self.headings = numpy.degrees(numpy.arctan2(delta_y[ids, self.next_ids], delta_x[ids, self.next_ids])) % 360.0
+
+        self.entry_points = [get_next_entry_point(self.checkpoints[self.previous_ids[i]], checkpoint, self.checkpoints[self.next_ids[i]])
+                             for i, checkpoint in enumerate(self.checkpoints)]
+
+
+# Initialization
+def initialize_race(nb_laps, checkpoints):
+    '''
+    Set the race globals (track, pods and genetic algorithm) from the initialization input
+    @param nb_laps: number of laps of the race
+    @param checkpoints: list of the (x, y) coordinates of the checkpoints
+    '''
+    global laps, checkpointCount, track
+    global cho, gall, boss1, boss2, boss_runner, caches_boss1, caches_boss2, boss_cache_turn, prefix_cache, AG, race_turn
+
+    laps = nb_laps
+    checkpointCount = len(checkpoints)
+    track = Track(checkpoints)
+
+    cho = Pod("cho", RADIUS_POD)
+    gall = Pod("gall", RADIUS_POD)
+    boss1 = Pod("boss1", RADIUS_POD)
+    boss2 = Pod("boss2", RADIUS_POD)
+    boss_runner = boss1
+
+    cho.set_partner(gall)
+    gall.set_partner(cho)
+    boss1.set_partner(boss2)
+    boss2.set_partner(boss1)
+
+    caches_boss1 = []
+    caches_boss2 = []
+    boss_cache_turn = -1
+
+    prefix_cache = PrefixCache(PREFIX_CACHE_SIZE)
+
+    AG = GeneticAlgorithm()
+
+    race_turn = 0
+
+
+def update_roles():
+    '''
+    Choose the runner and the hunter of each team once the pods have been read for the current turn
+    '''
+    global boss_runner
+
+    boss1.is_hunter = boss1.score() > boss2.score()
+    boss2.is_hunter = not boss1.is_hunter
+
+    boss_runner = boss1
+    if boss2.is_hunter:
+        boss_runner = boss2
+
+    cho.is_hunter = False
+    gall.is_hunter = True
+
+    # cho.is_hunter  = cho.score() > gall.score() and (race_turn - cho.switch_checkpoint < 80) #add check on nb turn before losing
+    # gall.is_hunter = not (cho.is_hunter) and (race_turn - gall.switch_checkpoint < 80) #add check on nb turn before losing
+
+    if ((boss_runner.checked - 1) % checkpointCount) == gall.waiting_point.id:
+        cho.waiting_point = track.checkpoints[boss_runner.get_checkpoint_id_coming_after()]
+        gall.waiting_point = track.checkpoints[boss_runner.get_checkpoint_id_coming_after()]
+
+
+def prepare_simulation():
+    '''
+    Save the state of the pods and predict the bosses before running the genetic algorithm of the current turn
+    '''
+    global save_cho, save_gall, save_boss1, save_boss2
+
+    cho.check_consistency()
+    gall.check_consistency()
+
+    save_cho, save_gall, save_boss1, save_boss2 = save_pod_states()
+    generate_boss_cache()
+    prefix_cache.clear()
+
+
+def play_turn(lines, budget, telemetry):
+    '''
+    Read the pods of the turn, run the genetic algorithm until the deadline of the budget and print the moves of our pods
+    @param lines: the 4 lines of the pods of the turn
+    @param budget: TimeBudget of the turn, started when the first line has been received
+    @param telemetry: Telemetry of the run
+    '''
+    global race_turn
+
+    # The turns create no reference cycle (see PrefixCache.clear), their objects are freed by the reference counts:
+    # the garbage collector is disabled as its full collections stopped the generations for about 50 ms
+    gc.disable()
+
+    read_line = iter(lines).__next__
+    cho.set_parameters(read_line, race_turn)
+    gall.set_parameters(read_line, race_turn)
+    boss1.set_boss_parameters(read_line, race_turn)
+    boss2.set_boss_parameters(read_line, race_turn)
+
+    update_roles()
+
+    if race_turn == 0:
+        print(cho.get_next_entry_point().x, cho.get_next_entry_point().y, 100)
+        print(gall.get_next_entry_point().x, gall.get_next_entry_point().y, 100)
+    else:
+        prepare_simulation()
+        AG.generate_population(race_turn == 1)
+
+        best_solution = AG.get_best_solution().clone()
+        AG.maximum = best_solution.result
+        telemetry.record(race_turn, 0, NB_POPULATION, AG, budget.get_elapsed_time())
+
+        nb_solutions = budget.get_nb_solutions()
+        while nb_solutions > 0:
+            budget.start_generation()
+            AG.build_generation_proba(nb_solutions)
+            budget.end_generation(nb_solutions, AG.nb_scored)
+
+            current_best_solution = AG.get_best_solution()
+            if current_best_solution.result > best_solution.result:
+                best_solution = current_best_solution.clone()
+
+            telemetry.record(race_turn, budget.nb_generations, nb_solutions, AG, budget.get_elapsed_time())
+            nb_solutions = budget.get_nb_solutions()
+
+        budget.start_output()
+        cho.output(best_solution.get_move(0, 0))
+        gall.output(best_solution.get_move(1, 0))
+        budget.end_output()
+
+        telemetry.flush(race_turn, best_solution.result, budget)
+
+    race_turn += 1
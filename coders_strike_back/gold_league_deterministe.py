@@ -438,20 +438,18 @@ class Pod(Unit):
         :return: Point object
         '''
 
-        next_checkpoint = list_checkpoints[self.next_checkpoint_id]
+        next_checkpoint = track.checkpoints[self.next_checkpoint_id]
 
         id = self.get_checkpoint_id_coming_after()
         if id != -1:
             id_past = self.get_checkpoint_id_coming_before()
-            past_checkpoint = list_checkpoints[id_past]
+            past_checkpoint = track.checkpoints[id_past]
 
             closest_pod_on_vector = self.get_closest(past_checkpoint, next_checkpoint)
             distance_pod_next_checkpoint = closest_pod_on_vector.get_distance2(next_checkpoint)
-            distance_past_next_checktpoint = past_checkpoint.get_distance2(next_checkpoint)
+            distance_past_next_checktpoint = track.squared_distances[id_past][self.next_checkpoint_id]
             pod_advancement = (distance_past_next_checktpoint - distance_pod_next_checkpoint) / distance_past_next_checktpoint
 
-            print_msg(self, self.id + ' - pod advancement ' + str(past_checkpoint.id) + '/' + str(next_checkpoint.id) + ' : ' + str(pod_advancement))
-
             if pod_advancement < 0:
                 pod_advancement = 1
             elif pod_advancement > 1:
@@ -470,25 +468,10 @@ class Pod(Unit):
                 coefficient_3 = 0
                 coefficient = 0
 
-            future_checkpoint = list_checkpoints[id]
             vector_checkpoints = Point(next_checkpoint.x - past_checkpoint.x, next_checkpoint.y - past_checkpoint.y)
 
-            # delta_angle = self.get_delta_angle_orientation(future_checkpoint)
-            # delta_angle = self.get_delta_angle_orientation(next_checkpoint)
-            pod_checkpoint = Pod(next_checkpoint.id, next_checkpoint.radius)
-            pod_checkpoint.angle = 0
-            delta_angle = pod_checkpoint.get_delta_angle_orientation(future_checkpoint)
-
-            final_angle = delta_angle  # + self.angle
-
-            # Replace the angle between [0; 360] degrees
-            # mod operator is slower than if comparison
-            if final_angle >= 360.0:
-                final_angle -= 360.0
-            elif final_angle < 0.0:
-                final_angle += 360.0
-
-            radians_angle = final_angle * pi / 180.0  # final_angle * pi / 180.0
+            final_angle = track.entry_angles[id]
+            radians_angle = track.entry_radians[id]
 
             if ((next_checkpoint.x - self.x) >= 0 and final_angle >= 0) \
                     or ((next_checkpoint.x - self.x) < 0 and final_angle < 0):
@@ -507,11 +490,8 @@ class Pod(Unit):
 
             vector_final_x = ((self.x + vector_checkpoints.x) * (1 - coefficient) * coefficient_3) + (vector_pod_checkpoint.x * coefficient) + (alignment_vector_checkpoints.x * coefficient_2)
             vector_final_y = ((self.y + vector_checkpoints.y) * (1 - coefficient) * coefficient_3) + (vector_pod_checkpoint.y * coefficient) + (alignment_vector_checkpoints.y * coefficient_2)
-            vector_final = Point(vector_final_x, vector_final_y)
-
-            print_msg(self, self.id + ' entry point (' + str(self.x + vector_final.x) + ', ' + str(self.y + vector_final.y))
 
-            return Point(vector_final.x, vector_final.y)
+            return Point(vector_final_x, vector_final_y)
 
         else:
             return Point(next_checkpoint.x, next_checkpoint.y)
@@ -522,22 +502,13 @@ class Pod(Unit):
         :return: checkpoint id
         '''
 
-        future_checkpoint_id = self.next_checkpoint_id + 1
-        if future_checkpoint_id == checkpointCount and self.lap < laps:
-            future_checkpoint_id = 0
-        elif future_checkpoint_id == checkpointCount and self.lap == laps:
-            future_checkpoint_id = -1
+        if self.next_checkpoint_id == checkpointCount - 1 and self.lap == laps:
+            return -1
 
-        return future_checkpoint_id
+        return track.next_ids[self.next_checkpoint_id]
 
     def get_checkpoint_id_coming_before(self):
-        past_checkpoint_id = self.next_checkpoint_id - 1
-        if past_checkpoint_id == 0 and self.lap > 1:
-            past_checkpoint_id = checkpointCount - 1
-        elif past_checkpoint_id == 0 and self.lap == 0:
-            past_checkpoint_id = -1
-
-        return past_checkpoint_id
+        return track.previous_ids[self.next_checkpoint_id]
 
     def load(self, saved_pod):
         self.x = saved_pod.x
@@ -770,6 +741,25 @@ class Path:
         return clone
 
 
+class Track:
+    '''
+    Geometry of the checkpoints computed once from the initialization input
+    '''
+
+    def __init__(self, checkpoints):
+        nb_checkpoints = len(checkpoints)
+        self.checkpoints = checkpoints
+        self.next_ids = [(i + 1) % nb_checkpoints for i in range(nb_checkpoints)]
+        self.previous_ids = [(i - 1) % nb_checkpoints for i in range(nb_checkpoints)]
+        self.squared_distances = [[a.get_distance2(b) for b in checkpoints] for a in checkpoints]
+
+        # Angle of the entry point when the checkpoint is the one coming after the next one:
+        # delta angle of a pod at the origin of the map facing East to the checkpoint, between [0; 360] degrees
+        origin = Pod('origin', RADIUS_POD)
+        self.entry_angles = [formalize_angle(origin.get_delta_angle_orientation(checkpoint)) for checkpoint in checkpoints]
+        self.entry_radians = [angle * pi / 180.0 for angle in self.entry_angles]
+
+
 class Collision():
     def __init__(self, unit_a, unit_b, time):
         self.a = unit_a
@@ -807,48 +797,59 @@ def print_msg(pod, msg):
 
 
 # Initialization
-laps = int(input())
-checkpointCount = int(input())
-
-path = Path()
-list_checkpoints = []
-for i in range(checkpointCount):
-    x, y = [int(j) for j in input().split()]
-    list_checkpoints.append(Checkpoint(i, x, y, RADIUS_CHECKPOINT))
-    path.add_node(Checkpoint(i, x, y, RADIUS_CHECKPOINT))
-    print_msg(None, 'checkpoint added : ' + str(i))
-
-cho = Pod("cho", RADIUS_POD)
-gall = Pod("gall", RADIUS_POD)
-boss1 = Pod("boss1", RADIUS_POD)
-boss2 = Pod("boss2", RADIUS_POD)
-
-cho.set_path(path)
-gall.set_path(path)
-boss1.set_path(path)
-boss2.set_path(path)
-
-cho.set_partner(gall)
-gall.set_partner(cho)
-boss1.set_partner(boss2)
-boss2.set_partner(boss1)
-
-turn = 0
-best_solution = None
-
-while True:
-    start_time = time.time()
-    elapsed_time = 0.0
-
-    cho.set_parameters(input, False)
-    gall.set_parameters(input, False)
-    boss1.set_boss_parameters(input, False)
-    boss2.set_boss_parameters(input, False)
-
-    cho.check_consistency()
-    gall.check_consistency()
-    turn += 1
-
-    cho.output_runner(Move(cho.get_delta_angle_orientation(cho.get_next_checkpoint_entry_point()), MAX_THRUST), True, None)
-    # gall.output_runner(Move(gall.get_delta_angle_orientation(gall.get_next_checkpoint_entry_point()), MAX_THRUST), True, None)
-    gall.output_hunter(Move(gall.get_delta_angle_orientation(gall.get_next_checkpoint_entry_point()), MAX_THRUST), None)
\ No newline at end of file
+def initialize_race(nb_laps, checkpoints):
+    '''
+    Set the race globals (checkpoints, track and pods) from the initialization input
+    :param nb_laps: number of laps of the race
+    :param checkpoints: list of the (x, y) coordinates of the checkpoints
+    '''
+    global laps, checkpointCount, path, list_checkpoints, track, cho, gall, boss1, boss2
+
+    laps = nb_laps
+    checkpointCount = len(checkpoints)
+
+    path = Path()
+    list_checkpoints = []
+    for i, (x, y) in enumerate(checkpoints):
+        list_checkpoints.append(Checkpoint(i, x, y, RADIUS_CHECKPOINT))
+        path.add_node(Checkpoint(i, x, y, RADIUS_CHECKPOINT))
+        print_msg(None, 'checkpoint added : ' + str(i))
+
+    track = Track(list_checkpoints)
+
+    cho = Pod("cho", RADIUS_POD)
+    gall = Pod("gall", RADIUS_POD)
+    boss1 = Pod("boss1", RADIUS_POD)
+    boss2 = Pod("boss2", RADIUS_POD)
+
+    cho.set_path(path)
+    gall.set_path(path)
+    boss1.set_path(path)
+    boss2.set_path(path)
+
+    cho.set_partner(gall)
+    gall.set_partner(cho)
+    boss1.set_partner(boss2)
+    boss2.set_partner(boss1)
+
+
+if __name__ == '__main__':
+    laps = int(input())
+    checkpointCount = int(input())
+    initialize_race(laps, [[int(j) for j in input().split()] for i in range(checkpointCount)])
+
+    turn = 0
+
+    while True:
+        cho.set_parameters(input, False)
+        gall.set_parameters(input, False)
+        boss1.set_boss_parameters(input, False)
+        boss2.set_boss_parameters(input, False)
+
+        cho.check_consistency()
+        gall.check_consistency()
+        turn += 1
+
+        cho.output_runner(Move(cho.get_delta_angle_orientation(cho.get_next_checkpoint_entry_point()), MAX_THRUST), True, None)
+        # gall.output_runner(Move(gall.get_delta_angle_orientation(gall.get_next_checkpoint_entry_point()), MAX_THRUST), True, None)
+        gall.output_hunter(Move(gall.get_delta_angle_orientation(gall.get_next_checkpoint_entry_point()), MAX_THRUST), None)
@@ -12,8 +12,10 @@ from math import radians
 from math import degrees
 from math import pi
 from math import inf
-from random import randint
+from math import exp
 from random import uniform
+from heapq import heappush
+from heapq import heappop
 
 # Auto-generated code below aims at helping you parse
 # the standard input according to the problem statement.
@@ -28,6 +30,16 @@ NB_SIMULATION_TURNS = 10
 NB_BEST_SOLUTIONS = 5
 BIG_SCORE_TO_OPTIMIZE = 100000
 
+# SIMULATED ANNEALING
+TURN_TIME_LIMIT = 150.0  # ms, (game constraint) time to answer a turn after the first one
+TIME_MARGIN = 15.0  # ms kept before the time limit for the output and the jitter of the process
+TIME_BUDGET = TURN_TIME_LIMIT - TIME_MARGIN  # ms, search time by turn
+TEMPERATURE_SCHEDULE = 'exponential'  # 'exponential' or 'linear' cooling from INITIAL_TEMPERATURE to FINAL_TEMPERATURE
+INITIAL_TEMPERATURE = 0.5  # relative to the absolute score of the current solution
+FINAL_TEMPERATURE = 0.001
+MIN_AMPLITUDE = 0.05  # amplitude of the mutations once the temperature is low
+NB_CANDIDATES = 4  # neighbours of the current solution evaluated as a batch at each step
+
 
 class Point():
     def __init__(self, x, y):
@@ -101,51 +113,42 @@ class Unit(Point):
             return None
 
         # Set other unit as the new reference (other is stationary and is positionned at (0, 0)
+        # The points of the referential are kept as coordinates to avoid creating objects on the hot path
         x = self.x - other.x
         y = self.y - other.y
-        pod_in_referential = Point(x, y)
         vx = self.vx - other.vx
         vy = self.vy - other.vy
-        other_in_referential = Point(0, 0)
 
         # Get the closest point to other unit (which is in (0,0)) on the line described by the pod speed vector
         # closest_projection = other_in_referential.get_closest(pod_in_referential, Point(x + vx, y + vy))
-        closest_projection = Point(0, 0)
-
-        # Distance(squared) between the other unit and the closest point to the other unit on the line described by our speed vector
-        distance_unit_closest_projection = other_in_referential.get_distance2(closest_projection)
+        # The projection is taken at (0, 0) so the distance between the other unit and the line is 0
+        distance_pod_closest_projection = x ** 2 + y ** 2
 
-        # Distance(squared) between the pod and the projection
-        distance_pod_closest_projection = pod_in_referential.get_distance2(closest_projection)
+        # The pod speed on the line (norm)
+        speed_distance = vx ** 2 + vy ** 2
 
-        # If the distance between other unit and this line is less than the sum of the radii, there might be a collision
-        if distance_unit_closest_projection < length_radii_squared:
-            # The pod speed on the line (norm)
-            speed_distance = vx ** 2 + vy ** 2
+        # Project the pod on the line to find the point of impact
+        distance_intersection_units = sqrt(length_radii_squared)
+        impact_x = -distance_intersection_units * (vx / speed_distance)
+        impact_y = -distance_intersection_units * (vy / speed_distance)
 
-            # Project the pod on the line to find the point of impact
-            distance_intersection_units = sqrt(length_radii_squared - distance_unit_closest_projection)
-            closest_projection.x = closest_projection.x - distance_intersection_units * (vx / speed_distance)
-            closest_projection.y = closest_projection.y - distance_intersection_units * (vy / speed_distance)
+        # If the projection point is further away means the pod direction is opposite of the other unit
+        # => no collision will happen
+        distance_pod_impact = (x - impact_x) ** 2 + (y - impact_y) ** 2
+        if distance_pod_impact > distance_pod_closest_projection:
+            return None
 
-            # If the projection point is further away means the pod direction is opposite of the other unit
-            # => no collision will happen
-            if pod_in_referential.get_distance2(closest_projection) > distance_pod_closest_projection:
-                return None
+        distance_pod_impact = sqrt(distance_pod_impact)
 
-            distance_pod_closest_projection = closest_projection.get_distance(pod_in_referential)
+        # If the impact point is further than what the pod can travel in one turn
+        # Collision will be managed in another turn
+        if distance_pod_impact > speed_distance:
+            return None
 
-            # If the impact point is further than what the pod can travel in one turn
-            # Collision will be managed in another turn
-            if distance_pod_closest_projection > speed_distance:
-                return None
+        # Get the time needed to reach the impact point during this turn
+        time = round(distance_pod_impact / speed_distance, 4)
 
-            # Get the time needed to reach the impact point during this turn
-            time = round(distance_pod_closest_projection / speed_distance, 4)
-
-            return Collision(self, other, time)
-        else:
-            return None
+        return Collision(self, other, time)
 
     def bounce(self, other):
         '''
@@ -369,7 +372,7 @@ class Pod(Unit):
         self.x = saved_pod.x
         self.y = saved_pod.y
         self.vx = saved_pod.vx
-        self.pod = saved_pod.vy
+        self.vy = saved_pod.vy
         self.angle = saved_pod.angle
         self.next_checkpoint_id = saved_pod.next_checkpoint_id
         self.lap = saved_pod.lap
@@ -378,6 +381,12 @@ class Pod(Unit):
         # self.partner = saved_pod.partner
         self.is_shield_activated = saved_pod.is_shield_activated
 
+    def get_state(self):
+        return self.x, self.y, self.vx, self.vy, self.angle, self.next_checkpoint_id, self.lap, self.checked, self.timeout, self.is_shield_activated
+
+    def set_state(self, state):
+        self.x, self.y, self.vx, self.vy, self.angle, self.next_checkpoint_id, self.lap, self.checked, self.timeout, self.is_shield_activated = state
+
     def output(self, move, commit):
         '''
         Apply the move on the pod and print result to game engine
@@ -414,7 +423,7 @@ class Pod(Unit):
         clone.x = self.x
         clone.y = self.y
         clone.vx = self.vx
-        clone.pod = self.vy
+        clone.vy = self.vy
         clone.angle = self.angle
         clone.next_checkpoint_id = self.next_checkpoint_id
         clone.lap = self.lap
@@ -433,6 +442,20 @@ class Collision():
         self.time = time  # time at which the collision between a and b occurs
 
 
+class Snapshot():
+    '''
+    States of the four pods at the start of the turn, shared by all the solutions evaluated during the turn
+    '''
+
+    def __init__(self, pods):
+        self.pods = pods
+        self.states = [pod.get_state() for pod in pods]
+
+    def restore(self):
+        for pod, state in zip(self.pods, self.states):
+            pod.set_state(state)
+
+
 class Solution():
     def __init__(self):
         self.pod1_moves = []
@@ -442,13 +465,14 @@ class Solution():
         self.pod1_moves = pod1_moves
         self.pod2_moves = pod2_moves
 
-    def score(self, pod1, pod2, boss1, boss2, list_checkpoint):
+    def score(self, snapshot):
         '''
-        Return the score of the solution after X turns
+        Return the score of the solution after X turns, the pods are played from the snapshot of the turn
+        The pods are left in their simulated state, the snapshot has to be restored afterwards
         :return: score
         '''
-
-        self.save_state(pod1, pod2, boss1, boss2)
+        pod1, pod2, boss1, boss2 = snapshot.pods
+        snapshot.restore()
 
         # Play out the turns
         for i in range(NB_SIMULATION_TURNS):
@@ -459,15 +483,10 @@ class Solution():
             boss1.apply(Move(boss1.get_delta_angle_orientation(list_checkpoints[boss1.next_checkpoint_id]), 100))
             boss2.apply(Move(boss2.get_delta_angle_orientation(list_checkpoints[boss2.next_checkpoint_id]), 100))
 
-            self.play([pod1, pod2, boss1, boss2], list_checkpoint)
+            self.play(snapshot.pods, list_checkpoints)
 
         # Compute the scores
-        result = self.evaluation(pod1, pod2, boss1, boss2)
-
-        # reset everyone to the original state
-        self.reset_state(pod1, pod2, boss1, boss2)
-
-        return result
+        return self.evaluation(pod1, pod2, boss1, boss2)
 
     def evaluation(self, runner_pod, hunter_pod, runner_boss, hunter_boss):
         '''
@@ -509,90 +528,100 @@ class Solution():
             self.pod1_moves[i].mutate(amplitude)
             self.pod2_moves[i].mutate(amplitude)
 
-    def save_state(self, pod1, pod2, boss1, boss2):
-        self.save_pod1 = pod1.clone()
-        self.save_pod2 = pod2.clone()
-        self.save_boss1 = boss1.clone()
-        self.save_boss2 = boss2.clone()
-
-    def reset_state(self, pod1, pod2, boss1, boss2):
-        pod1.load(self.save_pod1)
-        pod2.load(self.save_pod2)
-        boss1.load(self.save_boss1)
-        boss2.load(self.save_boss2)
-
     def play(self, list_pods, list_checkpoint):
         '''
         Simulate a whole turn
+        The collisions are kept as events in a heap ordered by time. After a bounce, only the collisions
+        of the pods whose trajectory has changed are predicted again
         '''
         time = 0.0  # time during the turn (end of the turn = 1.0)
 
-        list_previous_collisions = [None for _ in range(len(list_pods))]
-        while time < 1.0:
-
-            # if previous_collision != None:
-            #    print('Previous_collision  (' + str(previous_collision.a.id) + ', ' + str(previous_collision.b.id) + ', ' + str(previous_collision.time) + ')', file=sys.stderr)
-
-            # Check all the collisions that are going to happen during this turn
-            i = 0
-            while i < len(list_pods):
-                pod = list_pods[i]
-                previous_collision = list_previous_collisions[i]
-                first_collision = None
-
-                j = i + 1
-                while j < len(list_pods):
-                    other_pod = list_pods[j]
-                    collision = pod.get_collision(other_pod)
-
-                    if previous_collision != None and collision != None and collision.a == previous_collision.a and collision.b == previous_collision.b and collision.time == 0.0:
-                        collision = None
-
-                    # If the collision is earlier in time than the one currently saved, keep it !
-                    if collision != None and (collision.time + time < TIME_FULL_TURN) and (
-                                    first_collision == None or collision.time < first_collision.time):
-                        first_collision = Collision(collision.a, collision.b, round(collision.time, 4))
+        nb_pods = len(list_pods)
+        versions = [0] * nb_pods  # incremented each time the trajectory of a pod is modified by a bounce
+        events = []
+
+        for i in range(nb_pods):
+            for j in range(i + 1, nb_pods):
+                self.push_collision(events, list_pods, versions, i, j, time)
+            self.push_collision(events, list_pods, versions, i, -1, time)
+
+        while len(events) > 0:
+            collision_time, order, i, j, version_i, version_j = heappop(events)
+
+            # Events predicted with an outdated trajectory or checkpoint are ignored
+            if versions[i] != version_i:
+                continue
+            if j == -1 and list_pods[i].next_checkpoint_id != version_j:
+                continue
+            if j != -1 and versions[j] != version_j:
+                continue
+
+            # Move the pods to reach the time `t` of the collision
+            for pod in list_pods:
+                pod.move(collision_time - time)
+            time = collision_time
+
+            pod = list_pods[i]
+            if j == -1:
+                # Resolve the collision, only the next checkpoint of the pod has changed
+                pod.bounce(list_checkpoints[pod.next_checkpoint_id])
+                self.push_collision(events, list_pods, versions, i, -1, time)
+            else:
+                other_pod = list_pods[j]
+                speeds = (pod.vx, pod.vy, other_pod.vx, other_pod.vy)
+
+                # Resolve the collision
+                pod.bounce(other_pod)
+
+                if speeds != (pod.vx, pod.vy, other_pod.vx, other_pod.vy):
+                    versions[i] += 1
+                    versions[j] += 1
+
+                    self.push_collision(events, list_pods, versions, i, j, time)
+                    for k in range(nb_pods):
+                        if k != i and k != j:
+                            self.push_collision(events, list_pods, versions, min(i, k), max(i, k), time)
+                            self.push_collision(events, list_pods, versions, min(j, k), max(j, k), time)
+
+                    self.push_collision(events, list_pods, versions, i, -1, time)
+                    self.push_collision(events, list_pods, versions, j, -1, time)
 
-                    j += 1
-
-                # Collision with another checkpoint?
-                # It is unnecessary to check all checkpoints here.We only test the pod's next checkpoint.
-                # We could look for the collisions of the pod with all the checkpoints, but if such a collision happens it wouldn't impact the game in any way
-                collision = list_pods[i].get_collision(list_checkpoints[list_pods[i].next_checkpoint_id])
-
-                if previous_collision != None and collision != None and collision.a == previous_collision.a and collision.b == previous_collision.b and collision.time == 0.0:
-                    collision = None
-
-                # If the collision is earlier in time than the one currently saved, keep it !
-                if collision != None and (collision.time + time < TIME_FULL_TURN) and (
-                                first_collision == None or collision.time < first_collision.time):
-                    first_collision = Collision(collision.a, collision.b, round(collision.time, 4))
+        # Finalize the turn
+        for pod in list_pods:
+            pod.move(TIME_FULL_TURN - time)
+            pod.finalize()
 
-                if first_collision == None:
-                    # No collision this turn to manage
-                    for pod in list_pods:
-                        pod.move(TIME_FULL_TURN - round(time, 4))
+    def push_collision(self, events, list_pods, versions, i, j, time):
+        '''
+        Predict the collision between the pods i and j (i < j) or between the pod i and its next checkpoint (j = -1)
+        The collision is kept if it is occuring before the end of the turn
+        '''
+        pod = list_pods[i]
+        nb_pods = len(list_pods)
 
-                    # end of the turn
-                    time = TIME_FULL_TURN
-                else:
-                    # Move the pods to reach the time `t` of the collision
-                    for pod in list_pods:
-                        pod.move(round(first_collision.time, 4))
+        if j == -1:
+            if pod.next_checkpoint_id == -1:
+                return  # race is over for this pod
 
-                    # Resolve the collision
-                    first_collision.a.bounce(first_collision.b)
-                    time += round(first_collision.time, PRECISION)
+            collision = pod.get_collision(list_checkpoints[pod.next_checkpoint_id])
+            version_j = pod.next_checkpoint_id
+            order = i * (nb_pods + 1) + nb_pods
+        else:
+            other_pod = list_pods[j]
 
-                if first_collision != None:
-                    list_previous_collisions[i] = Collision(first_collision.a, first_collision.b,
-                                                            round(first_collision.time, 4))
+            # Pods in contact that are moving away from each other will not collide again
+            distance_x = pod.x - other_pod.x
+            distance_y = pod.y - other_pod.y
+            if distance_x ** 2 + distance_y ** 2 <= (pod.radius + other_pod.radius) ** 2 \
+                    and distance_x * (pod.vx - other_pod.vx) + distance_y * (pod.vy - other_pod.vy) >= 0.0:
+                return
 
-                i += 1
+            collision = pod.get_collision(other_pod)
+            version_j = versions[j]
+            order = i * (nb_pods + 1) + j
 
-        # Finalize the turn
-        for pod in list_pods:
-            pod.finalize()
+        if collision != None and (round(collision.time, 4) + time < TIME_FULL_TURN):
+            heappush(events, (round(collision.time, 4) + time, order, i, j, versions[i], version_j))
 
     def clone(self):
         clone = Solution()
@@ -736,73 +765,159 @@ def generate_population(previous_best_solution):
     return population
 
 
-# Initialization
-laps = int(input())
-checkpointCount = int(input())
+def evaluate(solutions, snapshot):
+    '''
+    Return the scores of a batch of solutions played from the same snapshot, the pods are restored at the end
+    '''
+    scores = [solution.score(snapshot) for solution in solutions]
+    snapshot.restore()
+    return scores
 
-list_checkpoints = []
-for i in range(checkpointCount):
-    x, y = [int(i) for i in input().split()]
-    list_checkpoints.append(Checkpoint(i, x, y, RADIUS_CHECKPOINT))
 
-cho = Pod("cho", RADIUS_POD)
-gall = Pod("gall", RADIUS_POD)
-boss1 = Pod("boss1", RADIUS_POD)
-boss2 = Pod("boss2", RADIUS_POD)
+def get_temperature(progress, schedule=TEMPERATURE_SCHEDULE):
+    '''
+    Return the temperature of the annealing
+    :param progress: ratio of the time budget already spent, between [0.0, 1.0]
+    :param schedule: 'exponential' or 'linear' cooling from INITIAL_TEMPERATURE to FINAL_TEMPERATURE
+    '''
+    if schedule == 'exponential':
+        return INITIAL_TEMPERATURE * (FINAL_TEMPERATURE / INITIAL_TEMPERATURE) ** progress
+    elif schedule == 'linear':
+        return INITIAL_TEMPERATURE + (FINAL_TEMPERATURE - INITIAL_TEMPERATURE) * progress
+    else:
+        raise ValueError('Unknown temperature schedule: ' + str(schedule))
+
+
+def is_accepted(score, current_score, temperature):
+    '''
+    Metropolis criterion: a worse score is accepted with a probability decreasing with the loss relative to the current score
+    '''
+    if score >= current_score:
+        return True
+    elif score == -inf:
+        return False
+    elif current_score == inf:
+        return False
+
+    loss = (current_score - score) / max(abs(current_score), 1.0)
+    return uniform(0.0, 1.0) < exp(-loss / temperature)
 
-cho.set_partner(gall)
-gall.set_partner(cho)
-boss1.set_partner(boss2)
-boss2.set_partner(boss1)
 
-turn = 0
-best_solution = None
+def get_elapsed_time(start_time):
+    return (time.perf_counter() - start_time) * 1000.0  # ms
 
-while True:
-    start_time = time.time()
 
-    elapsed_time = 0.0
+class SimulatedAnnealing():
+    '''
+    Search the best solution of the turn by simulated annealing
+    At each step, NB_CANDIDATES mutations of the current solution are evaluated as a batch from the snapshot of the turn
+    and the best one replaces the current solution following the Metropolis criterion
+    '''
 
-    cho.set_parameters(input, False, False)
-    gall.set_parameters(input, False, False)
-    boss1.set_parameters(input, False, False)
-    boss2.set_parameters(input, False, False)
+    def __init__(self, snapshot, schedule=TEMPERATURE_SCHEDULE, nb_candidates=NB_CANDIDATES):
+        self.snapshot = snapshot
+        self.schedule = schedule
+        self.nb_candidates = nb_candidates
+        self.nb_evaluations = 0
+        self.history = []  # convergence curve as a list of (elapsed time in ms, number of evaluations, best score)
+
+    def evaluate(self, solutions):
+        self.nb_evaluations += len(solutions)
+        return evaluate(solutions, self.snapshot)
+
+    def run(self, solutions, time_budget=TIME_BUDGET, start_time=None):
+        '''
+        Anneal from the best of the initial solutions until the end of the time budget
+        A step is started only if the longest step of the turn still fits in the time budget
+        :param solutions: initial solutions (see generate_population)
+        :param time_budget: time of the search in ms
+        :param start_time: time.perf_counter() at the start of the turn, now by default
+        :return: best solution and its score
+        '''
+        if start_time is None:
+            start_time = time.perf_counter()
+
+        scores = self.evaluate(solutions)
+        current_score = max(scores)
+        current = solutions[scores.index(current_score)]
+        best, best_score = current, current_score
+
+        elapsed_time = get_elapsed_time(start_time)
+        self.history.append((elapsed_time, self.nb_evaluations, best_score))
+
+        max_step_duration = 0.0
+        while elapsed_time + max_step_duration < time_budget:
+            temperature = get_temperature(min(elapsed_time / time_budget, 1.0), self.schedule)
+            amplitude = max(temperature / INITIAL_TEMPERATURE, MIN_AMPLITUDE)
+
+            candidates = []
+            for i in range(self.nb_candidates):
+                candidate = current.clone()
+                candidate.mutate(amplitude)
+                candidates.append(candidate)
+
+            scores = self.evaluate(candidates)
+            score = max(scores)
+            if is_accepted(score, current_score, temperature):
+                current, current_score = candidates[scores.index(score)], score
+                if current_score > best_score:
+                    best, best_score = current, current_score
+
+            new_elapsed_time = get_elapsed_time(start_time)
+            max_step_duration = max(max_step_duration, new_elapsed_time - elapsed_time)
+            elapsed_time = new_elapsed_time
+            self.history.append((elapsed_time, self.nb_evaluations, best_score))
+
+        return best, best_score
+
+
+# Initialization
+def initialize_race(nb_laps, checkpoints):
+    '''
+    Set the race globals (checkpoints and pods) from the initialization input
+    :param nb_laps: number of laps of the race
+    :param checkpoints: list of the (x, y) coordinates of the checkpoints
+    '''
+    global laps, checkpointCount, list_checkpoints, cho, gall, boss1, boss2
 
-    # Search the best solution to play function of the current state
-    solutions = generate_population(best_solution)
-    amplitude = 1.0
-    best_score = -inf
-    while elapsed_time < 150:
-        min_score = best_score
+    laps = nb_laps
+    checkpointCount = len(checkpoints)
+    list_checkpoints = [Checkpoint(i, x, y, RADIUS_CHECKPOINT) for i, (x, y) in enumerate(checkpoints)]
 
-        solution = solutions[randint(0, NB_BEST_SOLUTIONS - 1)]
-        solution.mutate(amplitude)
+    cho = Pod("cho", RADIUS_POD)
+    gall = Pod("gall", RADIUS_POD)
+    boss1 = Pod("boss1", RADIUS_POD)
+    boss2 = Pod("boss2", RADIUS_POD)
 
-        score = solution.score(cho, gall, boss1, boss2, list_checkpoints)
-        if score > min_score:
-            best_solution = solution.clone()
-            best_score = score
-            amplitude = amplitude * 0.4
-            print('Turn ' + str(turn) + ' best solution pod 1 thrust : ' + str(best_solution.pod1_moves[0].thrust), file=sys.stderr)
+    cho.set_partner(gall)
+    gall.set_partner(cho)
+    boss1.set_partner(boss2)
+    boss2.set_partner(boss1)
 
-        amplitude = amplitude * 0.6
 
-        elapsed_time += (time.time() - start_time) * 1000.0  # ms
+if __name__ == '__main__':
+    laps = int(input())
+    checkpointCount = int(input())
+    initialize_race(laps, [[int(j) for j in input().split()] for i in range(checkpointCount)])
 
-    turn += 1
-    cho.output(best_solution.pod1_moves[0], True)
-    gall.output(best_solution.pod2_moves[0], True)
+    turn = 0
+    best_solution = None
 
-    # test([cho, gall], list_checkpoints)
+    while True:
+        # The clock of the turn starts when the first line of the turn is received
+        line = input()
+        start_time = time.perf_counter()
 
-    # cho.play(list_checkpoints[cho.next_checkpoint_id], 100.0)
-    # gall.play(list_checkpoints[gall.next_checkpoint_id], 100.0)
+        cho.set_parameters(lambda: line, False, False)
+        gall.set_parameters(input, False, False)
+        boss1.set_parameters(input, False, False)
+        boss2.set_parameters(input, False, False)
 
-    # You have to output the target position
-    # followed by the power (0 <= thrust <= 100)
-    # i.e.: "x y thrust"
-    # print(str(cho.x) + " " + str(cho.y) + " " + str(100))
-    # print(str(gall.x) + " " + str(gall.y) + " " + str(100))
-    # output(cho, list_checkpoints[cho.next_checkpoint_id])
-    # output(gall, list_checkpoints[gall.next_checkpoint_id])
+        # Search the best solution to play function of the current state
+        annealing = SimulatedAnnealing(Snapshot([cho, gall, boss1, boss2]))
+        best_solution, best_score = annealing.run(generate_population(best_solution), TIME_BUDGET, start_time)
+        print('Turn ' + str(turn) + ' best score : ' + str(best_score) + ', evaluations : ' + str(annealing.nb_evaluations), file=sys.stderr)
 
+        turn += 1
+        cho.output(best_solution.pod1_moves[0], True)
+        gall.output(best_solution.pod2_moves[0], True)
@@ -39,6 +39,11 @@ SECOND_SLOWING_DOWN_COEFF_DIST = 4
 SECOND_SLOWING_COEFF = 0.2
 SHIELD_ACTIVATION_COEFF_DIST = 7
 
+# Constants exposed as a parameter vector to optimizer_tuner.py
+TUNED_CONSTANTS = ['SAFETY_DISTANCE', 'BOOST_DISTANCE', 'X_DELTA_POSITION', 'Y_DELTA_POSITION', 'X_DELTA_FOLLOWER', 'Y_DELTA_FOLLOWER',
+                   'MIN_THRUST', 'MIN_TO_CHECKPOINT', 'MAX_ANGLE', 'MIN_ANGLE', 'TURN_SHIELD_OFF', 'FIRST_SLOWING_DOWN_COEFF_DIST',
+                   'FIRST_SLOWING_COEFF', 'SECOND_SLOWING_DOWN_COEFF_DIST', 'SECOND_SLOWING_COEFF', 'SHIELD_ACTIVATION_COEFF_DIST']
+
 
 class Pod:
     def __init__(self, name):
@@ -212,25 +217,45 @@ def manage_trajectory(pod, other_pod, boss1, boss2):
     return [new_destination_x, new_destination_y]
 
 
-# game loop
-
-# Initialization
-laps = int(input())
-checkpointCount = int(input())
+def get_parameter_vector():
+    '''
+    Return the values of the TUNED_CONSTANTS
+    '''
+    return [globals()[name] for name in TUNED_CONSTANTS]
 
-list_checkpoints = []
-for i in range(checkpointCount):
-    list_checkpoints.append([int(i) for i in input().split()])
 
-is_boost_used = False
-time_before_availability_shield = 0  # TODO : one shield by pod
+def set_parameter_vector(values):
+    '''
+    Set the TUNED_CONSTANTS read by optimize_thrust and manage_trajectory
+    '''
+    globals().update(zip(TUNED_CONSTANTS, values))
 
-cho = Pod("cho")
-gall = Pod("gall")
-boss1 = Pod("boss1")
-boss2 = Pod("boss2")
 
-while True:
+# Initialization
+def initialize_race(nb_laps, checkpoints):
+    '''
+    Set the race globals (checkpoints and pods) from the initialization input
+    :param nb_laps: number of laps of the race
+    :param checkpoints: list of the [x, y] coordinates of the checkpoints
+    '''
+    global laps, checkpointCount, list_checkpoints, cho, gall, boss1, boss2
+
+    laps = nb_laps
+    checkpointCount = len(checkpoints)
+    list_checkpoints = checkpoints
+
+    cho = Pod("cho")
+    gall = Pod("gall")
+    boss1 = Pod("boss1")
+    boss2 = Pod("boss2")
+
+
+def play_turn(input):
+    '''
+    Read the pods of the turn and return the outputs of the two pods
+    :param input: function returning the next line of the turn
+    :return: list of the two output lines "x y thrust"
+    '''
     cho.configure_input(input, list_checkpoints)
     gall.configure_input(input, list_checkpoints)
     boss1.configure_input(input, list_checkpoints)
@@ -250,7 +275,6 @@ while True:
     cho.time_before_availability_shield = cho.time_before_availability_shield - 1
     gall.time_before_availability_shield = gall.time_before_availability_shield - 1
 
-    # Write an action using print
     # To debug: print("Debug messages...", file=sys.stderr)
     print(cho.name + " thrust : " + str(cho_optimized_data[2]), file=sys.stderr)
     print(gall.name + " thrust : " + str(gall_optimized_data[2]), file=sys.stderr)
@@ -258,5 +282,15 @@ while True:
     # You have to output the target position
     # followed by the power (0 <= thrust <= 100)
     # i.e.: "x y thrust"
-    print(str(cho_optimized_data[0]) + " " + str(cho_optimized_data[1]) + " " + str(cho_optimized_data[2]))
-    print(str(gall_optimized_data[0]) + " " + str(gall_optimized_data[1]) + " " + str(gall_optimized_data[2]))
\ No newline at end of file
+    return [str(data[0]) + " " + str(data[1]) + " " + str(data[2]) for data in [cho_optimized_data, gall_optimized_data]]
+
+
+if __name__ == '__main__':
+    laps = int(input())
+    checkpointCount = int(input())
+    initialize_race(laps, [[int(j) for j in input().split()] for i in range(checkpointCount)])
+
+    # game loop
+    while True:
+        for line in play_turn(input):
+            print(line)
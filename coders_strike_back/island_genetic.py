@@ -0,0 +1,273 @@
+'''
+Island model for the genetic algorithm of csb_engine.py (offline analysis and local self-play)
+
+Several populations evolve independently in the processes of a multiprocessing pool from the same snapshot of the pods.
+Every NB_GENERATIONS_BY_EPOCH generations, the best genomes of each island migrate to the next island (ring topology).
+The coordinator returns the best solution found by all the islands before the end of the time budget.
+
+Usage: python island_genetic.py race.txt [--turn 1] [--islands 4] [--budget 145] [--runs 10]
+race.txt contains the standard input of the game: laps, checkpoints then the lines of the pods for each turn
+'''
+
+import sys
+import time
+import argparse
+import multiprocessing
+
+import numpy
+
+import csb_engine as engine
+
+NB_ISLANDS = multiprocessing.cpu_count()
+NB_GENERATIONS_BY_EPOCH = 5  # number of generations between two migrations
+NB_MIGRANTS = 2  # number of genomes sent to the next island at each migration
+TIME_BUDGET = 145.0  # ms, time to return the best solution
+SAFETY_MARGIN = 5.0  # ms kept to collect the results of the islands
+
+snapshot_id = None  # snapshot currently loaded in the worker process
+
+
+def read_snapshot(lines, turn=1):
+    '''
+    Build a snapshot of the race from the standard input of the game
+    @param lines: lines of the standard input (laps, checkpoints, then 4 lines of pods by turn)
+    @param turn: turn of the race to take the snapshot at (the pods of the previous turns are read in order)
+    @return: snapshot of the race
+    '''
+    lines = iter(lines)
+    nb_laps = int(next(lines))
+    nb_checkpoints = int(next(lines))
+    checkpoints = [[int(j) for j in next(lines).split()] for i in range(nb_checkpoints)]
+
+    engine.initialize_race(nb_laps, checkpoints)
+
+    read_line = lambda: next(lines)
+    for race_turn in range(turn + 1):
+        engine.cho.set_parameters(read_line, race_turn)
+        engine.gall.set_parameters(read_line, race_turn)
+        engine.boss1.set_boss_parameters(read_line, race_turn)
+        engine.boss2.set_boss_parameters(read_line, race_turn)
+        engine.update_roles()
+
+    return take_snapshot(turn)
+
+
+def take_snapshot(race_turn):
+    '''
+    Return a snapshot of the race of the engine, the pods being read for the current turn
+    '''
+    checkpoints = [[checkpoint.x, checkpoint.y] for checkpoint in engine.track.checkpoints]
+    pods = [pod.clone() for pod in [engine.cho, engine.gall, engine.boss1, engine.boss2]]
+    return (time.perf_counter_ns(), engine.laps, checkpoints, race_turn, pods)
+
+
+def load_snapshot(snapshot):
+    '''
+    Set the race of the engine to the snapshot and prepare the simulation of the turn
+    '''
+    global snapshot_id
+
+    if snapshot_id == snapshot[0]:
+        return
+
+    snapshot_id, nb_laps, checkpoints, race_turn, pods = snapshot
+
+    engine.initialize_race(nb_laps, checkpoints)
+    engine.race_turn = race_turn
+    for pod, saved_pod in zip([engine.cho, engine.gall, engine.boss1, engine.boss2], pods):
+        pod.load(saved_pod)
+        pod.check_next_checkpoint_id = saved_pod.check_next_checkpoint_id
+        pod.switch_checkpoint = saved_pod.switch_checkpoint
+        pod.waiting_turn = saved_pod.waiting_turn
+        pod.waiting_point = saved_pod.waiting_point
+
+    engine.update_roles()
+    engine.prepare_simulation()
+
+
+def get_population(ga):
+    '''
+    Return the genes, the results and the statistics of the population of the genetic algorithm
+    '''
+    genes = numpy.array([solution.genes for solution in ga.solutions])
+    results = [solution.result for solution in ga.solutions]
+    return genes, results, ga.average, ga.maximum, ga.apocalypse
+
+
+def set_population(ga, population):
+    '''
+    Restore in the genetic algorithm a population returned by get_population
+    '''
+    genes, results, ga.average, ga.maximum, ga.apocalypse = population
+
+    ga.solutions = []
+    ga.nb_rows = 0
+    for row, result in zip(genes, results):
+        solution = engine.Solution(ga.population, ga.get_free_row())
+        solution.genes[:] = row
+        solution.result = result
+        ga.solutions.append(solution)
+
+    ga.solutions.sort(key=lambda solution: solution.result, reverse=True)
+
+
+def evolve_island(task):
+    '''
+    Run the generations of one epoch on an island (executed in a worker process)
+    No generation starts after the deadline so the tasks left in the pool by a timeout end at once
+    @param task: (snapshot, index of the island, epoch, population or None for a new one, number of generations, seed,
+    deadline as a time.time() shared by the processes)
+    @return: (index of the island, population), the population being None if the deadline passed before it was generated
+    '''
+    snapshot, index, epoch, population, nb_generations, seed, deadline = task
+    if time.time() >= deadline:
+        return index, population
+
+    load_snapshot(snapshot)
+    engine.set_random_seed((seed, index, epoch))
+
+    ga = engine.GeneticAlgorithm()
+    if population is None:
+        ga.generate_population(True)
+        ga.maximum = ga.get_best_solution().result
+    else:
+        set_population(ga, population)
+
+    for i in range(nb_generations):
+        if time.time() >= deadline:
+            break
+        ga.build_generation_proba()
+
+    return index, get_population(ga)
+
+
+def migrate(populations, nb_migrants):
+    '''
+    Replace the worst genomes of each island by the best genomes of the previous island
+    '''
+    migrants = [(genes[:nb_migrants].copy(), results[:nb_migrants]) for genes, results, average, maximum, apocalypse in populations]
+
+    for i, (genes, results, average, maximum, apocalypse) in enumerate(populations):
+        migrant_genes, migrant_results = migrants[i - 1]
+        genes[-nb_migrants:] = migrant_genes
+        results[-nb_migrants:] = migrant_results
+
+
+def run_islands(pool, snapshot, nb_islands=NB_ISLANDS, nb_generations=NB_GENERATIONS_BY_EPOCH, nb_migrants=NB_MIGRANTS,
+                time_budget=TIME_BUDGET, seed=0):
+    '''
+    Evolve the islands until the end of the time budget
+    @param pool: multiprocessing pool running the islands
+    @return: genes and result of the best solution, history of the best result as a list of (elapsed time in ms, result)
+    '''
+    start_time = time.perf_counter()
+    deadline = time.time() + (time_budget - SAFETY_MARGIN) / 1000.0  # end of the generations of the islands
+    populations = [None] * nb_islands
+    best_genes = None
+    best_result = -engine.inf
+    history = []
+
+    epoch = 0
+    epoch_duration = 0.0
+    elapsed_time = 0.0
+    while elapsed_time + epoch_duration + SAFETY_MARGIN <= time_budget:
+        # The first epoch only generates the populations so that a solution is always available
+        nb_epoch_generations = nb_generations if epoch else 0
+        tasks = [(snapshot, i, epoch, populations[i], nb_epoch_generations, seed, deadline) for i in range(nb_islands)]
+        async_result = pool.map_async(evolve_island, tasks)
+        try:
+            # The safety margin is left to collect the generations running at the deadline
+            results = async_result.get(timeout=max(time_budget - elapsed_time, 0.0) / 1000.0)
+        except multiprocessing.TimeoutError:
+            break
+
+        if any(population is None for index, population in results):
+            break
+
+        for index, population in results:
+            populations[index] = population
+            genes, island_results, average, maximum, apocalypse = population
+            if island_results[0] > best_result:
+                best_genes = genes[0].copy()
+                best_result = island_results[0]
+
+        if nb_islands > 1:
+            migrate(populations, nb_migrants)
+
+        new_time = (time.perf_counter() - start_time) * 1000.0  # ms
+        epoch_duration = new_time - elapsed_time
+        elapsed_time = new_time
+        history.append((elapsed_time, best_result))
+        epoch += 1
+
+    return best_genes, best_result, history
+
+
+def run_single(snapshot, time_budget=TIME_BUDGET, seed=0):
+    '''
+    Evolve one population in the current process as the bot does during a turn (reference for the islands)
+    @return: genes and result of the best solution, history of the best result as a list of (elapsed time in ms, result)
+    '''
+    budget = engine.TimeBudget()
+    budget.start_turn(time_budget + engine.TIME_MARGIN)
+    load_snapshot(snapshot)
+    engine.set_random_seed(seed)
+
+    ga = engine.GeneticAlgorithm()
+    ga.generate_population(True)
+    best_solution = ga.get_best_solution().clone()
+    ga.maximum = best_solution.result
+    history = []
+
+    nb_solutions = budget.get_nb_solutions()
+    while nb_solutions > 0:
+        budget.start_generation()
+        ga.build_generation_proba(nb_solutions)
+        budget.end_generation(nb_solutions, ga.nb_scored)
+        if ga.get_best_solution().result > best_solution.result:
+            best_solution = ga.get_best_solution().clone()
+
+        history.append((budget.get_elapsed_time(), best_solution.result))
+        nb_solutions = budget.get_nb_solutions()
+
+    return best_solution.genes, best_solution.result, history
+
+
+def get_gain_by_ms(history):
+    '''
+    Return the improvement of the best result by millisecond between the first and the last point of the history
+    '''
+    if len(history) < 2 or history[-1][0] == history[0][0]:
+        return 0.0
+    return (history[-1][1] - history[0][1]) / (history[-1][0] - history[0][0])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the island model with the single population genetic algorithm')
+    parser.add_argument('race', help='file with the standard input of the game')
+    parser.add_argument('--turn', type=int, default=1, help='turn of the race to optimize')
+    parser.add_argument('--islands', type=int, default=NB_ISLANDS, help='number of islands (worker processes)')
+    parser.add_argument('--generations', type=int, default=NB_GENERATIONS_BY_EPOCH, help='generations between two migrations')
+    parser.add_argument('--migrants', type=int, default=NB_MIGRANTS, help='genomes sent to the next island at each migration')
+    parser.add_argument('--budget', type=float, default=TIME_BUDGET, help='time budget in ms')
+    parser.add_argument('--runs', type=int, default=10, help='number of runs to average')
+    args = parser.parse_args()
+
+    with open(args.race) as race_file:
+        snapshot = read_snapshot(race_file.read().splitlines(), args.turn)
+
+    with multiprocessing.Pool(args.islands) as pool:
+        # Warm up the workers so that the time to start the processes is not measured
+        pool.map(evolve_island, [(snapshot, i, 0, None, 1, 0, engine.inf) for i in range(args.islands)])
+
+        for name, run in [('single', lambda seed: run_single(snapshot, args.budget, seed)),
+                          ('islands', lambda seed: run_islands(pool, snapshot, args.islands, args.generations, args.migrants, args.budget, seed))]:
+            results = []
+            gains = []
+            for seed in range(args.runs):
+                genes, result, history = run(seed)
+                results.append(result)
+                gains.append(get_gain_by_ms(history))
+
+            print(name, 'best result: %.2f (min %.2f, max %.2f)' % (numpy.mean(results), min(results), max(results)),
+                  'gain by ms: %.2f' % numpy.mean(gains), file=sys.stderr)
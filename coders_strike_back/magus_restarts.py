@@ -0,0 +1,111 @@
+'''
+Independent restarts of the simulated annealing of gold_league_magus.py (offline analysis of the search)
+
+Each restart anneals from a new population with its own seed in a process of a multiprocessing pool, all the restarts
+playing from the same snapshot of the pods. The best solution of the restarts is kept and the convergence curves
+(best score as a function of the time) are averaged to compare the temperature schedules.
+
+Usage: python magus_restarts.py race.txt [--turn 1] [--restarts 8] [--budget 140] [--schedule exponential]
+race.txt contains the standard input of the game: laps, checkpoints then the lines of the pods for each turn
+'''
+
+import sys
+import random
+import argparse
+import multiprocessing
+
+import numpy
+
+import gold_league_magus as magus
+
+NB_RESTARTS = multiprocessing.cpu_count()
+CURVE_STEP = 10.0  # ms, time between two points of the convergence curve
+
+
+def read_snapshot(lines, turn=1):
+    '''
+    Set the race of the magus module from the standard input of the game
+    @param lines: lines of the standard input (laps, checkpoints, then 4 lines of pods by turn)
+    @param turn: turn of the race to take the snapshot at (the pods of the previous turns are read in order)
+    @return: snapshot of the pods at the turn
+    '''
+    lines = iter(lines)
+    nb_laps = int(next(lines))
+    nb_checkpoints = int(next(lines))
+    checkpoints = [[int(j) for j in next(lines).split()] for i in range(nb_checkpoints)]
+
+    magus.initialize_race(nb_laps, checkpoints)
+
+    read_line = lambda: next(lines)
+    for race_turn in range(turn + 1):
+        for pod in [magus.cho, magus.gall, magus.boss1, magus.boss2]:
+            pod.set_parameters(read_line, False, False)
+
+    return magus.Snapshot([magus.cho, magus.gall, magus.boss1, magus.boss2])
+
+
+def run_restart(task):
+    '''
+    Anneal from a new population (executed in a worker process)
+    @param task: (lines of the race, turn, seed, time budget in ms, temperature schedule)
+    @return: (seed, best score, first move of each pod as (angle, thrust), history of the annealing)
+    '''
+    lines, turn, seed, time_budget, schedule = task
+    snapshot = read_snapshot(lines, turn)
+    random.seed(seed)
+
+    annealing = magus.SimulatedAnnealing(snapshot, schedule)
+    best_solution, best_score = annealing.run(magus.generate_population(None), time_budget)
+    first_moves = [(moves[0].angle, moves[0].thrust) for moves in [best_solution.pod1_moves, best_solution.pod2_moves]]
+    return seed, best_score, first_moves, annealing.history
+
+
+def get_curve(histories, time_budget, step=CURVE_STEP):
+    '''
+    Return the convergence curve averaged on the restarts
+    @param histories: histories of the annealing as lists of (elapsed time in ms, number of evaluations, best score)
+    @return: list of (time in ms, mean number of evaluations, mean best score) every step ms
+    '''
+    curve = []
+    for time in numpy.arange(step, time_budget + step, step):
+        points = [[point for point in history if point[0] <= time] or history[:1] for history in histories]
+        curve.append((float(time), float(numpy.mean([history[-1][1] for history in points])),
+                      float(numpy.mean([history[-1][2] for history in points]))))
+
+    return curve
+
+
+def get_evaluations_by_ms(histories):
+    '''
+    Return the mean number of evaluated solutions by millisecond of the restarts
+    '''
+    return float(numpy.mean([history[-1][1] / history[-1][0] for history in histories]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run independent restarts of the simulated annealing of gold_league_magus.py')
+    parser.add_argument('race', help='file with the standard input of the game')
+    parser.add_argument('--turn', type=int, default=1, help='turn of the race to optimize')
+    parser.add_argument('--restarts', type=int, default=NB_RESTARTS, help='number of independent restarts')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='number of restarts run at once')
+    parser.add_argument('--budget', type=float, default=magus.TIME_BUDGET, help='time budget of a restart in ms')
+    parser.add_argument('--schedule', default=magus.TEMPERATURE_SCHEDULE, choices=['exponential', 'linear'], help='temperature schedule')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first restart')
+    args = parser.parse_args()
+
+    with open(args.race) as race_file:
+        lines = race_file.read().splitlines()
+
+    tasks = [(lines, args.turn, args.seed + i, args.budget, args.schedule) for i in range(args.restarts)]
+    with multiprocessing.Pool(args.processes) as pool:
+        results = pool.map(run_restart, tasks)
+
+    scores = [score for seed, score, first_moves, history in results]
+    histories = [history for seed, score, first_moves, history in results]
+    seed, best_score, first_moves, history = max(results, key=lambda result: result[1])
+
+    print('best score: %.2f (seed %d, first moves %s)' % (best_score, seed, first_moves), file=sys.stderr)
+    print('restarts: mean %.2f, min %.2f, max %.2f' % (numpy.mean(scores), min(scores), max(scores)), file=sys.stderr)
+    print('evaluations by ms: %.3f' % get_evaluations_by_ms(histories), file=sys.stderr)
+    for time, nb_evaluations, score in get_curve(histories, args.budget):
+        print('%6.1f ms %8.1f evaluations %16.2f' % (time, nb_evaluations, score), file=sys.stderr)
@@ -0,0 +1,373 @@
+'''
+Tuning of the constants of gold_league_optimizer.py on headless races
+
+The TUNED_CONSTANTS of the optimizer are searched as a vector normalized in [0, 1] by CMA-ES or by successive halving.
+A configuration is evaluated by races of the optimizer bot against the bosses of csb_engine.py (apply_boss)
+on the random maps of referee.py, simulated in the processes of a multiprocessing pool. The fitness of each
+(parameter vector, map seed) is cached in a json file so that a race is never simulated twice.
+
+Usage: python optimizer_tuner.py [--method cmaes] [--maps 16] [--budget 2000] [--cache tuner_cache.json] [--output best.json]
+'''
+
+import os
+import sys
+import json
+import random
+import argparse
+import contextlib
+import multiprocessing
+from math import log
+from math import sqrt
+from math import ceil
+
+import numpy
+
+import csb_engine as engine
+import gold_league_optimizer as optimizer
+import referee
+
+# Range of each tuned constant: name, minimum, maximum, True for an integer
+PARAMETERS = [('SAFETY_DISTANCE', 600, 1600, True),
+              ('BOOST_DISTANCE', 2000, 8000, True),
+              ('X_DELTA_POSITION', 0, 1500, True),
+              ('Y_DELTA_POSITION', 0, 1500, True),
+              ('X_DELTA_FOLLOWER', 0, 1500, True),
+              ('Y_DELTA_FOLLOWER', 0, 1500, True),
+              ('MIN_THRUST', 0, 60, True),
+              ('MIN_TO_CHECKPOINT', 0, 600, True),
+              ('MAX_ANGLE', 60, 180, True),
+              ('MIN_ANGLE', 0, 60, True),
+              ('TURN_SHIELD_OFF', 3, 10, True),
+              ('FIRST_SLOWING_DOWN_COEFF_DIST', 2, 20, True),
+              ('FIRST_SLOWING_COEFF', 0.0, 1.0, False),
+              ('SECOND_SLOWING_DOWN_COEFF_DIST', 1, 10, True),
+              ('SECOND_SLOWING_COEFF', 0.0, 1.0, False),
+              ('SHIELD_ACTIVATION_COEFF_DIST', 1, 20, True)]
+NAMES = [parameter[0] for parameter in PARAMETERS]
+PRECISION = 3  # decimals of the float parameters, close configurations share their races in the cache
+
+MAX_TURNS = referee.MAX_TURNS
+NB_MAPS = 16  # maps on which a configuration is evaluated
+BUDGET = 2000  # maximum number of races simulated by a search and the final comparison with the default values
+SIGMA = 0.2  # initial step of CMA-ES in the normalized space
+HALVING_CONFIGURATIONS = 32  # configurations of the first round of successive halving
+HALVING_ETA = 2  # ratio of the configurations dropped and of the maps added at each round
+
+
+def decode(vector):
+    '''
+    Return the values of the constants of a vector normalized in [0, 1]
+    '''
+    values = []
+    for (name, minimum, maximum, is_integer), x in zip(PARAMETERS, numpy.clip(vector, 0.0, 1.0)):
+        value = minimum + x * (maximum - minimum)
+        values.append(int(round(value)) if is_integer else round(float(value), PRECISION))
+
+    return tuple(values)
+
+
+def encode(values):
+    '''
+    Return the normalized vector of the values of the constants
+    '''
+    return numpy.array([(value - minimum) / (maximum - minimum) for (name, minimum, maximum, is_integer), value in zip(PARAMETERS, values)])
+
+
+def get_default_values():
+    constants = dict(zip(optimizer.TUNED_CONSTANTS, optimizer.get_parameter_vector()))
+    return tuple(constants[name] for name in NAMES)
+
+
+def get_fitness(winner, turns, progress):
+    '''
+    Return the fitness of a race: 1 plus the ratio of the turns left for a win,
+    the progress of the best pod of the optimizer otherwise, minus 1 for a loss
+    @param progress: ratio of the checkpoints of the race checked by the best pod of the optimizer
+    '''
+    if winner == 0:
+        return 1.0 + (MAX_TURNS - turns) / MAX_TURNS
+    elif winner == 1:
+        return progress - 1.0
+    else:
+        return progress
+
+
+def run_race(values, seed):
+    '''
+    Play the race of the optimizer configured with the values against the bosses on the map of the seed
+    @return: dictionary with the winner (0 for the optimizer, 1 for the bosses, None for a draw), the number of turns,
+    the progress of the best pod of the optimizer and the reason of the end
+    '''
+    checkpoints = referee.generate_map(random.Random(seed))
+    engine.initialize_race(referee.NB_LAPS, checkpoints)
+    optimizer.initialize_race(referee.NB_LAPS, checkpoints)
+    constants = dict(zip(NAMES, values))
+    optimizer.set_parameter_vector([constants[name] for name in optimizer.TUNED_CONSTANTS])
+
+    # apply_boss keeps the bosses away from the pods of the optimizer through the globals of the engine
+    pods = referee.create_pods()
+    engine.cho, engine.gall, engine.boss1, engine.boss2 = pods
+    for boss in pods[2:]:
+        boss.angle = boss.get_angle(boss.get_next_checkpoint())
+
+    winner = None
+    reason = 'max turns'
+    race_turn = 0
+    while race_turn < MAX_TURNS and reason == 'max turns':
+        lines = iter([referee.get_input(pod, race_turn) for pod in pods])
+        try:
+            for pod, line in zip(pods[:2], optimizer.play_turn(lambda: next(lines))):
+                referee.apply_output(pod, line, race_turn)
+        except (ValueError, ZeroDivisionError):
+            winner = 1
+            reason = 'invalid output'
+            break
+
+        for boss in pods[2:]:
+            boss.race_turn = race_turn
+            boss.apply_boss()
+        engine.play(pods, [True, True, True, True])
+        for pod in pods:
+            pod.vx = int(pod.vx)
+            pod.vy = int(pod.vy)
+        race_turn += 1
+
+        finishers = [player for player in range(2) if any(pod.next_checkpoint_id == -1 for pod in pods[2 * player:2 * player + 2])]
+        timeouts = [player for player in range(2) if max(pod.timeout for pod in pods[2 * player:2 * player + 2]) <= 0]
+        if finishers:
+            winner = finishers[0] if len(finishers) == 1 else None
+            reason = 'race finished'
+        elif timeouts:
+            winner = 1 - timeouts[0] if len(timeouts) == 1 else None
+            reason = 'timeout to reach a checkpoint'
+
+    progress = max(pod.checked for pod in pods[:2]) / (referee.NB_LAPS * len(checkpoints))
+    return {'winner': winner, 'turns': race_turn, 'progress': min(progress, 1.0), 'reason': reason}
+
+
+def run_race_task(task):
+    '''
+    Return the fitness of the race of a (parameter values, map seed) task (executed in a worker process)
+    '''
+    values, seed = task
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stderr(devnull):
+        result = run_race(values, seed)
+
+    return values, seed, get_fitness(result['winner'], result['turns'], result['progress'])
+
+
+class Evaluator:
+    '''
+    Evaluate configurations on maps in a process pool, the fitness by (parameter values, map seed) being cached
+    '''
+
+    def __init__(self, pool, cache_path=None, budget=BUDGET):
+        self.pool = pool
+        self.cache_path = cache_path
+        self.budget = budget
+        self.cache = {}
+        self.nb_races = 0  # races simulated by this evaluator
+        self.nb_hits = 0  # races found in the cache
+
+        if cache_path and os.path.exists(cache_path):
+            with open(cache_path) as cache_file:
+                self.cache = {tuple(json.loads(key)): fitness for key, fitness in json.load(cache_file).items()}
+
+    @staticmethod
+    def get_key(values, seed):
+        return (json.dumps(list(values)), seed)
+
+    def get_tasks(self, configurations, seeds):
+        '''
+        Return the (values, seed) races of the configurations on the maps not found in the cache
+        '''
+        tasks = []
+        for values in configurations:
+            for seed in seeds:
+                if Evaluator.get_key(values, seed) not in self.cache and (values, seed) not in tasks:
+                    tasks.append((values, seed))
+
+        return tasks
+
+    def is_affordable(self, configurations, seeds):
+        '''
+        Return True if the races of the configurations on the maps fit in the budget left
+        '''
+        return self.nb_races + len(self.get_tasks(configurations, seeds)) <= self.budget
+
+    def evaluate(self, configurations, seeds):
+        '''
+        Return the mean fitness of each configuration (tuple of values) on the maps of the seeds
+        '''
+        tasks = self.get_tasks(configurations, seeds)
+        if self.nb_races + len(tasks) > self.budget:
+            raise ValueError('%d races over the budget of %d races' % (self.nb_races + len(tasks) - self.budget, self.budget))
+        self.nb_hits += len(configurations) * len(seeds) - len(tasks)
+
+        for values, seed, fitness in self.pool.imap_unordered(run_race_task, tasks):
+            self.cache[Evaluator.get_key(values, seed)] = fitness
+        self.nb_races += len(tasks)
+
+        if tasks and self.cache_path:
+            with open(self.cache_path, 'w') as cache_file:
+                json.dump({json.dumps(list(key)): fitness for key, fitness in self.cache.items()}, cache_file)
+
+        return numpy.array([numpy.mean([self.cache[Evaluator.get_key(values, seed)] for seed in seeds]) for values in configurations])
+
+
+class CMAES:
+    '''
+    (mu/mu_w, lambda)-CMA-ES maximizing a function of the normalized vectors
+    https://arxiv.org/abs/1604.00772 (The CMA Evolution Strategy: A Tutorial, Hansen)
+    '''
+
+    def __init__(self, mean, sigma, rng, population_size=None):
+        n = len(mean)
+        self.n = n
+        self.mean = numpy.array(mean, dtype=float)
+        self.sigma = sigma
+        self.rng = rng
+        self.population_size = population_size or 4 + int(3 * log(n))
+        self.mu = self.population_size // 2
+
+        weights = log(self.mu + 0.5) - numpy.log(numpy.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mu_eff = 1.0 / (self.weights ** 2).sum()
+
+        # Learning rates of the step size and of the covariance matrix
+        self.c_c = (4 + self.mu_eff / n) / (n + 4 + 2 * self.mu_eff / n)
+        self.c_sigma = (self.mu_eff + 2) / (n + self.mu_eff + 5)
+        self.c_1 = 2 / ((n + 1.3) ** 2 + self.mu_eff)
+        self.c_mu = min(1 - self.c_1, 2 * (self.mu_eff - 2 + 1 / self.mu_eff) / ((n + 2) ** 2 + self.mu_eff))
+        self.d_sigma = 1 + 2 * max(0.0, sqrt((self.mu_eff - 1) / (n + 1)) - 1) + self.c_sigma
+        self.chi_n = sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n * n))
+
+        self.p_c = numpy.zeros(n)
+        self.p_sigma = numpy.zeros(n)
+        self.C = numpy.eye(n)
+        self.B = numpy.eye(n)
+        self.D = numpy.ones(n)
+        self.generation = 0
+
+    def ask(self):
+        '''
+        Return a population of vectors sampled around the mean, clipped to [0, 1]
+        '''
+        z = self.rng.standard_normal((self.population_size, self.n))
+        return numpy.clip(self.mean + self.sigma * (z * self.D) @ self.B.T, 0.0, 1.0)
+
+    def tell(self, vectors, fitnesses):
+        '''
+        Update the distribution with the fitness of the vectors returned by ask
+        '''
+        y = (vectors[numpy.argsort(-fitnesses)[:self.mu]] - self.mean) / self.sigma
+        y_w = self.weights @ y
+        self.mean = self.mean + self.sigma * y_w
+
+        inverse_sqrt_C = self.B @ numpy.diag(1.0 / self.D) @ self.B.T
+        self.p_sigma = (1 - self.c_sigma) * self.p_sigma + sqrt(self.c_sigma * (2 - self.c_sigma) * self.mu_eff) * inverse_sqrt_C @ y_w
+        norm_p_sigma = numpy.linalg.norm(self.p_sigma)
+        h_sigma = norm_p_sigma / sqrt(1 - (1 - self.c_sigma) ** (2 * (self.generation + 1))) < (1.4 + 2 / (self.n + 1)) * self.chi_n
+
+        self.p_c = (1 - self.c_c) * self.p_c + h_sigma * sqrt(self.c_c * (2 - self.c_c) * self.mu_eff) * y_w
+        rank_one = numpy.outer(self.p_c, self.p_c) + (1 - h_sigma) * self.c_c * (2 - self.c_c) * self.C
+        rank_mu = (self.weights[:, None] * y).T @ y
+        self.C = (1 - self.c_1 - self.c_mu) * self.C + self.c_1 * rank_one + self.c_mu * rank_mu
+        self.sigma *= numpy.exp((self.c_sigma / self.d_sigma) * (norm_p_sigma / self.chi_n - 1))
+
+        self.C = (self.C + self.C.T) / 2.0
+        eigenvalues, self.B = numpy.linalg.eigh(self.C)
+        self.D = numpy.sqrt(numpy.maximum(eigenvalues, 1e-20))
+        self.generation += 1
+
+
+def search_cmaes(evaluator, seeds, rng, sigma=SIGMA):
+    '''
+    Search the constants by CMA-ES from the default values until the budget of races cannot afford a generation
+    @return: list of (values, fitness) of the evaluated configurations
+    '''
+    cmaes = CMAES(encode(get_default_values()), sigma, rng)
+    history = []
+    while True:
+        vectors = cmaes.ask()
+        configurations = [decode(vector) for vector in vectors]
+        if not evaluator.is_affordable(configurations, seeds):
+            return history
+
+        fitnesses = evaluator.evaluate(configurations, seeds)
+        cmaes.tell(vectors, fitnesses)
+        history += list(zip(configurations, fitnesses.tolist()))
+        print('generation %d: best %.4f, mean %.4f, sigma %.4f, races %d' % (cmaes.generation, fitnesses.max(), fitnesses.mean(), cmaes.sigma, evaluator.nb_races), file=sys.stderr)
+
+
+def search_halving(evaluator, seeds, rng, nb_configurations=HALVING_CONFIGURATIONS, eta=HALVING_ETA):
+    '''
+    Search the constants by successive halving: the configurations are evaluated on a few maps, the best 1 / eta
+    are kept and evaluated on eta times more maps until one configuration is left, all the maps are played
+    or the budget of races cannot afford the next round
+    The first round is cut to the configurations that fit in the budget
+    @return: list of (values, fitness) of the configurations of the last round played
+    '''
+    configurations = [get_default_values()] + [decode(vector) for vector in rng.random((nb_configurations - 1, len(PARAMETERS)))]
+    nb_maps = max(1, len(seeds) // eta ** ceil(log(nb_configurations, eta)))
+    while not evaluator.is_affordable(configurations, seeds[:nb_maps]) and len(configurations) > 1:
+        configurations.pop()
+
+    history = []
+    while evaluator.is_affordable(configurations, seeds[:nb_maps]):
+        fitnesses = evaluator.evaluate(configurations, seeds[:nb_maps])
+        history = list(zip(configurations, fitnesses.tolist()))
+        print('round: %d configurations on %d maps, best %.4f, races %d' % (len(configurations), nb_maps, fitnesses.max(), evaluator.nb_races), file=sys.stderr)
+        if len(configurations) == 1 or nb_maps == len(seeds):
+            break
+
+        order = numpy.argsort(-fitnesses)[:max(1, len(configurations) // eta)]
+        configurations = [configurations[i] for i in order]
+        nb_maps = min(nb_maps * eta, len(seeds))
+
+    return history
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Tune the constants of gold_league_optimizer.py on headless races')
+    parser.add_argument('--method', default='cmaes', choices=['cmaes', 'halving'], help='search method')
+    parser.add_argument('--maps', type=int, default=NB_MAPS, help='number of maps on which a configuration is evaluated')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first map and of the search')
+    parser.add_argument('--budget', type=int, default=BUDGET, help='maximum number of races simulated by the search')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='number of races simulated at once')
+    parser.add_argument('--cache', default='tuner_cache.json', help='json file caching the fitness by configuration and map')
+    parser.add_argument('--output', help='json file to write the best configuration')
+    args = parser.parse_args()
+
+    # The races of the final comparison on all the maps are kept out of the budget of the search
+    nb_final_races = 2 * args.maps
+    if args.budget < nb_final_races:
+        parser.error('the budget must be at least %d races (2 by map for the final comparison)' % nb_final_races)
+
+    seeds = list(range(args.seed, args.seed + args.maps))
+    rng = numpy.random.default_rng(args.seed)
+
+    with multiprocessing.Pool(args.processes) as pool:
+        evaluator = Evaluator(pool, args.cache, args.budget - nb_final_races)
+        if args.method == 'cmaes':
+            history = search_cmaes(evaluator, seeds, rng)
+        else:
+            history = search_halving(evaluator, seeds, rng)
+
+        # The best configuration of the search (possibly found on a few maps) is compared with the default values
+        # on all the maps, the better of the two is reported
+        default_values = get_default_values()
+        candidate_values = max(history, key=lambda configuration: configuration[1])[0] if history else default_values
+        evaluator.budget = args.budget
+        candidate_fitness, default_fitness = evaluator.evaluate([candidate_values, default_values], seeds).tolist()
+
+    is_default = default_fitness >= candidate_fitness
+    best_values = default_values if is_default else candidate_values
+    report = {'method': args.method, 'maps': seeds, 'races': evaluator.nb_races, 'cache_hits': evaluator.nb_hits,
+              'fitness': max(candidate_fitness, default_fitness), 'default_fitness': default_fitness,
+              'candidate_fitness': candidate_fitness, 'is_default': is_default, 'parameters': dict(zip(NAMES, best_values))}
+    print(json.dumps(report, indent=1))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump(report, output_file, indent=1)
@@ -0,0 +1,279 @@
+'''
+Local referee of Coders Strike Back to compare two bots offline
+
+The races are simulated with the Pod and Checkpoint physics of csb_engine.py (rotation limited to 18 degrees,
+friction, shield, boost, collisions and timeout of 100 turns to reach the next checkpoint). Each bot is a python script
+run as a subprocess and driven by the standard input/output protocol of the game.
+
+Usage: python referee.py bot1.py bot2.py [--races 200] [--processes 4] [--output report.json]
+'''
+
+import sys
+import json
+import time
+import queue
+import random
+import argparse
+import threading
+import subprocess
+import multiprocessing
+
+import numpy
+
+import csb_engine as engine
+
+WIDTH = 16000
+HEIGHT = 9000
+NB_LAPS = 3
+MIN_NB_CHECKPOINTS = 3
+MAX_NB_CHECKPOINTS = 8
+MIN_DISTANCE_CHECKPOINTS = 2 * engine.DOUBLE_RADIUS_CHECKPOINT  # minimum distance between two checkpoints of a map
+BORDER = engine.DOUBLE_RADIUS_CHECKPOINT  # minimum distance between a checkpoint and the border of the map
+MAX_TURNS = 500  # the race is a draw after this number of turns
+BOOST_THRUST = 650.0
+SHIELD_TURNS = 3  # number of turns without thrust after the activation of the shield
+START_OFFSETS = [[-500.0, 1500.0], [500.0, -1500.0]]  # position of the pods of each player on the start line
+
+FIRST_TURN_TIMEOUT = 1.0  # s, time of a bot to answer the first turn
+TURN_TIMEOUT = 0.15  # s, time of a bot to answer the next turns
+PERCENTILES = [50, 90, 99]
+
+
+class Bot():
+    '''
+    Bot script run as a subprocess, the lines of its standard output are read by a thread to answer with a timeout
+    '''
+
+    def __init__(self, script, python):
+        self.process = subprocess.Popen([python, '-u', script], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.DEVNULL, universal_newlines=True, bufsize=1)
+        self.lines = queue.Queue()
+        self.reader = threading.Thread(target=self.read_lines, daemon=True)
+        self.reader.start()
+
+    def read_lines(self):
+        for line in self.process.stdout:
+            self.lines.put(line)
+        self.lines.put(None)  # end of the output of the bot
+
+    def send(self, lines):
+        self.process.stdin.write('\n'.join(lines) + '\n')
+        self.process.stdin.flush()
+
+    def receive(self, nb_lines, timeout):
+        '''
+        Return the next lines written by the bot or None if it did not answer in time
+        '''
+        deadline = time.perf_counter() + timeout
+        lines = []
+        while len(lines) < nb_lines:
+            remaining_time = deadline - time.perf_counter()
+            try:
+                line = self.lines.get(timeout=max(remaining_time, 0.0))
+            except queue.Empty:
+                return None
+
+            if line is None:
+                return None
+            lines.append(line)
+
+        return lines
+
+    def stop(self):
+        self.process.kill()
+        self.process.wait()
+
+
+def generate_map(rand):
+    '''
+    Return random checkpoints far enough from each other and from the borders
+    '''
+    nb_checkpoints = rand.randint(MIN_NB_CHECKPOINTS, MAX_NB_CHECKPOINTS)
+    checkpoints = []
+    while len(checkpoints) < nb_checkpoints:
+        x = rand.randint(BORDER, WIDTH - BORDER)
+        y = rand.randint(BORDER, HEIGHT - BORDER)
+        if all((x - cx) * (x - cx) + (y - cy) * (y - cy) >= MIN_DISTANCE_CHECKPOINTS * MIN_DISTANCE_CHECKPOINTS for cx, cy in checkpoints):
+            checkpoints.append([x, y])
+
+    return checkpoints
+
+
+def create_pods():
+    '''
+    Return the pods of the two players aligned on checkpoint 0, perpendicularly to the direction of checkpoint 1
+    '''
+    start = engine.track.checkpoints[0]
+    direction = engine.track.checkpoints[1]
+    distance = start.get_distance(direction)
+    normal_x = (start.y - direction.y) / distance
+    normal_y = (direction.x - start.x) / distance
+
+    pods = []
+    for player in range(2):
+        for index in range(2):
+            pod = engine.Pod('player' + str(player) + '_' + str(index), engine.RADIUS_POD)
+            offset = START_OFFSETS[player][index]
+            pod.x = round(start.x + normal_x * offset)
+            pod.y = round(start.y + normal_y * offset)
+            pod.bounce_with_checkpoint(start)
+            pods.append(pod)
+
+    return pods
+
+
+def get_input(pod, race_turn):
+    '''
+    Return the line of the pod sent to the bots (the angle is -1 at the first turn)
+    '''
+    angle = -1 if race_turn == 0 else round(pod.angle) % 360
+    return '%d %d %d %d %d %d' % (round(pod.x), round(pod.y), int(pod.vx), int(pod.vy), angle, pod.next_checkpoint_id % engine.checkpointCount)
+
+
+def apply_output(pod, line, race_turn):
+    '''
+    Rotate the pod to the target of the output of the bot and apply its thrust, boost or shield
+    '''
+    x, y, action = line.split()[:3]
+    target = engine.Point(int(x), int(y))
+    pod.race_turn = race_turn
+    pod.is_shield_activated = False
+
+    if pod.x != target.x or pod.y != target.y:
+        if race_turn == 0:
+            pod.angle = pod.get_angle(target)
+        else:
+            pod.rotate_angle(pod.get_delta_angle_orientation(target))
+
+    if action == engine.SHIELD:
+        pod.activate_shield()
+        thrust = 0.0
+    elif action == engine.BOOST and pod.boost_available:
+        pod.boost_available = False
+        thrust = BOOST_THRUST
+    elif action == engine.BOOST:
+        thrust = engine.MAX_THRUST
+    else:
+        thrust = min(max(float(action), engine.MIN_THRUST), engine.MAX_THRUST)
+
+    if race_turn - pod.turn_activated_shield <= SHIELD_TURNS:
+        thrust = 0.0
+
+    pod.accelerate(thrust)
+
+
+def run_race(task):
+    '''
+    Play a race between two bots
+    @param task: (scripts of the bots, python interpreter, seed of the map, True to swap the start positions)
+    @return: dictionary with the winner (0, 1 or None for a draw), the number of turns, the reason of the end and the response times
+    '''
+    scripts, python, seed, is_swapped = task
+    rand = random.Random(seed)
+    checkpoints = generate_map(rand)
+    engine.initialize_race(NB_LAPS, checkpoints)
+
+    pods = create_pods()
+    if is_swapped:
+        pods = pods[2:] + pods[:2]
+    bots = [Bot(script, python) for script in scripts]
+    response_times = [[], []]
+    winner = None
+    reason = 'max turns'
+
+    try:
+        for bot in bots:
+            bot.send([str(NB_LAPS), str(len(checkpoints))] + ['%d %d' % (x, y) for x, y in checkpoints])
+
+        race_turn = 0
+        while race_turn < MAX_TURNS and winner is None and reason == 'max turns':
+            outputs = []
+            for player, bot in enumerate(bots):
+                own_pods = pods[2 * player:2 * player + 2]
+                other_pods = pods[2 * (1 - player):2 * (1 - player) + 2]
+                start_time = time.perf_counter()
+                bot.send([get_input(pod, race_turn) for pod in own_pods + other_pods])
+                lines = bot.receive(2, FIRST_TURN_TIMEOUT if race_turn == 0 else TURN_TIMEOUT)
+                response_times[player].append((time.perf_counter() - start_time) * 1000.0)
+                outputs.append(lines)
+
+            losers = [player for player in range(2) if outputs[player] is None]
+            if losers:
+                winner = None if len(losers) == 2 else 1 - losers[0]
+                reason = 'no answer of the bot'
+                break
+
+            try:
+                for player in range(2):
+                    for index in range(2):
+                        apply_output(pods[2 * player + index], outputs[player][index], race_turn)
+            except ValueError:
+                winner = 1 - player
+                reason = 'invalid output'
+                break
+
+            engine.play(pods, [True, True, True, True])
+            for pod in pods:
+                pod.vx = int(pod.vx)
+                pod.vy = int(pod.vy)
+            race_turn += 1
+
+            finishers = [player for player in range(2) if any(pod.next_checkpoint_id == -1 for pod in pods[2 * player:2 * player + 2])]
+            timeouts = [player for player in range(2) if max(pod.timeout for pod in pods[2 * player:2 * player + 2]) <= 0]
+            if finishers:
+                winner = finishers[0] if len(finishers) == 1 else None
+                reason = 'race finished'
+            elif timeouts:
+                winner = 1 - timeouts[0] if len(timeouts) == 1 else None
+                reason = 'timeout to reach a checkpoint'
+    finally:
+        for bot in bots:
+            bot.stop()
+
+    return {'seed': seed, 'swapped': is_swapped, 'winner': winner, 'turns': race_turn, 'reason': reason, 'response_times': response_times}
+
+
+def get_report(scripts, results):
+    '''
+    Return the win rate, the average length of the races and the percentiles of the response times of each bot
+    '''
+    report = {'races': len(results), 'draws': sum(1 for result in results if result['winner'] is None),
+              'average_turns': float(numpy.mean([result['turns'] for result in results])),
+              'reasons': {}, 'bots': []}
+
+    for result in results:
+        report['reasons'][result['reason']] = report['reasons'].get(result['reason'], 0) + 1
+
+    for player, script in enumerate(scripts):
+        first_turn_times = [result['response_times'][player][0] for result in results if result['response_times'][player]]
+        turn_times = [time for result in results for time in result['response_times'][player][1:]]
+        bot_report = {'script': script,
+                      'win_rate': sum(1 for result in results if result['winner'] == player) / len(results),
+                      'first_turn_max_ms': max(first_turn_times) if first_turn_times else None}
+        for percentile in PERCENTILES:
+            bot_report['p' + str(percentile) + '_ms'] = float(numpy.percentile(turn_times, percentile)) if turn_times else None
+        report['bots'].append(bot_report)
+
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run races between two bots of Coders Strike Back')
+    parser.add_argument('bots', nargs=2, help='python scripts of the two bots')
+    parser.add_argument('--races', type=int, default=100, help='number of races (each map is played twice, swapping the start positions)')
+    parser.add_argument('--processes', type=int, default=multiprocessing.cpu_count(), help='number of races played at once')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first map')
+    parser.add_argument('--python', default=sys.executable, help='python interpreter running the bots')
+    parser.add_argument('--output', help='json file to write the report and the results of the races')
+    args = parser.parse_args()
+
+    tasks = [(args.bots, args.python, args.seed + i // 2, i % 2 == 1) for i in range(args.races)]
+    with multiprocessing.Pool(args.processes) as pool:
+        results = list(pool.imap_unordered(run_race, tasks))
+
+    report = get_report(args.bots, results)
+    print(json.dumps(report, indent=1))
+
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            json.dump({'report': report, 'results': sorted(results, key=lambda result: (result['seed'], result['swapped']))}, output_file, indent=1)
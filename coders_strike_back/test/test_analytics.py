@@ -0,0 +1,20 @@
+import unittest
+
+import numpy
+
+import analytics
+
+
+class TestAnalytics(unittest.TestCase):
+
+    def test_aggregate_no_run(self):
+        summary = analytics.aggregate([])
+        self.assertEqual(summary['nb_runs'], 0)
+        self.assertEqual(len(summary['nb_generations_by_turn']), 0)
+        self.assertTrue(numpy.isnan(summary['nb_generations_mean']))
+        self.assertTrue(numpy.isnan(summary['max_scores_percentiles']).all())
+        self.assertEqual(len(summary['max_scores_percentiles']), len(analytics.PERCENTILES))
+
+
+if __name__ == '__main__':
+    unittest.main()
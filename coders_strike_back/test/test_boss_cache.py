@@ -0,0 +1,56 @@
+import os
+import unittest
+
+import numpy
+
+import csb_engine as engine
+from benchmark import suite
+
+RACES_PATH = os.path.join(os.path.dirname(suite.__file__), 'races.json')
+
+
+class TestBossCache(unittest.TestCase):
+
+    def play_turn(self):
+        '''
+        Play one turn of the race: our pods follow the IA, the bosses follow their own moves
+        '''
+        pods = suite.get_pods()
+        for pod in [engine.cho, engine.gall]:
+            move = pod.generate_move_IA()
+            pod.apply(move.angle, move.thrust)
+        engine.boss1.apply_boss()
+        engine.boss2.apply_boss()
+        engine.play(pods, [True, True, True, True])
+
+        engine.race_turn += 1
+        for pod in pods:
+            pod.race_turn = engine.race_turn
+
+    def test_shifted_cache_as_rebuilt(self):
+        '''
+        The cache shifted after one turn holds the same predictions as a cache rebuilt from the current states
+        '''
+        nb_shifted = 0
+        for race in suite.load_races(RACES_PATH):
+            with self.subTest(race=race['name']):
+                suite.set_race(race)
+                self.play_turn()
+
+                for caches, boss in [(engine.caches_boss1, engine.boss1), (engine.caches_boss2, engine.boss2)]:
+                    nb_shifted += engine.is_boss_prediction_valid(caches, boss)
+                engine.generate_boss_cache()
+                shifted = [list(engine.caches_boss1), list(engine.caches_boss2)]
+
+                engine.boss_cache_turn = -1
+                engine.generate_boss_cache()
+                rebuilt = [list(engine.caches_boss1), list(engine.caches_boss2)]
+
+                numpy.testing.assert_allclose(numpy.array(shifted, dtype=float), numpy.array(rebuilt, dtype=float),
+                                              rtol=0.0, atol=1e-6)
+
+        self.assertGreater(nb_shifted, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
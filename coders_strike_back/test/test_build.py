@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import subprocess
+import unittest
+
+import build
+
+RACE_INPUT = '3\n4\n13050 1900\n6560 7800\n7500 1370\n12700 7100\n' \
+             '12593 1513 0 0 -1 1\n13507 2287 0 0 -1 1\n12136 1126 0 0 -1 1\n13964 2674 0 0 -1 1\n'
+
+
+class TestBuild(unittest.TestCase):
+
+    def test_engine_import(self):
+        '''
+        Importing the engine reads nothing on the standard input and prints nothing
+        '''
+        process = subprocess.run([sys.executable, '-c', 'import csb_engine'], cwd=build.DIRECTORY, stdin=subprocess.DEVNULL,
+                                 stdout=subprocess.PIPE, universal_newlines=True)
+        self.assertEqual(process.returncode, 0)
+        self.assertEqual(process.stdout, '')
+
+    def test_build(self):
+        source = build.build(build.ENTRY_POINTS[0])
+        self.assertNotIn('import csb_engine', source)
+        self.assertNotIn('from csb_engine', source)
+        compile(source, 'gold_league_genetic.py', 'exec')
+
+    def test_built_bot(self):
+        '''
+        The built bot runs alone (outside of the directory of the engine) and answers the first turn
+        '''
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bot.py')
+            with open(path, 'w') as bot_file:
+                bot_file.write(build.build(build.ENTRY_POINTS[0]))
+
+            process = subprocess.run([sys.executable, path], cwd=directory, input=RACE_INPUT, stdout=subprocess.PIPE,
+                                     stderr=subprocess.DEVNULL, universal_newlines=True)
+
+        self.assertEqual(len(process.stdout.splitlines()), 2)
+        for line in process.stdout.splitlines():
+            x, y, thrust = line.split()
+            self.assertEqual(thrust, '100')
+
+
+if __name__ == '__main__':
+    unittest.main()
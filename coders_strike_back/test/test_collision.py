@@ -0,0 +1,35 @@
+import unittest
+
+import csb_engine as engine
+
+
+class TestCollision(unittest.TestCase):
+
+    def get_collision_time(self, x, y, vx, vy, other_x=0.0, other_y=0.0, other_vx=0.0, other_vy=0.0):
+        '''
+        Return the collision time of two pods during the turn
+        '''
+        pod = engine.Unit('pod', engine.RADIUS_POD)
+        other = engine.Unit('other', engine.RADIUS_POD)
+        pod.set_coordinates(x, y, vx, vy)
+        other.set_coordinates(other_x, other_y, other_vx, other_vy)
+        return pod.get_collision_time(other, engine.SQUARED_DOUBLE_RADIUS_POD, True)
+
+    def test_contact(self):
+        self.assertEqual(self.get_collision_time(500.0, 0.0, 0.0, 0.0), 0.0)
+
+    def test_head_on(self):
+        time = self.get_collision_time(-900.0, 0.0, 1000.0, 0.0)
+        self.assertGreater(time, 0.0)
+        self.assertLess(time, 1.0)
+        self.assertEqual(self.get_collision_time(-900.0, 0.0, 500.0, 0.0, other_vx=-500.0), time)
+
+    def test_no_collision(self):
+        self.assertEqual(self.get_collision_time(-900.0, 0.0, -1000.0, 0.0), engine.NO_COLLISION)  # moving away
+        self.assertEqual(self.get_collision_time(-900.0, 0.0, 300.0, 0.0, other_vx=300.0), engine.NO_COLLISION)  # same speed
+        self.assertEqual(self.get_collision_time(-900.0, 900.0, 1000.0, 0.0), engine.NO_COLLISION)  # passing by
+        self.assertEqual(self.get_collision_time(-3000.0, 0.0, 1000.0, 0.0), engine.NO_COLLISION)  # too far
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from math import sqrt
+
+import gold_league_magus as magus
+
+
+class BouncingPod(magus.Pod):
+    '''
+    Pod predicting the exact collision times and bouncing elastically on the other pods (same mass) to test the events alone
+    The bounces are recorded
+    '''
+
+    def __init__(self, id, x, vx, bounces):
+        magus.Pod.__init__(self, id, magus.RADIUS_POD)
+        self.x = x
+        self.y = 4000.0
+        self.vx = vx
+        self.bounces = bounces
+
+    def get_collision(self, other):
+        if isinstance(other, magus.Checkpoint):
+            return magus.Pod.get_collision(self, other)
+
+        x = self.x - other.x
+        y = self.y - other.y
+        vx = self.vx - other.vx
+        vy = self.vy - other.vy
+        a = vx ** 2 + vy ** 2
+        b = x * vx + y * vy
+        c = x ** 2 + y ** 2 - (self.radius + other.radius) ** 2
+        if c <= 0.0:
+            return magus.Collision(self, other, 0.0)
+        if a == 0.0 or b >= 0.0 or b ** 2 < a * c:
+            return None
+        return magus.Collision(self, other, (-b - sqrt(b ** 2 - a * c)) / a)
+
+    def bounce(self, other):
+        if isinstance(other, magus.Checkpoint):
+            self.bounce_with_checkpoint(other)
+            return
+
+        distance_x = other.x - self.x
+        distance_y = other.y - self.y
+        impulse = ((other.vx - self.vx) * distance_x + (other.vy - self.vy) * distance_y) / (distance_x ** 2 + distance_y ** 2)
+        self.vx += impulse * distance_x
+        self.vy += impulse * distance_y
+        other.vx -= impulse * distance_x
+        other.vy -= impulse * distance_y
+        self.bounces.append((self.id, other.id))
+
+
+class TestMagusCollision(unittest.TestCase):
+
+    def setUp(self):
+        magus.initialize_race(3, [(12000, 1000), (14000, 8000), (9000, 8000)])
+
+    def test_same_pair_twice(self):
+        '''
+        a hits b at rest (t = 0.1), b hits c coming back (t = 0.2) then b hits a again (t = 0.4)
+        '''
+        bounces = []
+        pods = [BouncingPod('a', 0.0, 1000.0, bounces), BouncingPod('b', 900.0, 0.0, bounces),
+                BouncingPod('c', 2000.0, -1000.0, bounces)]
+
+        magus.Solution().play(pods, magus.list_checkpoints)
+
+        self.assertEqual(bounces, [('a', 'b'), ('b', 'c'), ('a', 'b')])
+        self.assertEqual([pod.vx for pod in pods], [round(-1000.0 * magus.FRICTION, magus.PRECISION), 0.0,
+                                                    round(1000.0 * magus.FRICTION, magus.PRECISION)])
+
+
+if __name__ == '__main__':
+    unittest.main()
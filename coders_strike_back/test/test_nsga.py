@@ -0,0 +1,46 @@
+import unittest
+
+import numpy
+
+import csb_engine as engine
+
+
+class TestNsga(unittest.TestCase):
+
+    def setUp(self):
+        '''
+        Front 0 = (4, 1), (3, 3), (1, 4) and its duplicate
+        Front 1 = (2, 2), (1, 3)
+        Front 2 = (1, 1)
+        '''
+        self.objectives = numpy.array([[2.0, 2.0], [4.0, 1.0], [1.0, 1.0], [3.0, 3.0], [1.0, 4.0], [1.0, 3.0], [1.0, 4.0]])
+
+    def test_non_dominated_ranks(self):
+        ranks = engine.get_non_dominated_ranks(self.objectives)
+        self.assertEqual(ranks.tolist(), [1, 0, 2, 0, 0, 1, 0])
+
+    def test_non_dominated_ranks_of_random_objectives(self):
+        '''
+        No solution is dominated by a solution of the same or of a worse front
+        '''
+        objectives = numpy.random.default_rng(0).integers(0, 5, (50, 3)).astype(float)
+        ranks = engine.get_non_dominated_ranks(objectives)
+
+        for i in range(len(objectives)):
+            for j in range(len(objectives)):
+                if (objectives[i] >= objectives[j]).all() and (objectives[i] > objectives[j]).any():
+                    self.assertLess(ranks[i], ranks[j])
+
+    def test_crowding_distances(self):
+        ranks = engine.get_non_dominated_ranks(self.objectives)
+        distances = engine.get_crowding_distances(self.objectives, ranks)
+
+        # (3, 3) is between (4, 1) and (1, 4) in the two objectives of the front
+        self.assertAlmostEqual(distances[3], (4.0 - 1.0) / 3.0 + (4.0 - 1.0) / 3.0)
+        # The duplicated solutions share the distance of their point
+        self.assertEqual(distances[4], distances[6])
+        self.assertTrue(numpy.isinf(distances[[0, 1, 2, 4, 5]]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
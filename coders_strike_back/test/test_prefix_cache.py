@@ -0,0 +1,56 @@
+import gc
+import weakref
+import unittest
+
+import csb_engine as engine
+
+
+class TestPrefixCache(unittest.TestCase):
+
+    def add_prefix(self, cache, keys):
+        node = cache.get_longest_prefix(keys)
+        for key in keys[node.depth:]:
+            node = cache.add(node, key, None)
+        return node
+
+    def test_longest_prefix(self):
+        cache = engine.PrefixCache(10)
+        self.add_prefix(cache, [1, 2, 3])
+
+        node = cache.get_longest_prefix([1, 2, 4])
+        self.assertEqual(node.depth, 2)
+        self.assertEqual(node.key, 2)
+
+    def test_evict_leaves_first(self):
+        '''
+        The ancestors of the cached nodes are never evicted: every cached node stays reachable from the root
+        '''
+        cache = engine.PrefixCache(8)
+        for keys in [[0, 0, 0], [0, 1, 0], [1, 0, 0], [0, 0, 1], [2, 0, 0], [0, 0, 2], [1, 1, 1]]:
+            self.add_prefix(cache, keys)
+
+            self.assertLessEqual(len(cache.nodes), 8)
+            for node in cache.nodes:
+                self.assertTrue(node.parent is cache.root or node.parent in cache.nodes)
+                self.assertIs(node.parent.children[node.key], node)
+
+        self.assertEqual(cache.get_longest_prefix([1, 1, 1]).depth, 3)
+        self.assertEqual(cache.get_longest_prefix([0, 0, 2]).depth, 3)
+
+    def test_clear_frees_nodes(self):
+        '''
+        The nodes are freed by their reference counts when the cache is cleared, without the garbage collector
+        '''
+        cache = engine.PrefixCache(10)
+        nodes = [weakref.ref(self.add_prefix(cache, keys)) for keys in [[0, 0, 0], [0, 1, 0], [1, 0]]]
+
+        gc.disable()
+        try:
+            cache.clear()
+            self.assertEqual([node() for node in nodes], [None, None, None])
+        finally:
+            gc.enable()
+
+
+if __name__ == '__main__':
+    unittest.main()
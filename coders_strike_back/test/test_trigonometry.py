@@ -0,0 +1,45 @@
+import unittest
+
+import numpy
+
+import csb_engine as engine
+
+
+class TestTrigonometry(unittest.TestCase):
+
+    def tearDown(self):
+        engine.set_fast_trigonometry(False)
+
+    def test_error_bound(self):
+        '''
+        The error of the tables is bounded by the sine of half a step
+        '''
+        for resolution in [engine.TRIGONOMETRY_RESOLUTION, 0.1]:
+            bound = numpy.sin(resolution / 2.0 * engine.DEGREES_TO_RADIANS)
+            self.assertLessEqual(engine.get_trigonometry_error(resolution), bound * (1.0 + 1e-9))
+
+    def test_tables_built_when_switched_on(self):
+        engine.set_fast_trigonometry(True)
+        self.assertEqual(len(engine.COS_TABLE), int(round(360.0 / engine.TRIGONOMETRY_RESOLUTION)) + 1)
+
+        bound = numpy.sin(engine.TRIGONOMETRY_RESOLUTION / 2.0 * engine.DEGREES_TO_RADIANS)
+        for angle in [0.0, 45.0, 179.996, 359.999]:
+            fast_speed = self.accelerate(angle)
+            engine.set_fast_trigonometry(False)
+            speed = self.accelerate(angle)
+            engine.set_fast_trigonometry(True)
+            numpy.testing.assert_allclose(fast_speed, speed, atol=bound)
+
+    def accelerate(self, angle):
+        '''
+        Return the speed of a pod at rest accelerated by a thrust of 1 along the angle
+        '''
+        engine.initialize_race(3, [(1000, 1000), (8000, 4000), (4000, 7000)])
+        pod = engine.Pod('pod', engine.RADIUS_POD)
+        pod.angle = angle
+        pod.accelerate(1.0)
+        return pod.vx, pod.vy
+
+
+if __name__ == '__main__':
+    unittest.main()
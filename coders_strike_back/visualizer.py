@@ -3,6 +3,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from math import ceil
 
+import analytics
+
 class Data:
     def __init__(self):
         self.turn = 0
@@ -37,6 +39,20 @@ class Game:
 
             self.add_data(data)
 
+    def set_from_telemetry(self, configuration, turns):
+        self.nb_ckpt = configuration['nb_ckpt']
+        self.nb_moves = configuration['nb_moves']
+        self.nb_population = configuration['nb_population']
+        self.nb_tournament = configuration['nb_tournament']
+
+        for turn, generations in turns:
+            data = Data()
+            data.turn = turn['turn']
+            data.best_score = turn['best_score']
+            data.nb_generation = turn['nb_records'] - 1
+            data.scores = generations['best_score'].tolist()
+            self.add_data(data)
+
     def add_data(self, new_data):
         self.data.append(new_data)
 
@@ -48,6 +64,13 @@ def parse_json(path):
     game.set_from_json(parsed_json)
     return game
 
+def parse_telemetry(path):
+    configuration, turns = analytics.read_telemetry(path)
+
+    game = Game()
+    game.set_from_telemetry(configuration, turns)
+    return game
+
 def visualize(game, turn):
     data_1 = game.data[turn]
 
@@ -139,18 +162,22 @@ def visualize_convergence(game):
     plt.plot(turns, nb_generations)
     plt.show()
 
+def visualize_runs(summary):
+
+    turns = list(range(1, len(summary['improvements_by_turn']) + 1))
+
+    plt.title('Average over ' + str(int(summary['nb_runs'])) + ' runs of the improvement and the convergence at each turn')
+    plt.xlabel('Turns')
+    plt.plot(turns, summary['improvements_by_turn'], label='Improvement (%)')
+    plt.plot(turns, summary['convergence_by_turn'], label='Generation reaching the best score')
+    plt.plot(turns, summary['nb_generations_by_turn'], label='Generations')
+    plt.legend()
+    plt.show()
+
 if __name__ == '__main__':
-    game = parse_json('resources/json_coder_strike_back_2.json')
-    game2 = parse_json('resources/json_coder_strike_back_3.json')
-    game3 = parse_json('resources/json_coder_strike_back_4.json')
-    game4 = parse_json('resources/json_coder_strike_back_5.json')
-    game5 = parse_json('resources/json_coder_strike_back_6.json')
-    game6 = parse_json('resources/json_coder_strike_back_7.json')
-    game7 = parse_json('resources/json_coder_strike_back_new_selection.json')
-    game8 = parse_json('resources/json_coder_strike_back_new_selection_2.json')
-    #visualize_convergence(game)
-    #visualize_convergence(game2)
-    #visualize_convergence(game3)
-    #visualize_convergence(game4)
-    visualize_convergence(game7)
-    visualize_convergence(game8)
\ No newline at end of file
+    paths = ['resources/json_coder_strike_back_2.json', 'resources/json_coder_strike_back_3.json',
+             'resources/json_coder_strike_back_4.json', 'resources/json_coder_strike_back_5.json',
+             'resources/json_coder_strike_back_6.json', 'resources/json_coder_strike_back_7.json',
+             'resources/json_coder_strike_back_new_selection.json', 'resources/json_coder_strike_back_new_selection_2.json']
+    statistics, summary = analytics.analyze_runs(paths)
+    visualize_runs(summary)
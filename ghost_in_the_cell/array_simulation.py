@@ -0,0 +1,169 @@
+'''
+Array-backed simulation of the next turns of gold_league.py for many plans at once
+'''
+
+import numpy
+
+from gold_league import FRIEND, ENNEMY, NEUTRAL
+
+
+class ArraySimulation:
+    '''
+    Array-backed state of the game to simulate the next turns of several plans at once
+    The factories are arrays (plan, factory) and the troops are structured arrays: the troops of the game are shared by the plans,
+    the troops sent by each plan are in an array (plan, troop)
+    The movements, the production, the battles and the bombs are solved as in Game.simulate_turn with operations on whole arrays
+    The troops are never deleted, the troops that arrived have a negative eta
+    '''
+
+    TROOP_DTYPE = numpy.dtype([('owner', numpy.int64), ('number', numpy.int64), ('eta', numpy.int64),
+                               ('destination', numpy.int64), ('is_bomb', numpy.bool_)])
+    NO_BOMB = numpy.iinfo(numpy.int64).max
+
+    def __init__(self, game, nb_plans=1):
+        '''
+        Set the state of the plans to the state of the game
+        :param game: game with its routing initialized
+        :param nb_plans: number of plans simulated together
+        '''
+        self.factory_count = len(game.factories)
+        self.nb_plans = nb_plans
+        self.distances = game.routing.distances
+        self.turn = game.turn
+
+        def get_factory_array(attribute):
+            values = [getattr(factory, attribute) for factory in game.factories]
+            return numpy.tile(numpy.array(values, dtype=numpy.int64), (nb_plans, 1))
+
+        self.owner = get_factory_array('owner')
+        self.stock = get_factory_array('stock')
+        self.production = get_factory_array('production')
+        self.current_production = get_factory_array('current_production')
+        self.bomb_eta = get_factory_array('bomb_eta')
+        self.count_zero_prod = get_factory_array('count_zero_prod')
+        self.present_owner = get_factory_array('present_owner')
+        self.delta = get_factory_array('delta')
+        self.turn_change_owner = get_factory_array('turn_change_owner')
+        self.nb_friendly_troops = get_factory_array('nb_friendly_troops')
+        self.nb_ennemy_troops = get_factory_array('nb_ennemy_troops')
+
+        self.troops = numpy.array([(troop.owner, troop.number, troop.eta, troop.destination.f_id, troop.is_bomb) for troop in game.troops.values()],
+                                  dtype=ArraySimulation.TROOP_DTYPE)
+        self.plan_troops = numpy.zeros((nb_plans, 0), dtype=ArraySimulation.TROOP_DTYPE)
+
+        # Index of the first factory of each plan in the flattened arrays
+        self.factory_offsets = numpy.arange(nb_plans)[:, None] * self.factory_count
+
+    def add_moves(self, origins, destinations, numbers, is_bomb=False):
+        '''
+        Send troops from the factories of each plan (a number of 0 sends nothing)
+        :param origins: ids of the owned factories sending the troops (plan, order)
+        :param destinations: ids of the destination factories (plan, order)
+        :param numbers: numbers of cyborgs sent (plan, order)
+        :param is_bomb: the orders send bombs
+        '''
+        origins = numpy.asarray(origins)
+        destinations = numpy.asarray(destinations)
+        numbers = numpy.asarray(numbers)
+        plans = numpy.broadcast_to(numpy.arange(self.nb_plans)[:, None], origins.shape)
+
+        troops = numpy.zeros(origins.shape, dtype=ArraySimulation.TROOP_DTYPE)
+        troops['owner'] = self.owner[plans, origins]
+        troops['number'] = numbers
+        troops['eta'] = numpy.where((numbers > 0) | is_bomb, self.distances[origins, destinations], -1)
+        troops['destination'] = destinations
+        troops['is_bomb'] = is_bomb
+
+        numpy.subtract.at(self.stock, (plans, origins), numbers)
+        self.plan_troops = numpy.concatenate((self.plan_troops, troops), axis=1)
+
+    def add_increases(self, increases):
+        '''
+        Increase the production of the factories (plan, factory) where increases is True for 10 cyborgs
+        '''
+        self.stock -= numpy.where(increases, 10, 0)
+        self.production += increases
+        self.current_production = numpy.where(increases & (self.count_zero_prod <= 0), self.production, self.current_production)
+
+    def get_arrivals(self, troops, indexes, size):
+        '''
+        Return the cyborgs of each owner arriving this turn and the eta of the closest bomb by factory
+        :param troops: troops as a flat structured array
+        :param indexes: index of the destination factory of each troop in the result
+        :param size: size of the result
+        :return: friend cyborgs, ennemy cyborgs, eta of the closest bomb (NO_BOMB without bomb)
+        '''
+        numbers = numpy.where(troops['eta'] == 0, troops['number'], 0)
+        friends = numpy.bincount(indexes, numbers * (troops['owner'] == FRIEND), size)
+        ennemies = numpy.bincount(indexes, numbers * (troops['owner'] == ENNEMY), size)
+
+        bomb_etas = numpy.full(size, ArraySimulation.NO_BOMB)
+        is_bomb = troops['is_bomb'] & (troops['eta'] >= 0)
+        numpy.minimum.at(bomb_etas, indexes[is_bomb], troops['eta'][is_bomb])
+
+        return friends, ennemies, bomb_etas
+
+    def simulate_turn(self):
+        '''
+        Simulate one full turn for all the factories of all the plans (see Game.simulate_turn)
+        '''
+        shape = self.owner.shape
+
+        # 1) Move existing troops and bombs
+        self.troops['eta'] -= 1
+        self.plan_troops['eta'] -= 1
+
+        friends, ennemies, bomb_etas = self.get_arrivals(self.troops, self.troops['destination'], self.factory_count)
+        plan_troops = self.plan_troops.ravel()
+        plan_indexes = (self.factory_offsets + self.plan_troops['destination']).ravel()
+        plan_friends, plan_ennemies, plan_bomb_etas = self.get_arrivals(plan_troops, plan_indexes, self.owner.size)
+
+        friends = (friends + plan_friends.reshape(shape)).astype(numpy.int64)
+        ennemies = (ennemies + plan_ennemies.reshape(shape)).astype(numpy.int64)
+        bomb_etas = numpy.minimum(bomb_etas, plan_bomb_etas.reshape(shape))
+
+        is_ennemy_factory = self.owner == ENNEMY
+        nb_friendly_troops = self.nb_friendly_troops = numpy.where(is_ennemy_factory, ennemies, friends)
+        nb_ennemy_troops = self.nb_ennemy_troops = numpy.where(is_ennemy_factory, friends, ennemies)
+
+        # A factory already expecting its bomb at this eta or before does not count it anymore (Factory.update_troops_after_moves)
+        is_new_bomb = (bomb_etas != ArraySimulation.NO_BOMB) & ((self.bomb_eta == -1) | (bomb_etas < self.bomb_eta))
+        self.bomb_eta = numpy.where(is_new_bomb, bomb_etas, -1)
+
+        # 3) Produce new cyborgs in all factories
+        self.stock += numpy.where(self.owner != NEUTRAL, self.current_production, 0)
+
+        # 4) Solve battles
+        previous_owner = self.owner
+        new_stock = numpy.where(previous_owner != NEUTRAL, self.stock + nb_friendly_troops - nb_ennemy_troops,
+                                self.stock - numpy.abs(nb_friendly_troops - nb_ennemy_troops))
+
+        neutral_winner = numpy.where(nb_friendly_troops > nb_ennemy_troops, FRIEND, ENNEMY)
+        self.owner = numpy.where(new_stock < 0, numpy.where(previous_owner == NEUTRAL, neutral_winner, -previous_owner), previous_owner)
+        self.stock = numpy.abs(new_stock)
+
+        is_owned = self.owner != NEUTRAL
+        is_defended = is_owned & ((self.owner == self.present_owner) | (previous_owner == self.present_owner))
+        is_retaken = is_owned & ~is_defended & (self.present_owner != NEUTRAL) & (self.owner == previous_owner)
+        forces = nb_friendly_troops + self.current_production
+        self.delta += numpy.where(is_defended, numpy.maximum(nb_ennemy_troops - forces, 0), 0)
+        self.delta += numpy.where(is_retaken, numpy.maximum(forces - nb_ennemy_troops, 0), 0)
+
+        # 5) Make the bombs explode
+        is_exploded = self.bomb_eta == 0
+        self.count_zero_prod = numpy.where(is_exploded, 5, self.count_zero_prod)
+        bombed_stock = numpy.where(self.stock >= 20, numpy.rint(self.stock / 2).astype(numpy.int64), numpy.maximum(self.stock - 10, 0))
+        self.stock = numpy.where(is_exploded, bombed_stock, self.stock)
+
+        self.current_production = numpy.where(self.count_zero_prod > 0, 0, self.production)
+        self.count_zero_prod = numpy.where(self.count_zero_prod >= 0, self.count_zero_prod - 1, self.count_zero_prod)
+
+        self.turn_change_owner = numpy.where(self.owner != previous_owner, self.turn, self.turn_change_owner)
+        self.turn += 1
+
+    def simulate(self, nb_turns):
+        '''
+        Simulate the next nb_turns turns of all the plans
+        '''
+        for i in range(nb_turns):
+            self.simulate_turn()
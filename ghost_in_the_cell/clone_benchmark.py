@@ -0,0 +1,79 @@
+'''
+Cost of Game.clone of gold_league.py as a function of the number of troops in flight
+
+The games are generated: the factories are all linked, and the troops are spread at random on the links.
+The clone is timed alone and followed by the simulation of NB_SIMU_TURN turns.
+
+Usage: python clone_benchmark.py [--factories 15] [--troops 0 50 100 200 400 800] [--repeat 200]
+'''
+
+import sys
+import random
+import timeit
+import argparse
+
+from gold_league import Game, Troop, FRIEND, ENNEMY, NEUTRAL, NB_SIMU_TURN
+
+
+def build_game(nb_factories, nb_troops, seed=0):
+    '''
+    Return a game with all the factories linked and nb_troops troops on the links
+    '''
+    rnd = random.Random(seed)
+
+    game = Game()
+    game.initialize_game(nb_factories, nb_factories * (nb_factories - 1) // 2)
+    game.create_factories()
+    for i in range(nb_factories):
+        for j in range(i + 1, nb_factories):
+            game.add_link(i, j, rnd.randint(1, 20))
+    game.initialize_factories()
+    game.initialize_routing()
+
+    for factory in game.factories:
+        factory.set_owner(rnd.choice([FRIEND, ENNEMY, NEUTRAL]))
+        factory.stock = rnd.randint(0, 50)
+        factory.set_production(rnd.randint(0, 3), 0)
+    game.factories[0].set_owner(FRIEND)
+    game.factories[1].set_owner(ENNEMY)
+    game.original_owned = game.factories[0]
+    game.original_ennemy = game.factories[1]
+    game.factories_owned = [factory for factory in game.factories if factory.owner == FRIEND]
+    game.factories_ennemy = [factory for factory in game.factories if factory.owner == ENNEMY]
+
+    for t_id in range(nb_troops):
+        origin, destination = rnd.sample(game.factories, 2)
+        link = origin.links[destination.f_id]
+        troop = Troop(t_id, rnd.randint(1, 10), rnd.randint(1, link.distance), rnd.choice([FRIEND, ENNEMY]), False, link,
+                      origin, destination)
+        origin.sent_troops(destination.f_id, troop)
+        game.add_troop(troop)
+
+    return game
+
+
+def time_function(function, repeat):
+    '''
+    Return the best time of the function in microseconds
+    '''
+    return min(timeit.repeat(function, number=1, repeat=repeat)) * 1e6
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cost of Game.clone against the number of troops')
+    parser.add_argument('--factories', type=int, default=15, help='number of factories')
+    parser.add_argument('--troops', type=int, nargs='+', default=[0, 50, 100, 200, 400, 800], help='numbers of troops in flight')
+    parser.add_argument('--repeat', type=int, default=200, help='number of measures (the best one is kept)')
+    args = parser.parse_args()
+
+    print('%8s %12s %20s' % ('troops', 'clone us', 'clone + simu us'), file=sys.stderr)
+    for nb_troops in args.troops:
+        game = build_game(args.factories, nb_troops)
+
+        def simulate():
+            simu = game.clone()
+            for i in range(NB_SIMU_TURN):
+                simu.simulate_turn()
+
+        times = [time_function(game.clone, args.repeat), time_function(simulate, max(args.repeat // 10, 1))]
+        print('%8d %12.1f %20.1f' % tuple([nb_troops] + times), file=sys.stderr)
@@ -1,10 +1,12 @@
 import sys
 import math
 import time
-from operator import attrgetter
 from operator import itemgetter
+from itertools import islice
 from collections import OrderedDict
 
+import numpy
+
 FRIEND = 1
 PLAYER = 1
 ENNEMY = -1
@@ -25,29 +27,73 @@ MODE_CONQUERING = 1
 MODE_AGRESSIVE = 2
 
 class Input:
-    def __init__(self, entity_type, entity_id, arg1, arg2, arg3, arg4, arg5):
-        self.entity_type = entity_type
-        self.entity_id = entity_id
-        self.arg1 = arg1
-        self.arg2 = arg2
-        self.arg3 = arg3
-        self.arg4 = arg4
-        self.arg5 = arg5
-    
+    '''
+    Entities of a turn read at once from the standard input and split by columns
+    '''
+
+    # The entities are processed by type, the bombs after the factories
+    ENTITY_TYPES = ['TROOP', 'FACTORY', 'BOMB']
+
+    def __init__(self, entity_count, stream=sys.stdin):
+        words = ''.join(islice(stream, entity_count)).split()
+        self.entity_ids = [int(word) for word in words[0::7]]
+        self.entity_types = words[1::7]
+        self.args = [[int(word) for word in words[i::7]] for i in range(2, 7)]
+
+    def process(self, game):
+        '''
+        Give the entities to the game by type (see ENTITY_TYPES), in the order of the input for a type
+        '''
+        indexes = {entity_type: [] for entity_type in Input.ENTITY_TYPES}
+        for i, entity_type in enumerate(self.entity_types):
+            indexes[entity_type].append(i)
+
+        arg_1, arg_2, arg_3, arg_4, arg_5 = self.args
+        for entity_type in Input.ENTITY_TYPES:
+            for i in indexes[entity_type]:
+                game.process_input(self.entity_ids[i], entity_type, arg_1[i], arg_2[i], arg_3[i], arg_4[i], arg_5[i])
+
+
 class Troop:
     def __init__(self, t_id, number, eta, owner, is_bomb, link, sender, destination):
         self.t_id = t_id
         self.number = number
-        self.eta = eta
         self.owner = owner
         self.is_bomb = is_bomb
         self.link = link
         self.origin = sender
         self.destination = destination
 
-    def clone(self, clone_factories):
-        return Troop(self.t_id, self.number, self.eta, self.owner, self.is_bomb, self.link,
-                     clone_factories[self.origin.f_id], clone_factories[self.destination.f_id])
+        # The eta is given by the turn of the arrivals of the destination
+        self.arrival_turn = destination.arrivals.turn + eta
+        self.is_registered = False  # the troop is in the arrivals of the destination
+
+    @property
+    def eta(self):
+        return self.arrival_turn - self.destination.arrivals.turn
+
+    @eta.setter
+    def eta(self, eta):
+        arrivals = self.destination.arrivals
+        is_registered = self.is_registered
+        if is_registered:
+            arrivals.remove(self)
+
+        self.arrival_turn = arrivals.turn + eta
+
+        if is_registered:
+            arrivals.add(self)
+
+    def clone(self, clone_link):
+        '''
+        Return a copy of the troop on the clone of its link (the factories are the ones at the ends of the clone)
+        The arrivals of the clone of the destination are copied with the factory
+        '''
+        clone = Troop(self.t_id, self.number, 0, self.owner, self.is_bomb, clone_link,
+                      clone_link.destination[self.destination.f_id], clone_link.destination[self.origin.f_id])
+        clone.arrival_turn = self.arrival_turn
+        clone.is_registered = self.is_registered
+        return clone
 
 
 class Order:
@@ -83,7 +129,7 @@ class Order:
         return msg
 
     def clone(self, clone_sender, clone_destination):
-        return Order(self.action, self.number, clone_sender, clone_destination)
+        return Order(self.action, clone_sender, clone_destination, self.number)
 
 
 class Link:
@@ -102,109 +148,158 @@ class Link:
         self.destination[fact_2.f_id] = fact_1
 
     def clone(self, clone_factories, clone_troops):
-        factories_id = list(self.destination.keys())
-        clone_fact1 = clone_factories[factories_id[0]]
-        clone_fact2 = clone_factories[factories_id[1]]
-        clone = Link(self.l_id, clone_fact1, clone_fact2, self.distance)
-
-        for troop in self.troops[clone_fact1.f_id]:
-            clone_troop = [clone_troop for clone_troop in clone_troops if clone_troop.t_id == troop.t_id][0]
-            clone.troops[clone_fact1.f_id].append(clone_troop)
+        '''
+        Return a copy of the link between the clones of its factories
+        :param clone_factories: clones of the factories by id
+        :param clone_troops: map id => clone of the troops, completed with the troops of the link
+        '''
+        f_id_1, f_id_2 = self.destination.keys()
+        clone = Link(self.l_id, clone_factories[f_id_1], clone_factories[f_id_2], self.distance)
 
-        for troop in self.troops[clone_fact2.f_id]:
-            clone_troop = [clone_troop for clone_troop in clone_troops if clone_troop.t_id == troop.t_id][0]
-            clone.troops[clone_fact2.f_id].append(clone_troop)
+        for f_id, troops in self.troops.items():
+            for troop in troops:
+                clone_troop = troop.clone(clone)
+                clone.troops[f_id].append(clone_troop)
+                clone_troops[troop.t_id] = clone_troop
 
         return clone
 
-    def get_friendly_troops_for_battle(self, factory):
+    def add_troops(self, origin, destination, number, is_bomb, game):
         '''
-        Return the number of friendly troops for the factory ready to engage in a battle
-        friendly troop = troops with the same owner as the factory
-        except for neutral factory, friendly troops are the troop of the player
-        :param factory: factory considered
-        :return: number of troops
+        Create and add new troops on the link
+        :param origin: factory creating the troops
+        :param destination: factory destination of the troops
+        :param number: number of the troops
+        :param is_bomb: the troop is a bomb
         '''
 
-        if factory.owner != NEUTRAL:
-            match_troops = [troop for troop in self.troops[factory.f_id] if
-                            troop.eta == 0 and troop.owner == factory.owner]
-        else:
-            match_troops = [troop for troop in self.troops[factory.f_id] if troop.eta == 0 and troop.owner == FRIEND]
+        troop = Troop(game.next_id_troop(), number, self.distance, origin.owner, is_bomb, self, origin, destination)
+        self.troops[destination.f_id].append(troop)
+        destination.arrivals.add(troop)
+        game.add_troop(troop)
 
-        if len(match_troops) == 0:
-            return 0
-        else:
-            return sum(troop.number for troop in match_troops)
 
-    def get_ennemy_troops_for_battle(self, factory):
-        '''
-        Return the number of ennemy troops for the factory ready to engage in a battle
-        Ennemy troop = troops with a different owner of the factory
-        Except for neutral factory, ennemy troops are the troop of the "ennemy"
-        :param factory: factory considered
-        :return: number of troops
-        '''
+class Routing:
+    '''
+    Fastest routes between all the factories, computed once at the beginning of the game (Floyd-Warshall)
+    A troop relayed by a factory arrives on it and leaves it on the next turn: each relay costs one turn
+    '''
 
-        if factory.owner != 0:
-            match_troops = [troop for troop in self.troops[factory.f_id] if
-                            troop.eta == 0 and troop.owner != factory.owner]
-        else:
-            match_troops = [troop for troop in self.troops[factory.f_id] if troop.eta == 0 and troop.owner == ENNEMY]
+    def __init__(self, factory_count, links):
+        ids = numpy.arange(factory_count)
 
-        if len(match_troops) == 0:
-            return 0
-        else:
-            return sum(troop.number for troop in match_troops)
+        # Cost of a link = distance + 1 turn to leave the factory at the end of the link (no link: longer than any route)
+        distances = numpy.full((factory_count, factory_count), 21 * factory_count, dtype=numpy.int64)
+        for link in links:
+            f_id_1, f_id_2 = link.destination.keys()
+            distances[f_id_1, f_id_2] = link.distance
+            distances[f_id_2, f_id_1] = link.distance
+        distances[ids, ids] = 0
 
-    def get_bomb_eta(self, factory):
-        '''
-        Return the bomb eta for the factory if a bomb is placed on the link
-        :param factory: factory considered
-        :return: eta of the closest bomb or -1
-        '''
+        link_costs = distances + 1
+        costs = link_costs.copy()
+        costs[ids, ids] = 0
+        for k in range(factory_count):
+            numpy.minimum(costs, costs[:, k, None] + costs[None, k, :], out=costs)
 
-        match_troops = [troop for troop in self.troops[factory.f_id] if troop.is_bomb]
+        # Next hop = the closest first factory among the fastest routes (a relay is preferred to the direct link at equal time)
+        link_costs[ids, ids] = 21 * factory_count
+        route_costs = link_costs[:, :, None] + costs[None, :, :]  # origin, first factory, destination
+        first_distances = numpy.where(route_costs == costs[:, None, :], distances[:, :, None], 21 * factory_count)
+        next_hops = first_distances.argmin(axis=1)
+        next_hops[ids, ids] = ids
 
-        if len(match_troops) > 0:
-            match_troops.sort(key=attrgetter('eta'))
-            return match_troops[0].eta
-        else:
-            return -1
+        hops = numpy.zeros((factory_count, factory_count), dtype=numpy.int64)
+        for i in range(factory_count):
+            hops = numpy.where(next_hops == ids[None, :], 1, hops[next_hops, ids[None, :]] + 1)
+            hops[ids, ids] = 0
+
+        times = costs - 1
+        times[ids, ids] = 0
 
-    def move_troops(self):
+        self.distances = distances  # distances of the links as an array for array_simulation.py
+
+        # Lists for the lookups of the turns
+        self.times = times.tolist()  # turns for a troop to reach the destination with the relays
+        self.next_hops = next_hops.tolist()  # first factory of the fastest route
+        self.hops = hops.tolist()  # number of links of the fastest route
+
+
+class Arrivals:
+    '''
+    Timeline of the troops going to a factory: cyborgs of each owner by turn of arrival in a ring buffer
+    Going to the next turn clears the turn that ended instead of decreasing the eta of every troop
+    '''
+
+    SIZE = 32  # turns, longer than any eta
+
+    def __init__(self):
+        self.turn = 0
+        self.cyborgs = {FRIEND: [0] * Arrivals.SIZE, ENNEMY: [0] * Arrivals.SIZE}
+        self.totals = {FRIEND: 0, ENNEMY: 0}  # cyborgs in the timeline by owner
+        self.bomb_turns = {}  # turns of arrival of the bombs by origin (one list by link)
+
+    def clone(self):
+        clone = Arrivals()
+        clone.turn = self.turn
+        clone.cyborgs = {owner: list(cyborgs) for owner, cyborgs in self.cyborgs.items()}
+        clone.totals = dict(self.totals)
+        clone.bomb_turns = {f_id: list(turns) for f_id, turns in self.bomb_turns.items()}
+        return clone
+
+    def is_in_timeline(self, troop):
+        return 0 <= troop.arrival_turn - self.turn < Arrivals.SIZE
+
+    def add(self, troop):
         '''
-        Move all the troops along the link (reduce ETA of 1)
-        Troops with an ETA of 0 are deleted
-        return list of deleted troops
+        Add a troop going to the factory (the troops already arrived are not in the timeline)
         '''
+        troop.is_registered = True
+        if self.is_in_timeline(troop):
+            self.cyborgs[troop.owner][troop.arrival_turn % Arrivals.SIZE] += troop.number
+            self.totals[troop.owner] += troop.number
+        if troop.is_bomb:  # ennemy bombs of the live game keep counting after their estimated arrival
+            self.bomb_turns.setdefault(troop.origin.f_id, []).append(troop.arrival_turn)
 
-        deleted_troops = []
-        for factory_troops in self.troops.values():
-            i = 0
-            while i < len(factory_troops):
-                if factory_troops[i].eta > 0:
-                    factory_troops[i].eta -= 1
+    def remove(self, troop):
+        troop.is_registered = False
+        if self.is_in_timeline(troop):
+            self.cyborgs[troop.owner][troop.arrival_turn % Arrivals.SIZE] -= troop.number
+            self.totals[troop.owner] -= troop.number
+        if troop.is_bomb:
+            self.bomb_turns[troop.origin.f_id].remove(troop.arrival_turn)
 
-                    i += 1
-                else:
-                    deleted_troops.append(factory_troops[i])
-                    del factory_troops[i]
+    def next_turn(self):
+        '''
+        Move to the next turn: the troops arrived during the turn leave the timeline
+        '''
+        index = self.turn % Arrivals.SIZE
+        for owner, cyborgs in self.cyborgs.items():
+            self.totals[owner] -= cyborgs[index]
+            cyborgs[index] = 0
 
-        return deleted_troops
+        self.turn += 1
+        for turns in self.bomb_turns.values():
+            turns[:] = [turn for turn in turns if turn >= self.turn]
 
-    def add_troops(self, origin, destination, number, is_bomb, game):
+    def get_cyborgs(self, owner):
         '''
-        Create and add new troops on the link
-        :param origin: factory creating the troops
-        :param destination: factory destination of the troops
-        :param number: number of the troops
-        :param is_bomb: the troop is a bomb
+        Return the number of cyborgs of the owner arriving this turn
         '''
+        return self.cyborgs[owner][self.turn % Arrivals.SIZE]
 
-        troop = Troop(game.next_id_troop(), number, self.distance, origin.owner, is_bomb, self, origin, destination)
-        self.troops[destination.f_id].append(troop)
-        game.troops.append(troop)
+    def get_bomb_eta(self):
+        '''
+        Return the eta of the closest bomb or -1
+        The closest bomb of each link is considered, a link with a bomb at eta -1 has no bomb
+        '''
+        bomb_eta = -1
+        for turns in self.bomb_turns.values():
+            if turns:
+                link_bomb_eta = min(turns) - self.turn
+                if link_bomb_eta != -1:
+                    bomb_eta = link_bomb_eta if bomb_eta == -1 else min(bomb_eta, link_bomb_eta)
+        return bomb_eta
 
 
 class Factory:
@@ -214,6 +309,7 @@ class Factory:
         self.production = 0
         self.current_production = 0
         self.links = {}
+        self.arrivals = Arrivals()
         self.owner = 0
         self.is_central = False
         
@@ -297,6 +393,7 @@ class Factory:
         clone.sendable_troops = self.sendable_troops
 
         clone.bomb_eta = self.bomb_eta
+        clone.arrivals = self.arrivals.clone()
 
         clone.count_zero_prod = self.count_zero_prod
         clone.count_next_increase = self.count_next_increase
@@ -313,13 +410,10 @@ class Factory:
         clone_factory = clone_factories[self.f_id]
 
         for key, link in self.links.items():
-            clone_link = [clone_link for clone_link in clone_links if clone_link.l_id == link.l_id][0]
-            clone_factory.links[key] = clone_link
+            clone_factory.links[key] = clone_links[link.l_id]
 
         for order in self.orders:
-            clone_destination = [clone_factory for clone_factory in clone_factories if clone_factory.f_id == self.f_id][
-                0]
-            clone_factory.orders.append(order.clone(clone_factory, clone_destination))
+            clone_factory.orders.append(order.clone(clone_factory, clone_factories[order.destination.f_id]))
 
     def set_owner(self, owner):
         self.owner = owner
@@ -389,6 +483,7 @@ class Factory:
         :param new_troop: troop sent
         '''
         self.links[destination_id].troops[destination_id].append(new_troop)
+        new_troop.destination.arrivals.add(new_troop)
 
     def set_bomb_eta(self, eta):
         '''
@@ -692,7 +787,7 @@ class Factory:
                 ##XF fact_destination.need_turn = max(fact_destination.need_turn, 0)
                 self.sendable_troops -= send_troops
                                                                                                                                     
-                destination = self_factory.get_intermediate(link, fact_destination) 
+                destination = self_factory.get_intermediate(fact_destination, simu.routing)
                 
                 if destination.f_id != fact_destination.f_id:
                     #if destination.need_turn == 0 and destination.owner == NEUTRAL:
@@ -766,26 +861,11 @@ class Factory:
         if len(self.orders) == 0:
             self.orders.append(Order(Order.WAIT, self, self, 0))
 
-    def get_intermediate(self, link, target):
+    def get_intermediate(self, target, routing):
         '''
-        Return the closest intermediate from the factory to reach the target
+        Return the first factory of the fastest route from the factory to reach the target (the target without relay)
         '''
-        
-        intermediate = target
-        
-        for key, link_int in self.links.items():
-            candidate = link_int.destination[self.f_id]
-
-            if candidate.f_id != target.f_id \
-            and (candidate.owner == FRIEND or candidate.owner == NEUTRAL or candidate.owner == ENNEMY) \
-            and (candidate.links[target.f_id].distance + candidate.links[self.f_id].distance + 1)  <= link.distance:                                
-                if candidate.links[self.f_id].distance < intermediate.links[self.f_id].distance:
-                    if intermediate.f_id == target.f_id:
-                        intermediate = candidate
-                    elif (candidate.links[target.f_id].distance + candidate.links[self.f_id].distance) <= (intermediate.links[target.f_id].distance + intermediate.links[self.f_id].distance):
-                        intermediate = candidate
-        
-        return intermediate
+        return self.links[routing.next_hops[self.f_id][target.f_id]].destination[self.f_id]
 
     def define_conquest_priorities(self, simu):
         '''
@@ -953,21 +1033,21 @@ class Factory:
         update the number of friendly/ennemy troops engaged in battle at the factory
         '''
 
-        self.nb_friendly_troops = 0
-        self.nb_ennemy_troops = 0
-        bomb_eta = self.bomb_eta
-
-        for link in self.links.values():
-            self.nb_friendly_troops += link.get_friendly_troops_for_battle(self)
-            self.nb_ennemy_troops += link.get_ennemy_troops_for_battle(self)
-
-            new_bomb_eta = link.get_bomb_eta(self)
-            if new_bomb_eta != -1:
+        # Friendly troops have the owner of the factory, the troops of the player for a neutral factory
+        if self.owner == ENNEMY:
+            self.nb_friendly_troops = self.arrivals.get_cyborgs(ENNEMY)
+            self.nb_ennemy_troops = self.arrivals.get_cyborgs(FRIEND)
+        else:
+            self.nb_friendly_troops = self.arrivals.get_cyborgs(FRIEND)
+            self.nb_ennemy_troops = self.arrivals.get_cyborgs(ENNEMY)
 
-                if bomb_eta == -1:
-                    bomb_eta = new_bomb_eta
-                else:
-                    bomb_eta = min(new_bomb_eta, bomb_eta)
+        bomb_eta = self.bomb_eta
+        new_bomb_eta = self.arrivals.get_bomb_eta()
+        if new_bomb_eta != -1:
+            if bomb_eta == -1:
+                bomb_eta = new_bomb_eta
+            else:
+                bomb_eta = min(new_bomb_eta, bomb_eta)
 
         if bomb_eta != -1:
             if self.bomb_eta == -1:
@@ -1016,10 +1096,12 @@ class Game:
         self.original_ennemy= None
 
         self.links = []
+        self.routing = None
 
-        self.troops = []
+        self.troops = {}  # troops by id
         self.troops_owned = []
         self.troops_ennemy = []
+        self.next_troop_id = 0  # greater than the id of any troop seen
 
         self.available_bomb = 2
         self.ennemy_available_bomb = 2
@@ -1053,7 +1135,7 @@ class Game:
             self.factories.append(Factory(i))
 
     def add_link(self, factory_1, factory_2, distance):
-        link = Link(i, self.factories[factory_1], self.factories[factory_2], distance)
+        link = Link(len(self.links), self.factories[factory_1], self.factories[factory_2], distance)
         self.factories[factory_1].links[factory_2] = link
         self.factories[factory_2].links[factory_1] = link
         self.links.append(link)
@@ -1073,7 +1155,7 @@ class Game:
 
         # put all the ETA (except bomb to player) at 0 at the beginning of the turn
         # all troops with eta 0 at the end of initialization have to be deleted (including bomb to player)
-        for troop in self.troops:
+        for troop in self.troops.values():
             if not (troop.owner == ENNEMY and troop.is_bomb) or (troop.is_bomb and troop.eta == 1):
                 troop.eta = 0
 
@@ -1102,6 +1184,12 @@ class Game:
         for factory in self.factories:
             factory.set_distances()
 
+    def initialize_routing(self):
+        '''
+        Compute the fastest routes between the factories (the links do not change during the game)
+        '''
+        self.routing = Routing(self.factory_count, self.links)
+
     def process_input(self, entity_id, entity_type, arg_1, arg_2, arg_3, arg_4, arg_5):
         '''
         Manage the input from the game engine
@@ -1124,13 +1212,13 @@ class Game:
             factory_origin = self.factories[arg_2]
             factory_destination = self.factories[arg_3]
 
-            match_troop = [troop for troop in self.troops if troop.t_id == entity_id]
-            if len(match_troop) == 0:
+            troop = self.troops.get(entity_id)
+            if troop is None:
 
                 new_troop = Troop(entity_id, arg_4, arg_5, arg_1, False, factory_origin.links[arg_3], factory_origin,
                                   factory_destination)
 
-                self.troops.append(new_troop)
+                self.add_troop(new_troop)
                 factory_origin.sent_troops(arg_3, new_troop)
 
                 if arg_1 == -1:
@@ -1138,14 +1226,14 @@ class Game:
                 else:  # same for player and neutral structure
                     self.troops_owned.append(new_troop)
             else:
-                match_troop[0].eta = arg_5
+                troop.eta = arg_5
 
         elif entity_type == 'BOMB':
 
             factory_origin = self.factories[arg_2]
-            match_troop = [troop for troop in self.troops if troop.t_id == entity_id]
+            troop = self.troops.get(entity_id)
 
-            if len(match_troop) == 0:
+            if troop is None:
                 if arg_1 == ENNEMY:
                     
                     temp_simu = self.clone()                    
@@ -1169,7 +1257,7 @@ class Game:
 
                 new_troop = Troop(entity_id, 0, bomb_eta, arg_1, True, link, factory_origin, factory_destination)
 
-                self.troops.append(new_troop)
+                self.add_troop(new_troop)
                 factory_destination.set_bomb_eta(bomb_eta)
                 factory_origin.sent_troops(factory_destination.f_id, new_troop)
 
@@ -1182,9 +1270,9 @@ class Game:
                     self.troops_owned.append(new_troop)
             else:
                 if arg_1 == ENNEMY:
-                    match_troop[0].eta -= 1
+                    troop.eta -= 1
                 else:
-                    match_troop[0].eta = arg_4
+                    troop.eta = arg_4
 
     def estimate_target(self, origin, game):
         '''
@@ -1307,13 +1395,10 @@ class Game:
         6) Check end conditions
         '''
 
-        # 1) Move existing troops and bombs
-        deleted_troops = []
-        for link in self.links:
-            deleted_troops.extend(link.move_troops())
-
-        for troop in deleted_troops:
-            self.troops.remove(troop)
+        # 1) Move existing troops and bombs: the troops arrived on the previous turn leave the arrivals
+        # (the troop lists of the simulated game are not updated)
+        for factory in self.factories:
+            factory.arrivals.next_turn()
 
         # 2) Execute user orders
         # 3) Produce new cyborgs in all factories
@@ -1358,12 +1443,13 @@ class Game:
                 nb_deleted_troops += len(troops_eta_0)
                 for i in range(len(troops_eta_0)):
                     factory_troops.remove(troops_eta_0[i])
+                    troops_eta_0[i].destination.arrivals.remove(troops_eta_0[i])
 
         # Delete from troops old troops with eta == 0 (no more updated by inputs)
-        troops_eta_0 = [troop for troop in self.troops if troop.eta == 0]
+        troops_eta_0 = [troop for troop in self.troops.values() if troop.eta == 0]
         nb_deleted_troops += len(troops_eta_0)
         for i in range(len(troops_eta_0)):
-            self.troops.remove(troops_eta_0[i])
+            del self.troops[troops_eta_0[i].t_id]
             
         if self.turn == 1:
             friend = self.factories_owned[0]
@@ -1408,7 +1494,7 @@ class Game:
             
         for factory in self.factories_owned:
             factory.compute_danger_index(simulated_game)
-            factory.define_conquest_priorities(simu)
+            factory.define_conquest_priorities(simulated_game)
             factory.emit_orders(simulated_game)
         
         for factory in self.factories_owned:    
@@ -1431,11 +1517,20 @@ class Game:
         print(self.send_orders_to_engine(simulated_game))
         self.turn += 1
 
+    def add_troop(self, troop):
+        '''
+        Register the troop by its id
+        '''
+        self.troops[troop.t_id] = troop
+        self.next_troop_id = max(self.next_troop_id, troop.t_id + 1)
+
     def next_id_troop(self):
-        if len(self.troops) == 0:
-            return 0
-        else:
-            return max(troop.t_id for troop in self.troops) + 1
+        '''
+        Return a new troop id (the ids are never reused)
+        '''
+        t_id = self.next_troop_id
+        self.next_troop_id += 1
+        return t_id
 
     def set_game_mode(self):
         '''
@@ -1458,11 +1553,9 @@ class Game:
         stock_ennemy = sum(factory.stock for factory in self.factories_ennemy)
         stock_friend = sum(factory.stock for factory in self.factories_owned)
         
-        friend_cyborgs = [troop for troop in self.troops if troop.owner == FRIEND and not troop.is_bomb]
-        ennemy_cyborgs = [troop for troop in self.troops if troop.owner == ENNEMY and not troop.is_bomb]
-        
-        self.nb_friend_troops = sum(cyborg.number for cyborg in friend_cyborgs)
-        self.nb_ennemy_troops = sum(cyborg.number for cyborg in ennemy_cyborgs)
+        # Cyborgs still moving (the bombs have no cyborg)
+        self.nb_friend_troops = sum(factory.arrivals.totals[FRIEND] for factory in self.factories)
+        self.nb_ennemy_troops = sum(factory.arrivals.totals[ENNEMY] for factory in self.factories)
         
         neutral_factories = [factory for factory in self.factories if factory.owner == NEUTRAL]
         neutral_factories_0 = [factory for factory in self.factories if factory.owner == NEUTRAL and factory.production == 0]
@@ -1498,9 +1591,13 @@ class Game:
             self.conquest_priorities = [12, 11, 10, 7, 8, 9, 5, 6, 13]
 
     def clone(self):
+        '''
+        Return a copy of the game to simulate the next turns
+        The factories, links and troops are cloned in one pass each, the clones being found by id
+        '''
         clone = Game()
 
-        for factory in game.factories:
+        for factory in self.factories:
             clone_factory = factory.clone_basic_attributes()
             clone.factories.append(clone_factory)
 
@@ -1509,26 +1606,29 @@ class Game:
             elif clone_factory.owner == ENNEMY:
                 clone.factories_ennemy.append(clone_factory)        
 
-            is_central = [factory for factory in self.central_factories if factory.f_id == clone_factory.f_id]
-            if len(is_central) > 0:
+            if clone_factory.is_central:
                 clone.central_factories.append(clone_factory)
-                
-        clone.original_owned = clone.factories[self.original_owned.f_id]
-        clone.original_ennemy = clone.factories[self.original_ennemy.f_id]
 
-        for troop in game.troops:
-            clone_troop = troop.clone(clone.factories)
+        if self.original_owned is not None:
+            clone.original_owned = clone.factories[self.original_owned.f_id]
+            clone.original_ennemy = clone.factories[self.original_ennemy.f_id]
+
+        clone_troops = {}
+        for link in self.links:
+            clone.links.append(link.clone(clone.factories, clone_troops))
 
-            clone.troops.append(clone_troop)
+        clone.routing = self.routing
+
+        clone.next_troop_id = self.next_troop_id
+        for t_id in self.troops:
+            clone_troop = clone_troops[t_id]
+
+            clone.troops[t_id] = clone_troop
             if clone_troop.owner == FRIEND:
                 clone.troops_owned.append(clone_troop)
             elif clone_troop.owner == ENNEMY:
                 clone.troops_ennemy.append(clone_troop)
 
-        for link in game.links:
-            clone_link = link.clone(clone.factories, clone.troops)
-            clone.links.append(clone_link)
-
         for factory in self.factories:
             factory.set_clone_dependent_attributes(clone.factories, clone.links)
         
@@ -1550,55 +1650,44 @@ class Game:
         return clone
 
 
-factory_count = int(input())  # the number of factories
-link_count = int(input())  # the number of links between factories
+if __name__ == '__main__':
+    factory_count = int(input())  # the number of factories
+    link_count = int(input())  # the number of links between factories
 
-game = Game()
-game.initialize_game(factory_count, link_count)
-game.create_factories()
+    game = Game()
+    game.initialize_game(factory_count, link_count)
+    game.create_factories()
 
-for i in range(link_count):
-    factory_1, factory_2, distance = [int(j) for j in input().split()]
-    game.add_link(factory_1, factory_2, distance)
+    for i in range(link_count):
+        factory_1, factory_2, distance = [int(j) for j in input().split()]
+        game.add_link(factory_1, factory_2, distance)
 
-game.initialize_factories()
-# game loop
-while True:
-    start_time = time.time()
-    
-    game.reset()
-    
-    list_input = []
-    entity_count = int(input())  # the number of entities (e.g. factories and troops)
-    for i in range(entity_count):
-        entity_id, entity_type, arg_1, arg_2, arg_3, arg_4, arg_5 = input().split()
-        entity_id = int(entity_id)
-        arg_1 = int(arg_1)
-        arg_2 = int(arg_2)
-        arg_3 = int(arg_3)
-        arg_4 = int(arg_4)
-        arg_5 = int(arg_5)
-        
-        list_input.append(Input(entity_type, entity_id, arg_1, arg_2, arg_3, arg_4, arg_5))
-    
-    list_input.sort(key=attrgetter('entity_type'), reverse=True) #Sort them by type (bomb last)    
-    for new_input in list_input:        
-        game.process_input(new_input.entity_id, new_input.entity_type, new_input.arg1, new_input.arg2, new_input.arg3, new_input.arg4, new_input.arg5)
+    game.initialize_factories()
+    game.initialize_routing()
 
-    game.consolidate_inputs()
+    # game loop
+    while True:
+        start_time = time.time()
 
-    game.set_game_mode()
-    
-    simu = game.clone()
+        game.reset()
 
-    MAX_DISTANCE_CONSIDERED = max(game.get_min_distance_in_level(), MAX_DISTANCE_CONSIDERED)
-    NB_SIMU_TURN = MAX_DISTANCE_CONSIDERED + 1
+        entity_count = int(input())  # the number of entities (e.g. factories and troops)
+        Input(entity_count).process(game)
 
-    for i in range(NB_SIMU_TURN):
-        simu.simulate_turn()
+        game.consolidate_inputs()
 
-    simu.set_game_mode()
-    game.solve_turn(simu)
-    
-    elapsed_time = (time.time() - start_time) * 1000.0 # ms
-    print('ELAPSED TIME = ' + str(elapsed_time),file=sys.stderr)
\ No newline at end of file
+        game.set_game_mode()
+
+        simu = game.clone()
+
+        MAX_DISTANCE_CONSIDERED = max(game.get_min_distance_in_level(), MAX_DISTANCE_CONSIDERED)
+        NB_SIMU_TURN = MAX_DISTANCE_CONSIDERED + 1
+
+        for i in range(NB_SIMU_TURN):
+            simu.simulate_turn()
+
+        simu.set_game_mode()
+        game.solve_turn(simu)
+
+        elapsed_time = (time.time() - start_time) * 1000.0 # ms
+        print('ELAPSED TIME = ' + str(elapsed_time),file=sys.stderr)
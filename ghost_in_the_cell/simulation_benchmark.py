@@ -0,0 +1,55 @@
+'''
+Cost of the simulation of the next turns of gold_league.py: objects (Game.simulate_turn) against arrays (array_simulation.ArraySimulation)
+
+The arrays simulate several plans at once, each plan sending random troops from the owned factories.
+The cost by plan is the time of the simulation of all the plans divided by their number.
+
+Usage: python simulation_benchmark.py [--factories 15] [--troops 200] [--turns 4] [--plans 1 16 64 256]
+'''
+
+import sys
+import random
+import argparse
+
+import numpy
+
+from gold_league import FRIEND, NB_SIMU_TURN
+from array_simulation import ArraySimulation
+from clone_benchmark import build_game, time_function
+
+NB_ORDERS = 3  # orders by plan
+
+
+def simulate_objects(game, nb_turns):
+    simu = game.clone()
+    for i in range(nb_turns):
+        simu.simulate_turn()
+
+
+def simulate_arrays(game, nb_turns, orders):
+    simulation = ArraySimulation(game, len(orders[0]))
+    simulation.add_moves(*orders)
+    simulation.simulate(nb_turns)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare the simulation of the next turns with objects and with arrays')
+    parser.add_argument('--factories', type=int, default=15, help='number of factories')
+    parser.add_argument('--troops', type=int, default=200, help='number of troops in flight')
+    parser.add_argument('--turns', type=int, default=NB_SIMU_TURN, help='number of simulated turns')
+    parser.add_argument('--plans', type=int, nargs='+', default=[1, 16, 64, 256], help='numbers of plans simulated together')
+    parser.add_argument('--repeat', type=int, default=50, help='number of measures (the best one is kept)')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    game = build_game(args.factories, args.troops)
+    owned = [factory.f_id for factory in game.factories if factory.owner == FRIEND]
+
+    print('objects: %.1f us' % time_function(lambda: simulate_objects(game, args.turns), args.repeat), file=sys.stderr)
+    for nb_plans in args.plans:
+        origins = numpy.array([[rnd.choice(owned) for i in range(NB_ORDERS)] for plan in range(nb_plans)])
+        destinations = (origins + numpy.array([[rnd.randint(1, args.factories - 1) for i in range(NB_ORDERS)] for plan in range(nb_plans)])) % args.factories
+        numbers = numpy.array([[rnd.randint(1, 10) for i in range(NB_ORDERS)] for plan in range(nb_plans)])
+
+        elapsed_time = time_function(lambda: simulate_arrays(game, args.turns, (origins, destinations, numbers)), args.repeat)
+        print('arrays, %4d plans: %10.1f us, %8.1f us by plan' % (nb_plans, elapsed_time, elapsed_time / nb_plans), file=sys.stderr)
@@ -0,0 +1,76 @@
+import unittest
+from gold_league import Game, Troop, Order, FRIEND, ENNEMY
+from array_simulation import ArraySimulation
+
+FIELDS = ['owner', 'stock', 'production', 'current_production', 'bomb_eta', 'count_zero_prod', 'delta', 'turn_change_owner']
+
+
+class TestArraySimulation(unittest.TestCase):
+    def setUp(self):
+        '''
+        Fact 0 = player, stock 10, prod 2
+        Fact 1 = ennemy, stock 25, prod 3, bombed by the player (ETA = 2)
+        Fact 2 = neutral, stock 4, prod 1, attacked by both players
+        Fact 3 = neutral, stock 0, prod 0
+        '''
+        self.game = Game()
+        self.game.initialize_game(4, 6)
+        self.game.create_factories()
+        for factory_1, factory_2, distance in [(0, 1, 5), (0, 2, 2), (1, 2, 2), (0, 3, 1), (1, 3, 4), (2, 3, 3)]:
+            self.game.add_link(factory_1, factory_2, distance)
+        self.game.initialize_factories()
+        self.game.initialize_routing()
+
+        for factory, owner, stock, production in zip(self.game.factories, [FRIEND, ENNEMY, 0, 0], [10, 25, 4, 0], [2, 3, 1, 0]):
+            factory.set_owner(owner)
+            factory.stock = stock
+            factory.set_production(production, 0)
+
+        factories = self.game.factories
+        troops = [(0, 3, 2, FRIEND, False, 0, 2), (1, 2, 2, ENNEMY, False, 1, 2), (2, 4, 1, FRIEND, False, 0, 2),
+                  (3, 0, 2, FRIEND, True, 0, 1), (4, 6, 3, ENNEMY, False, 1, 3)]
+        for t_id, number, eta, owner, is_bomb, origin_id, destination_id in troops:
+            origin = factories[origin_id]
+            destination = factories[destination_id]
+            troop = Troop(t_id, number, eta, owner, is_bomb, origin.links[destination_id], origin, destination)
+            origin.sent_troops(destination_id, troop)
+            self.game.add_troop(troop)
+        factories[1].set_bomb_eta(2)
+
+    def assert_same_factories(self, simulation, plan, game):
+        for name in FIELDS:
+            self.assertEqual(list(getattr(simulation, name)[plan]), [getattr(factory, name) for factory in game.factories], name)
+
+    def test_simulate_as_game(self):
+        simu = self.game.clone()
+        simulation = ArraySimulation(simu, 2)
+        for i in range(6):
+            simu.simulate_turn()
+            simulation.simulate_turn()
+            self.assert_same_factories(simulation, 0, simu)
+            self.assert_same_factories(simulation, 1, simu)
+
+    def test_simulate_plans(self):
+        simulation = ArraySimulation(self.game.clone(), 2)
+        simulation.add_moves([[0], [0]], [[3], [2]], [[5], [8]])
+        simulation.simulate(4)
+
+        for plan, (destination_id, number) in enumerate([(3, 5), (2, 8)]):
+            simu = self.game.clone()
+            origin = simu.factories[0]
+            origin.orders.append(Order(Order.MOVE, origin, simu.factories[destination_id], number))
+            origin.execute_orders(simu)
+            for i in range(4):
+                simu.simulate_turn()
+
+            self.assert_same_factories(simulation, plan, simu)
+
+        self.assertEqual(simulation.owner[1][2], FRIEND)
+
+    def test_add_increases(self):
+        simulation = ArraySimulation(self.game.clone(), 2)
+        simulation.add_increases([[True, False, False, False], [False, False, False, False]])
+
+        self.assertEqual(list(simulation.production[:, 0]), [3, 2])
+        self.assertEqual(list(simulation.stock[:, 0]), [0, 10])
+        self.assertEqual(list(simulation.current_production[:, 0]), [3, 2])
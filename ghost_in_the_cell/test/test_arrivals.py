@@ -0,0 +1,66 @@
+import unittest
+from gold_league import Game, Troop, FRIEND, ENNEMY
+
+
+class TestArrivals(unittest.TestCase):
+    def setUp(self):
+        '''
+        Fact 0 = player, Fact 1 = ennemy, Fact 2 = neutral
+        Troop 0 from Fact 0 to Fact 2 (ETA = 2), Troop 1 from Fact 1 to Fact 2 (ETA = 1)
+        Bomb 2 from Fact 1 to Fact 0 (ETA = 3)
+        '''
+        self.game = Game()
+        self.game.initialize_game(3, 3)
+        self.game.create_factories()
+        for factory_1, factory_2, distance in [(0, 1, 7), (0, 2, 3), (1, 2, 3)]:
+            self.game.add_link(factory_1, factory_2, distance)
+        self.game.initialize_factories()
+        self.game.initialize_routing()
+
+        self.game.factories[0].set_owner(FRIEND)
+        self.game.factories[1].set_owner(ENNEMY)
+
+        factories = self.game.factories
+        for t_id, number, origin, destination, eta, is_bomb in [(0, 5, factories[0], factories[2], 2, False),
+                                                                (1, 4, factories[1], factories[2], 1, False),
+                                                                (2, 0, factories[1], factories[0], 3, True)]:
+            troop = Troop(t_id, number, eta, origin.owner, is_bomb, origin.links[destination.f_id], origin, destination)
+            origin.sent_troops(destination.f_id, troop)
+            self.game.add_troop(troop)
+
+    def test_troops_by_turn(self):
+        arrivals = self.game.factories[2].arrivals
+        self.assertEqual(arrivals.totals, {FRIEND: 5, ENNEMY: 4})
+
+        arrivals.next_turn()
+        self.assertEqual((arrivals.get_cyborgs(FRIEND), arrivals.get_cyborgs(ENNEMY)), (0, 4))
+        self.assertEqual([self.game.troops[t_id].eta for t_id in (0, 1)], [1, 0])
+
+        arrivals.next_turn()
+        self.assertEqual((arrivals.get_cyborgs(FRIEND), arrivals.get_cyborgs(ENNEMY)), (5, 0))
+        self.assertEqual(arrivals.totals, {FRIEND: 5, ENNEMY: 0})
+
+    def test_set_eta_moves_troop(self):
+        arrivals = self.game.factories[2].arrivals
+        self.game.troops[0].eta = 1
+
+        arrivals.next_turn()
+        self.assertEqual((arrivals.get_cyborgs(FRIEND), arrivals.get_cyborgs(ENNEMY)), (5, 4))
+
+    def test_bomb_eta(self):
+        arrivals = self.game.factories[0].arrivals
+        self.assertEqual(arrivals.get_bomb_eta(), 3)
+
+        for i in range(3):
+            arrivals.next_turn()
+        self.assertEqual(arrivals.get_bomb_eta(), 0)
+
+        arrivals.next_turn()
+        self.assertEqual(arrivals.get_bomb_eta(), -1)
+
+    def test_simulate_turn(self):
+        simu = self.game.clone()
+        simu.simulate_turn()
+
+        self.assertEqual((simu.factories[2].nb_friendly_troops, simu.factories[2].nb_ennemy_troops), (0, 4))
+        self.assertEqual(simu.factories[0].bomb_eta, 2)
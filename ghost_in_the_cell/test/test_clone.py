@@ -0,0 +1,65 @@
+import unittest
+from gold_league import Game, Troop, FRIEND, ENNEMY, NB_SIMU_TURN
+
+
+class TestClone(unittest.TestCase):
+    def setUp(self):
+        '''
+        Fact 0 = player, Fact 1 = ennemy, Fact 2 = neutral
+        Troop 0 from Fact 0 to Fact 2 (ETA = 2), Troop 1 from Fact 1 to Fact 2 (ETA = 1)
+        '''
+        self.game = Game()
+        self.game.initialize_game(3, 3)
+        self.game.create_factories()
+        for factory_1, factory_2, distance in [(0, 1, 7), (0, 2, 3), (1, 2, 3)]:
+            self.game.add_link(factory_1, factory_2, distance)
+        self.game.initialize_factories()
+        self.game.initialize_routing()
+
+        self.game.factories[0].set_owner(FRIEND)
+        self.game.factories[1].set_owner(ENNEMY)
+
+        factories = self.game.factories
+        for t_id, origin, destination, eta in [(0, factories[0], factories[2], 2), (1, factories[1], factories[2], 1)]:
+            troop = Troop(t_id, 5, eta, origin.owner, False, origin.links[destination.f_id], origin, destination)
+            origin.sent_troops(destination.f_id, troop)
+            self.game.add_troop(troop)
+
+    def test_clone_rewires_troops(self):
+        clone = self.game.clone()
+        clone_link = clone.factories[0].links[2]
+
+        self.assertIs(clone_link, clone.links[clone_link.l_id])
+        self.assertIs(clone_link.troops[2][0], clone.troops[0])
+        self.assertIs(clone.troops[0].link, clone_link)
+        self.assertIs(clone.troops[0].origin, clone.factories[0])
+        self.assertIs(clone.troops[0].destination, clone.factories[2])
+        self.assertIsNot(clone.troops[0], self.game.troops[0])
+
+    def test_clone_is_independent(self):
+        clone = self.game.clone()
+        clone.simulate_turn()
+
+        self.assertEqual([troop.eta for troop in clone.troops.values()], [1, 0])
+        self.assertEqual([troop.eta for troop in self.game.troops.values()], [2, 1])
+
+    def test_clone_simulates_as_game(self):
+        for factory, stock, production in zip(self.game.factories, [10, 4, 3], [2, 1, 3]):
+            factory.stock = stock
+            factory.set_production(production, 0)
+
+        clone = self.game.clone()
+        for i in range(NB_SIMU_TURN):
+            clone.simulate_turn()
+            self.game.simulate_turn()
+
+        self.assertEqual(self.get_state(clone), self.get_state(self.game))
+
+    def get_state(self, game):
+        '''
+        Return the fields of the factories and of the troops changed by the simulation
+        '''
+        factories = [(factory.owner, factory.stock, factory.production, factory.bomb_eta, factory.arrivals.turn,
+                      factory.arrivals.totals) for factory in game.factories]
+        troops = [(t_id, troop.eta) for t_id, troop in game.troops.items()]
+        return factories, troops
@@ -0,0 +1,59 @@
+import io
+import unittest
+from gold_league import Game, Input, FRIEND, ENNEMY
+
+ENTITIES = '''0 FACTORY 1 20 2 0 0
+1 FACTORY -1 15 3 0 0
+2 FACTORY 0 4 1 0 0
+8 BOMB 1 0 1 3 0
+5 TROOP 1 0 2 6 2
+6 TROOP -1 1 2 3 2
+'''
+
+
+class TestInput(unittest.TestCase):
+    def setUp(self):
+        '''
+        Fact 0 = player, Fact 1 = ennemy, Fact 2 = neutral
+        Troop 5 from Fact 0 to Fact 2 (ETA = 2), Troop 6 from Fact 1 to Fact 2 (ETA = 2), Bomb 8 from Fact 0 to Fact 1 (ETA = 3)
+        '''
+        self.game = Game()
+        self.game.initialize_game(3, 3)
+        self.game.create_factories()
+        for factory_1, factory_2, distance in [(0, 1, 3), (0, 2, 2), (1, 2, 2)]:
+            self.game.add_link(factory_1, factory_2, distance)
+        self.game.initialize_factories()
+        self.game.initialize_routing()
+
+    def test_read_columns(self):
+        stream = io.StringIO(ENTITIES + '3\n')
+        entities = Input(6, stream)
+
+        self.assertEqual(entities.entity_ids, [0, 1, 2, 8, 5, 6])
+        self.assertEqual(entities.entity_types, ['FACTORY', 'FACTORY', 'FACTORY', 'BOMB', 'TROOP', 'TROOP'])
+        self.assertEqual(entities.args[0], [1, -1, 0, 1, 1, -1])
+        self.assertEqual(stream.readline(), '3\n')
+
+    def test_process_troops_by_id(self):
+        Input(6, io.StringIO(ENTITIES)).process(self.game)
+
+        self.assertEqual(list(self.game.troops), [5, 6, 8])
+        self.assertEqual([self.game.troops[t_id].eta for t_id in (5, 6, 8)], [2, 2, 3])
+        self.assertEqual(self.game.factories_owned, [self.game.factories[0]])
+        self.assertEqual(self.game.factories[1].bomb_eta, 3)
+
+        self.game.reset(2)
+        self.game.process_input(5, 'TROOP', FRIEND, 0, 2, 6, 1)
+        self.game.consolidate_inputs()
+
+        self.assertEqual(list(self.game.troops), [5])
+        self.assertEqual(self.game.factories[2].arrivals.totals, {FRIEND: 6, ENNEMY: 0})
+
+    def test_next_id_troop(self):
+        Input(6, io.StringIO(ENTITIES)).process(self.game)
+        self.assertEqual(self.game.next_id_troop(), 9)
+        self.assertEqual(self.game.next_id_troop(), 10)
+
+        self.game.reset(2)
+        self.game.consolidate_inputs()
+        self.assertEqual(self.game.next_id_troop(), 11)
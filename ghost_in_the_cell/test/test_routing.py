@@ -0,0 +1,67 @@
+import unittest
+from gold_league import Game
+
+
+class TestRouting(unittest.TestCase):
+    def setUp(self):
+        '''
+        Fact 0 - Fact 1 = distance 1
+        Fact 1 - Fact 3 = distance 1
+        Fact 3 - Fact 2 = distance 1
+        Fact 1 - Fact 2 = distance 5
+        Fact 0 - Fact 3 = distance 5
+        Fact 0 - Fact 2 = distance 10
+        '''
+        self.game = Game()
+        self.game.initialize_game(4, 6)
+        self.game.create_factories()
+
+        for factory_1, factory_2, distance in [(0, 1, 1), (1, 3, 1), (3, 2, 1), (1, 2, 5), (0, 3, 5), (0, 2, 10)]:
+            self.game.add_link(factory_1, factory_2, distance)
+
+        self.game.initialize_routing()
+
+    def test_multi_hop_route(self):
+        routing = self.game.routing
+        self.assertEqual(routing.next_hops[0][2], 1)
+        self.assertEqual(routing.next_hops[1][2], 3)
+        self.assertEqual(routing.hops[0][2], 3)
+        self.assertEqual(routing.times[0][2], 5)
+
+    def test_direct_route(self):
+        routing = self.game.routing
+        self.assertEqual(routing.next_hops[0][1], 1)
+        self.assertEqual(routing.hops[0][1], 1)
+        self.assertEqual(routing.times[0][1], 1)
+        self.assertEqual(routing.times[0][0], 0)
+
+    def test_relay_faster_than_link(self):
+        # 0 -> 1 -> 3 takes 1 + 1 + 1 turns, the direct link 5 turns
+        routing = self.game.routing
+        self.assertEqual(routing.next_hops[0][3], 1)
+        self.assertEqual(routing.times[0][3], 3)
+
+    def test_relay_at_equal_time(self):
+        # 0 -> 1 -> 2 takes 1 + 1 + 1 turns, as the direct link of distance 3
+        game = Game()
+        game.initialize_game(3, 3)
+        game.create_factories()
+        for factory_1, factory_2, distance in [(0, 1, 1), (1, 2, 1), (0, 2, 3)]:
+            game.add_link(factory_1, factory_2, distance)
+        game.initialize_routing()
+
+        routing = game.routing
+        self.assertEqual(routing.times[0][2], 3)
+        self.assertEqual(routing.next_hops[0][2], 1)
+        self.assertEqual(routing.hops[0][2], 2)
+
+    def test_routes_never_slower_than_links(self):
+        for link in self.game.links:
+            f_id_1, f_id_2 = link.destination.keys()
+            self.assertLessEqual(self.game.routing.times[f_id_1][f_id_2], link.distance)
+            self.assertLessEqual(self.game.routing.times[f_id_2][f_id_1], link.distance)
+
+    def test_get_intermediate(self):
+        factories = self.game.factories
+        self.assertIs(factories[0].get_intermediate(factories[2], self.game.routing), factories[1])
+        self.assertIs(factories[0].get_intermediate(factories[1], self.game.routing), factories[1])